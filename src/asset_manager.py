@@ -0,0 +1,345 @@
+"""Gestionnaire central des images du jeu : noms logiques, chargement paresseux, partage et éviction.
+
+Chaque image est demandée par un nom logique ("platform/normal", "menu/logo"...),
+résolu en fichier par ASSET_FILES, ou directement par son chemin (skins). Elle
+n'est décodée qu'à la première demande, puis partagée par tous les objets qui
+la demandent. Les versions dérivées (redimensionnées, découpées...) sont gardées
+de la même façon, sous une clé qui décrit leur construction.
+
+Chaque scène (menu, mode de jeu) référence les images qu'elle utilise entre
+begin_scene() et end_scene(). Une image référencée par une scène en cours reste
+en cache. Les autres sont rangées par date de dernière utilisation, et les plus
+anciennes sont oubliées dès que le total dépasse ASSET_BUDGET_MB. Revenir au
+menu après une partie retrouve donc ses images sans les décoder à nouveau, tant
+qu'elles tiennent dans le budget.
+
+Les images redimensionnées par scaled() sont aussi gardées sur le disque
+(DiskCache, ASSET_CACHE_DIR) à leur taille finale, en pixels bruts : au
+lancement suivant, elles sont relues telles quelles, sans décodage ni
+rééchantillonnage. python bake_assets.py remplit ce cache à l'avance.
+
+Les surfaces renvoyées sont partagées : ne pas dessiner dessus ni changer leur
+transparence sans en faire une copie.
+"""
+import hashlib
+import os
+import struct
+from collections import OrderedDict
+from contextlib import contextmanager
+import pygame
+from PIL import Image
+from config import ASSETS_DIR, ASSET_BUDGET_MB, ASSET_CACHE_DIR, ASSET_DISK_CACHE
+from utils import load_image, prepare_surface, scale_image
+
+# Nom logique -> fichier, relatif à ASSETS_DIR
+ASSET_FILES = {
+    # Menu principal
+    "menu/logo": "Main menu/Logo/Main Logo.png",
+    "menu/logo2": "Main menu/Logo/Main_ Logo_secondframe.png",
+    "menu/button": "Main menu/Buttons/Button_basic.png",
+    "menu/button_pushed": "Main menu/Buttons/Button_pushed.png",
+    "menu/sound_on": "Main menu/Buttons/sound_logo.png",
+    "menu/sound_off": "Main menu/Buttons/nosound_logo.png",
+    "menu/lock": "Main menu/Buttons/lock_sprites.png",
+    "menu/price": "Main menu/Buttons/20coin_display.png",
+    "menu/cadre": "sprites/frog/cadre/cadre_skins.png",
+    "menu/cadre_pushed": "sprites/frog/cadre/cadre_skins_pushed.png",
+    # Fonds
+    "background/cloud1": "backgrounds/bg_1.png",
+    "background/cloud2": "backgrounds/bg_2.png",
+    "background/cloud3": "backgrounds/bg_3.png",
+    "background/cloud4": "backgrounds/bg_4.png",
+    "background/lava": "backgrounds/Lava_background/background_lava_mode.jpg",
+    "background/fireball": "backgrounds/Lava_background/IdleLoop-Sheet.png",
+    **{f"background/lava_flow{i}": f"backgrounds/Lava_background/lava_animation{i}.png" for i in range(5)},
+    "background/ice": "backgrounds/Ice_background/ice_background.jpg",
+    # Plateformes et pièces
+    "platform/normal": "sprites/platforms/normal_platform.png",
+    "platform/moving": "sprites/platforms/sliding_platform.png",
+    "platform/breakable": "sprites/platforms/breakable_platform.png",
+    "platform/ice": "sprites/platforms/ice_platform.png",
+    **{f"coin/{i}": f"sprites/coins/coin{i}.png" for i in range(5)},
+    # Grenouille par défaut (les skins sont chargés par leur chemin)
+    **{f"frog/idle{i}": f"sprites/frog/Idle frog/frog_idle{i}.png" for i in range(4)},
+    "frog/charge": "sprites/frog/Frog actions/frog_charge.png",
+    "frog/jump": "sprites/frog/Frog actions/frog_jump.png",
+    "frog/sliding": "sprites/frog/Frog actions/frog_sliding.png",
+}
+
+
+def asset_size(value):
+    """Estimer la mémoire occupée par une surface, ou une suite de surfaces, en octets."""
+    if isinstance(value, pygame.Surface):
+        return value.get_width() * value.get_height() * value.get_bytesize()
+    if isinstance(value, (tuple, list)):
+        return sum(asset_size(item) for item in value)
+    return 0
+
+
+class DiskCache:
+    """Images redimensionnées gardées sur le disque, un fichier par (contenu source, taille, filtre)."""
+
+    # Version du format, longueur des pixels, largeur, hauteur, couleur clé
+    HEADER = struct.Struct("<4sBHH3B")
+    MAGIC = b"CJB1"
+    # Chemin de blit choisi par prepare_surface, rejoué au chargement
+    OPAQUE, COLORKEY, ALPHA = range(3)
+
+    def __init__(self, directory=ASSET_CACHE_DIR):
+        self.directory = directory
+        self.source_hashes = {}
+        self.hits = 0
+        self.writes = 0
+
+    def source_hash(self, path):
+        """Empreinte du contenu du fichier source, calculée une fois par lancement."""
+        digest = self.source_hashes.get(path)
+        if digest is None:
+            with open(path, "rb") as file:
+                digest = self.source_hashes[path] = hashlib.sha1(file.read()).hexdigest()[:20]
+        return digest
+
+    def file_for(self, path, size, resample):
+        return os.path.join(self.directory, f"{self.source_hash(path)}-{size[0]}x{size[1]}-{resample or 'scale'}.raw")
+
+    def load(self, path, size, resample):
+        """Renvoyer l'image au format de l'écran si elle est sur le disque, sinon None."""
+        target = self.file_for(path, size, resample)
+        try:
+            with open(target, "rb") as file:
+                data = file.read()
+        except OSError:
+            return None
+        if len(data) < self.HEADER.size:
+            return self.discard(target)
+        magic, mode, width, height, *key = self.HEADER.unpack_from(data)
+        bytes_per_pixel = 4 if mode == self.ALPHA else 3
+        if (magic != self.MAGIC or mode > self.ALPHA or (width, height) != size
+                or len(data) - self.HEADER.size != width * height * bytes_per_pixel):
+            # Fichier tronqué ou d'un autre format : le supprimer, l'image sera refaite puis réécrite
+            return self.discard(target)
+
+        # Les pixels sont utilisés sans copie, puis convertis au format de l'écran
+        pixels = memoryview(data)[self.HEADER.size:]
+        surface = pygame.image.frombuffer(pixels, size, "RGBA" if mode == self.ALPHA else "RGB")
+        if mode == self.ALPHA:
+            converted = surface.convert_alpha()
+        else:
+            converted = surface.convert()
+            if mode == self.COLORKEY:
+                converted.set_colorkey(tuple(key), pygame.RLEACCEL)
+        self.hits += 1
+        return converted
+
+    def discard(self, target):
+        """Supprimer un fichier de cache illisible ; renvoie None comme un cache manquant."""
+        print(f"Log: discarding invalid asset cache file {target}")
+        try:
+            os.remove(target)
+        except OSError:
+            pass
+        return None
+
+    def store(self, path, size, resample, surface):
+        """Écrire une image préparée par prepare_surface (une erreur d'écriture n'est pas bloquante)."""
+        colorkey = surface.get_colorkey()
+        if colorkey is not None:
+            mode, key = self.COLORKEY, colorkey[:3]
+        elif surface.get_flags() & pygame.SRCALPHA:
+            mode, key = self.ALPHA, (0, 0, 0)
+        else:
+            mode, key = self.OPAQUE, (0, 0, 0)
+        pixels = pygame.image.tobytes(surface, "RGBA" if mode == self.ALPHA else "RGB")
+
+        target = self.file_for(path, size, resample)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Écrire à côté puis renommer : un fichier interrompu n'est jamais relu
+            with open(target + ".tmp", "wb") as file:
+                file.write(self.HEADER.pack(self.MAGIC, mode, size[0], size[1], *key))
+                file.write(pixels)
+            os.replace(target + ".tmp", target)
+            self.writes += 1
+        except OSError as e:
+            print(f"Log: could not write asset cache file {target}: {e}")
+
+    def clear(self):
+        """Supprimer tous les fichiers du cache."""
+        if not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            if name.endswith((".raw", ".tmp")):
+                os.remove(os.path.join(self.directory, name))
+
+
+class AssetEntry:
+    """Valeur en cache, sa taille et les scènes qui la référencent."""
+
+    __slots__ = ("value", "size", "scenes")
+
+    def __init__(self, value):
+        self.value = value
+        self.size = asset_size(value)
+        self.scenes = set()
+
+
+class AssetManager:
+    """Cache unique des images décodées et dérivées, partagé par tout le jeu."""
+
+    def __init__(self, budget=ASSET_BUDGET_MB * 1024 * 1024, files=ASSET_FILES, disk=None):
+        """
+        Args:
+            budget (int): Octets au-delà desquels les images non référencées les plus anciennes sont oubliées
+            files (dict): Nom logique -> fichier relatif à ASSETS_DIR
+            disk (DiskCache): Cache disque des images redimensionnées (None = aucun)
+        """
+        self.budget = budget
+        self.files = files
+        self.disk = disk
+        self.entries = OrderedDict()  # Clé -> AssetEntry, de la moins récemment utilisée à la plus récente
+        self.scenes = {}  # Scène en cours -> clés qu'elle référence
+        self.current_scene = None
+        self.image_sizes = {}
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def resolve(self, name):
+        """Renvoyer le fichier d'un nom logique (un chemin est renvoyé tel quel)."""
+        relative = self.files.get(name)
+        if relative is None:
+            return name
+        return os.path.join(ASSETS_DIR, *relative.split("/"))
+
+    def get_or_create(self, key, factory):
+        """
+        Renvoyer la valeur gardée sous key, construite une seule fois avec factory().
+
+        Args:
+            key (tuple): Clé décrivant l'image dérivée, par exemple ("coin_frames", 30, 30)
+            factory (callable): Appelé sans argument pour construire la valeur si elle n'est pas en cache
+        """
+        entry = self.entries.get(key)
+        created = entry is None
+        if created:
+            self.misses += 1
+            entry = AssetEntry(factory())
+            self.entries[key] = entry
+            self.bytes += entry.size
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+
+        scene = self.current_scene
+        if scene is not None and scene not in entry.scenes:
+            entry.scenes.add(scene)
+            self.scenes[scene].add(key)
+        if created:
+            # Seule une insertion fait grossir le cache (end_scene rend aussi des images évictables),
+            # après la référence de la scène pour ne pas évincer l'image qu'on vient de construire
+            self.trim()
+        return entry.value
+
+    def load(self, name):
+        """Renvoyer l'image décodée au format de l'écran, lue sur le disque une seule fois."""
+        path = self.resolve(name)
+        return self.get_or_create(("file", path), lambda: load_image(path))
+
+    def scaled(self, name, size, resample=None):
+        """
+        Renvoyer l'image redimensionnée à size, construite une seule fois.
+
+        Args:
+            name (str): Nom logique ou chemin de l'image
+            size (tuple): Taille voulue (largeur, hauteur)
+            resample (str): None = pygame.transform.scale sur l'image décodée ;
+                "nearest" ou "lanczos" = rééchantillonnage PIL depuis le fichier
+        """
+        path = self.resolve(name)
+        size = (int(size[0]), int(size[1]))
+        return self.get_or_create(("scaled", path, size, resample), lambda: self.build_scaled(path, size, resample))
+
+    def build_scaled(self, path, size, resample):
+        """Relire l'image redimensionnée sur le disque, sinon la construire puis l'y écrire."""
+        if self.disk:
+            surface = self.disk.load(path, size, resample)
+            if surface is not None:
+                return surface
+        if resample is None:
+            surface = prepare_surface(pygame.transform.scale(self.load(path), size))
+        else:
+            surface = scale_image(path, size, resample == "nearest")
+        if self.disk:
+            self.disk.store(path, size, resample, surface)
+        return surface
+
+    def image_size(self, name):
+        """Renvoyer la taille d'origine d'une image sans la décoder (en-tête du fichier, lu une fois)."""
+        path = self.resolve(name)
+        size = self.image_sizes.get(path)
+        if size is None:
+            with Image.open(path) as image:
+                size = self.image_sizes[path] = image.size
+        return size
+
+    def trim(self):
+        """Oublier les images non référencées les moins récemment utilisées jusqu'à repasser sous le budget."""
+        if self.bytes <= self.budget:
+            return
+        for key in list(self.entries):
+            entry = self.entries[key]
+            if entry.scenes:
+                continue
+            del self.entries[key]
+            self.bytes -= entry.size
+            self.evictions += 1
+            if self.bytes <= self.budget:
+                break
+
+    def begin_scene(self, scene):
+        """Faire référencer par scene toutes les images demandées jusqu'à end_scene()."""
+        self.current_scene = scene
+        self.scenes.setdefault(scene, set())
+
+    def end_scene(self, scene):
+        """Retirer les références de scene : ses images deviennent évictables."""
+        for key in self.scenes.pop(scene, ()):
+            entry = self.entries.get(key)
+            if entry is not None:
+                entry.scenes.discard(scene)
+        if self.current_scene == scene:
+            self.current_scene = None
+        self.trim()
+
+    @contextmanager
+    def scene(self, scene):
+        """Contexte begin_scene() / end_scene()."""
+        self.begin_scene(scene)
+        try:
+            yield
+        finally:
+            self.end_scene(scene)
+
+    def clear(self):
+        """Oublier toutes les images (par exemple après un changement de mode d'affichage)."""
+        self.entries.clear()
+        self.bytes = 0
+
+    def get_stats(self):
+        """Renvoyer les compteurs du cache et la mémoire occupée."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "referenced": sum(1 for entry in self.entries.values() if entry.scenes),
+            "bytes": self.bytes,
+            "budget": self.budget,
+            "disk_hits": self.disk.hits if self.disk else 0,
+            "disk_writes": self.disk.writes if self.disk else 0
+        }
+
+
+# Instance unique
+asset_manager = AssetManager(disk=DiskCache() if ASSET_DISK_CACHE else None)
@@ -1,11 +1,21 @@
 import pygame
 import os
-from config import AUDIO_DIR
+from config import AUDIO_DIR, HEADLESS
 
 class AudioManager:
     def __init__(self):
-        # Initialize pygame mixer
-        pygame.mixer.init()
+        # Current playing track
+        self.current_track = None
+        self.loaded_sounds = {}
+        
+        # Initialize pygame mixer (no audio at all in headless mode or without a sound device)
+        self.enabled = not HEADLESS
+        if self.enabled:
+            try:
+                pygame.mixer.init()
+            except pygame.error as e:
+                print(f"Audio disabled: {e}")
+                self.enabled = False
         
         # Update paths to include the 'theme' subdirectory
         # Music tracks for different game modes
@@ -21,20 +31,20 @@ class AudioManager:
             "coin": os.path.join(AUDIO_DIR, "sound_effect", "coin-recieved-230517.mp3")
         }
         
+        # Volume settings
+        self.music_volume = 0.5  # 50% volume by default
+        self.sound_effect_volume = 0.7  # 70% volume for sound effects
+        
+        if not self.enabled:
+            return
+        
         # Load sound effects
-        self.loaded_sounds = {}
         for sound_name, sound_path in self.sound_effects.items():
             try:
                 self.loaded_sounds[sound_name] = pygame.mixer.Sound(sound_path)
             except pygame.error as e:
                 print(f"Error loading sound effect {sound_name}: {e}")
         
-        # Current playing track
-        self.current_track = None
-        
-        # Volume settings
-        self.music_volume = 0.5  # 50% volume by default
-        self.sound_effect_volume = 0.7  # 70% volume for sound effects
         pygame.mixer.music.set_volume(self.music_volume)
         
         # Set volume for all loaded sound effects
@@ -49,7 +59,7 @@ class AudioManager:
             mode (str): One of "menu", "normal", "lava", or "ice"
         """
         # Don't restart the same track
-        if self.current_track == mode:
+        if not self.enabled or self.current_track == mode:
             return
             
         # Get the track path
@@ -81,6 +91,8 @@ class AudioManager:
         Args:
             sound_name (str): Name of the sound effect to play
         """
+        if not self.enabled:
+            return
         if sound_name in self.loaded_sounds:
             self.loaded_sounds[sound_name].play()
         else:
@@ -88,7 +100,8 @@ class AudioManager:
     
     def stop_music(self):
         """Stop the currently playing music."""
-        pygame.mixer.music.stop()
+        if self.enabled:
+            pygame.mixer.music.stop()
         self.current_track = None
     
     def set_volume(self, volume):
@@ -100,6 +113,8 @@ class AudioManager:
         """
         # Ensure volume is within range
         self.music_volume = max(0.0, min(1.0, volume))
+        if not self.enabled:
+            return
         pygame.mixer.music.set_volume(self.music_volume)
         
         # Also update sound effect volume if music is muted
@@ -112,11 +127,13 @@ class AudioManager:
     
     def pause_music(self):
         """Pause the currently playing music."""
-        pygame.mixer.music.pause()
+        if self.enabled:
+            pygame.mixer.music.pause()
     
     def unpause_music(self):
         """Unpause the music."""
-        pygame.mixer.music.unpause()
+        if self.enabled:
+            pygame.mixer.music.unpause()
 
 # Create a singleton instance
 audio_manager = AudioManager() 
\ No newline at end of file
@@ -1,11 +1,12 @@
 import math
-import os
-from PIL import Image
 
-from config import SCREEN_WIDTH, SCREEN_HEIGHT, BG_ASSETS_DIR
-from utils import scale_image
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, PHYSICS_DT
+from asset_manager import asset_manager
 from background_manager import BackgroundBase
 
+# Vitesse d'ondulation des couches animées, en radians par seconde
+LAYER_WAVE_SPEED = 1.2
+
 class Background(BackgroundBase):
     """Gère le fond avec défilement parallaxe à plusieurs couches."""
     
@@ -16,8 +17,8 @@ class Background(BackgroundBase):
         # Charger les couches du fond
         self.layers = []
 
-        # Définir les fichiers image dans l'ordre (arrière-plan à premier plan)
-        image_files = ["bg_1.png", "bg_2.png", "bg_3.png", "bg_4.png"]
+        # Définir les images dans l'ordre (arrière-plan à premier plan)
+        image_names = ["background/cloud1", "background/cloud2", "background/cloud3", "background/cloud4"]
 
         # Définir les paramètres personnalisés pour chaque couche
         layer_params = [
@@ -31,12 +32,10 @@ class Background(BackgroundBase):
             # Nuages détaillés, plus à gauche
         ]
 
-        for i, (filename, params) in enumerate(zip(image_files, layer_params)):
-            image_path = os.path.join(BG_ASSETS_DIR, filename)
+        for i, (name, params) in enumerate(zip(image_names, layer_params)):
             try:
-                # Obtenir les dimensions originales de l'image
-                with Image.open(image_path) as img:
-                    orig_width, orig_height = img.size
+                # Obtenir les dimensions originales de l'image (en-tête du fichier seulement)
+                orig_width, orig_height = asset_manager.image_size(name)
 
                 if i == 0:  # Pour bg_1.png
                     # Échelle à la hauteur d'écran complète
@@ -50,8 +49,9 @@ class Background(BackgroundBase):
                 new_width = int(orig_width * scale_factor)
                 new_height = int(orig_height * scale_factor)
 
-                # Redimensionner l'image avec l'algorithme approprié
-                scaled_image = scale_image(image_path, (new_width, new_height), params['is_pixel_art'])
+                # Redimensionner l'image avec l'algorithme approprié (une seule fois, partagée ensuite)
+                scaled_image = asset_manager.scaled(name, (new_width, new_height),
+                                                    "nearest" if params['is_pixel_art'] else "lanczos")
 
                 # Calculer la position avec décalage depuis le centre
                 center_x = (SCREEN_WIDTH - new_width) // 2
@@ -70,16 +70,28 @@ class Background(BackgroundBase):
                     'base_y': params['y_offset']  # Stocker la position y de base
                 })
             except Exception as e:
-                print(f"Impossible de charger l'image {image_path}: {e}")
+                print(f"Impossible de charger l'image {name}: {e}")
 
-    def update(self):
+    def update(self, dt=PHYSICS_DT):
         """Mettre à jour la position de chaque couche pour l'effet animé."""
         for layer in self.layers:
             if layer['speed'] > 0:  # Ne déplacer que les couches avec vitesse > 0
-                layer['time'] += 0.02
+                layer['time'] += LAYER_WAVE_SPEED * dt
                 layer['y'] = layer['base_y'] + math.sin(layer['time']) * layer['amplitude']
 
-    def draw(self, screen):
-        """Dessiner toutes les couches de fond à l'écran."""
+    def get_dirty_rects(self):
+        """Renvoyer la zone de chaque couche animée."""
+        return [layer['image'].get_rect(topleft=(layer['x'], layer['y']))
+                for layer in self.layers if layer['speed'] > 0]
+
+    def draw_static(self, surface):
+        """Dessiner les couches immobiles (vitesse nulle) dans la composition statique."""
+        for layer in self.layers:
+            if layer['speed'] == 0:
+                surface.blit(layer['image'], (layer['x'], layer['y']))
+
+    def draw_dynamic(self, screen, culler=None):
+        """Dessiner les couches animées à l'écran."""
         for layer in self.layers:
-            screen.blit(layer['image'], (layer['x'], layer['y'])) 
\ No newline at end of file
+            if layer['speed'] > 0:
+                screen.blit(layer['image'], (layer['x'], layer['y']))
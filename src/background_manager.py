@@ -1,6 +1,7 @@
 import pygame
 import os
-from config import SCREEN_WIDTH, SCREEN_HEIGHT, ASSETS_DIR, BG_ASSETS_DIR
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, PHYSICS_DT
+from asset_manager import asset_manager
 
 class BackgroundBase:
     """Classe de base pour tous les fonds du jeu."""
@@ -9,12 +10,11 @@ class BackgroundBase:
         """Initialiser les propriétés communes."""
         self.bg_x = 0
         self.bg_y = 0
+        # Couches statiques précomposées dans une seule surface opaque
+        self.static_layer = None
     
-    def scale_background(self, image, maintain_aspect_ratio=True):
-        """Redimensionner une image de fond pour couvrir l'écran."""
-        if not image:
-            return None
-            
+    def get_background_size(self, image, maintain_aspect_ratio=True):
+        """Calculer la taille d'une image de fond redimensionnée pour couvrir l'écran, et sa position centrée."""
         # Récupérer les dimensions originales
         bg_orig_width = image.get_width()
         bg_orig_height = image.get_height()
@@ -33,14 +33,11 @@ class BackgroundBase:
             new_width = SCREEN_WIDTH
             new_height = SCREEN_HEIGHT
         
-        # Redimensionner l'image
-        scaled_image = pygame.transform.scale(image, (new_width, new_height))
-        
         # Calculer les positions pour centrer
         self.bg_x = (SCREEN_WIDTH - new_width) // 2
         self.bg_y = (SCREEN_HEIGHT - new_height) // 2
         
-        return scaled_image
+        return new_width, new_height
     
     def create_fallback_background(self, color=(0, 0, 0)):
         """Créer un fond uni de secours si l'image ne peut pas être chargée."""
@@ -50,14 +47,12 @@ class BackgroundBase:
         self.bg_y = 0
         return background
     
-    def load_image(self, path, convert_alpha=False):
-        """Charger une image avec gestion d'erreur."""
+    def load_image(self, name):
+        """Charger une image (nom logique ou chemin) au format de l'écran avec gestion d'erreur."""
+        path = asset_manager.resolve(name)
         try:
             if os.path.exists(path):
-                if convert_alpha:
-                    return pygame.image.load(path).convert_alpha()
-                else:
-                    return pygame.image.load(path).convert()
+                return asset_manager.load(path)
             else:
                 print(f"Erreur: Fichier introuvable: {path}")
                 return None
@@ -65,10 +60,49 @@ class BackgroundBase:
             print(f"Erreur lors du chargement de l'image {path}: {e}")
             return None
     
-    def update(self):
+    def load_background(self, name, fallback_color=(0, 0, 0), maintain_aspect_ratio=True):
+        """Renvoyer l'image de fond redimensionnée pour couvrir l'écran, partagée par le gestionnaire d'images."""
+        image = self.load_image(name)
+        if not image:
+            return self.create_fallback_background(fallback_color)
+        size = self.get_background_size(image, maintain_aspect_ratio)
+        return asset_manager.scaled(name, size)
+    
+    def get_static_layer(self):
+        """Renvoyer la composition des couches statiques, construite une seule fois au format de l'écran."""
+        if self.static_layer is None:
+            layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+            layer.fill((0, 0, 0))
+            self.draw_static(layer)
+            self.static_layer = layer
+        return self.static_layer
+    
+    def invalidate_static_layer(self):
+        """Forcer la reconstruction des couches statiques (à appeler si l'une d'elles change)."""
+        self.static_layer = None
+    
+    def update(self, dt=PHYSICS_DT):
         """Méthode à implémenter dans les classes dérivées."""
         pass
     
-    def draw(self, screen):
-        """Méthode à implémenter dans les classes dérivées."""
-        pass 
\ No newline at end of file
+    def draw_static(self, surface):
+        """Dessiner les couches qui ne bougent jamais. Méthode à implémenter dans les classes dérivées."""
+        pass
+    
+    def draw_dynamic(self, screen, culler=None):
+        """Dessiner les couches animées par-dessus la composition statique. Méthode à implémenter dans les classes dérivées."""
+        pass
+    
+    def get_dirty_rects(self):
+        """Renvoyer les zones de l'écran modifiées par les couches animées à cette frame."""
+        return []
+    
+    def draw(self, screen, culler=None):
+        """
+        Dessiner la composition statique en un seul blit opaque, puis les couches animées.
+        
+        Args:
+            culler (ViewportCuller): Étape de tri des effets hors de l'écran (None = tout dessiner)
+        """
+        screen.blit(self.get_static_layer(), (0, 0))
+        self.draw_dynamic(screen, culler)
@@ -0,0 +1,49 @@
+"""Remplir à l'avance le cache disque des images redimensionnées (voir asset_manager.DiskCache).
+
+Construit une fois, sans fenêtre, le menu, chaque mode de jeu et chaque skin,
+ce qui écrit toutes leurs images à leur taille finale dans ASSET_CACHE_DIR :
+
+    python bake_assets.py
+    python bake_assets.py --clear  # supprimer d'abord les fichiers existants
+"""
+import os
+
+# Doit être défini avant le premier import de config (qui appelle pygame.init())
+os.environ.setdefault("CLOUD_JUMP_HEADLESS", "1")
+
+import argparse
+from config import ASSET_CACHE_DIR
+from asset_manager import asset_manager, DiskCache
+from headless import GAME_MODES, DEFAULT_SKIN
+from main_menu import MainMenu
+from player import Player
+
+
+def bake():
+    """Construire chaque scène une fois pour que toutes ses images passent par le cache disque."""
+    menu = MainMenu()
+    for game_class in GAME_MODES.values():
+        game = game_class(player_skin_path=DEFAULT_SKIN, seed=0)
+        game.generator.close()
+    for skin_path in menu.skin_image_paths:
+        Player(skin_path=skin_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Écrire les images redimensionnées dans le cache disque.")
+    parser.add_argument("--clear", action="store_true", help="Supprimer d'abord les fichiers existants")
+    args = parser.parse_args()
+
+    # Le cache disque peut être désactivé en jeu (ASSET_DISK_CACHE) : le bake l'utilise quand même
+    if asset_manager.disk is None:
+        asset_manager.disk = DiskCache()
+    if args.clear:
+        asset_manager.disk.clear()
+    bake()
+
+    stats = asset_manager.get_stats()
+    print(f"Log: {stats['disk_writes']} images written, {stats['disk_hits']} already baked, in {ASSET_CACHE_DIR}")
+
+
+if __name__ == "__main__":
+    main()
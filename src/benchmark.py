@@ -0,0 +1,239 @@
+"""Benchmarks de temps de frame par scénario, pour les trois modes de jeu.
+
+Chaque scénario est une session scriptée et seedée, jouée sans fenêtre:
+
+    python benchmark.py run --frames 600 --output before.json
+    python benchmark.py compare before.json after.json
+"""
+import os
+
+# Doit être défini avant le premier import de config (qui appelle pygame.init())
+os.environ.setdefault("CLOUD_JUMP_HEADLESS", "1")
+
+import argparse
+import json
+import platform
+import sys
+import tracemalloc
+import pygame
+from config import PHYSICS_DT, SCREEN_WIDTH, SCREEN_HEIGHT, MAX_CHARGE
+from headless import GAME_MODES, DEFAULT_SKIN, JumpBot
+from replay import mouse_down, mouse_up
+from profiler import FrameProfiler, percentile
+from asset_manager import asset_manager
+
+try:
+    import resource  # Indisponible sous Windows
+except ImportError:
+    resource = None
+
+
+class MaxChargeJumps:
+    """Source d'entrées qui enchaîne des sauts à charge maximale, alternativement à gauche et à droite."""
+
+    def __init__(self):
+        self.direction = 1
+
+    def get_events(self, game, frame):
+        player = game.player
+        if player.charging:
+            if player.charge >= MAX_CHARGE:
+                self.direction = -self.direction
+                return (mouse_up(player.x + player.size // 2 + self.direction * SCREEN_WIDTH),)
+            return ()
+        if player.on_ground and not player.jumping:
+            return (mouse_down(),)
+        return ()
+
+
+def setup_climb(game):
+    """Démarrer directement à un score élevé pour jouer à forte difficulté."""
+    game.start_score = game.score = 500
+    game.difficulty = 1.0 + game.score / 500
+    # Regénérer le niveau à la difficulté de ce score
+    game.generate_platforms()
+
+
+def setup_game_over(game):
+    """Faire tomber le joueur pour mesurer l'écran de game over."""
+    game.player.y = SCREEN_HEIGHT + 1
+
+
+# input: fabrique de la source d'entrées, restart: relancer la partie après un game over
+SCENARIOS = {
+    "idle": {"input": None, "setup": None, "restart": True},
+    "max_charge": {"input": MaxChargeJumps, "setup": None, "restart": True},
+    "climb": {"input": JumpBot, "setup": setup_climb, "restart": True},
+    "game_over": {"input": None, "setup": setup_game_over, "restart": False}
+}
+
+
+def summarize(values):
+    """Distribution d'une série de durées, convertie en millisecondes."""
+    values = sorted(values)
+    if not values:
+        return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    return {
+        "mean": sum(values) / len(values) * 1000,
+        "p50": percentile(values, 0.50) * 1000,
+        "p95": percentile(values, 0.95) * 1000,
+        "p99": percentile(values, 0.99) * 1000,
+        "max": values[-1] * 1000
+    }
+
+
+def play_scenario(mode, scenario, frames, seed, profiler=None):
+    """Jouer un scénario pendant frames pas, comme GameBase.run mais sans attente ni limite de framerate."""
+    game = GAME_MODES[mode](player_skin_path=DEFAULT_SKIN, seed=seed)
+    settings = SCENARIOS[scenario]
+    if settings["setup"]:
+        settings["setup"](game)
+    input_source = settings["input"]() if settings["input"] else None
+    if profiler is not None:
+        game.profiler = profiler
+
+    restarts = 0
+    # Même choix du rendu complet que GameBase.run : la caméra a-t-elle bougé depuis la frame dessinée ?
+    drawn_camera_y = None
+    for frame in range(frames):
+        game.profiler.begin_frame()
+        if input_source:
+            for event in input_source.get_events(game, frame):
+                game.handle_event(event)
+        if game.game_over and settings["restart"]:
+            game.reset()
+            if settings["setup"]:
+                settings["setup"](game)
+            restarts += 1
+        game.profiler.lap("events")
+
+        game.snapshot_positions()
+        game.profiler.lap("snapshot")
+        game.update(PHYSICS_DT)
+
+        if game.game_over:
+            game.renderer.invalidate()
+        scrolling = game.camera.y != drawn_camera_y
+        drawn_camera_y = game.camera.y
+        game.renderer.render(game.draw_frame, game.get_dirty_rects(), scrolling=scrolling)
+        game.profiler.lap("present")
+        game.profiler.end_frame()
+    return game, restarts
+
+
+def run_benchmark(mode, scenario, frames, seed):
+    """Mesurer un scénario : temps par étape, puis allocations lors d'une seconde passe identique."""
+    profiler = FrameProfiler(history=frames, budget=None)
+    game, restarts = play_scenario(mode, scenario, frames, seed, profiler)
+
+    # tracemalloc ralentit beaucoup l'exécution : les allocations sont mesurées à part
+    tracemalloc.start()
+    play_scenario(mode, scenario, frames, seed)
+    allocated, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "frames": frames,
+        "restarts": restarts,
+        "final_score": game.score,
+        "frame_ms": summarize(profiler.frame_times),
+        "stages_ms": {stage: summarize(times) for stage, times in sorted(profiler.stage_times.items())},
+        "pool": game.pool.get_stats(),
+        "culling": game.culler.get_stats(),
+        "generation": game.generator.get_stats(),
+        "assets": asset_manager.get_stats(),
+        "alloc_current_bytes": allocated,
+        "alloc_peak_bytes": peak,
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None
+    }
+
+
+def run_command(args):
+    results = {}
+    for mode in args.modes:
+        for scenario in args.scenarios:
+            key = f"{mode}/{scenario}"
+            results[key] = run_benchmark(mode, scenario, args.frames, args.seed)
+            frame_ms = results[key]["frame_ms"]
+            print(f"{key}: p50 {frame_ms['p50']:.3f} ms, p95 {frame_ms['p95']:.3f} ms, p99 {frame_ms['p99']:.3f} ms",
+                  file=sys.stderr)
+
+    report = {
+        "meta": {
+            "frames": args.frames,
+            "seed": args.seed,
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform()
+        },
+        "results": results
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output)
+    else:
+        print(output)
+
+
+def percent_change(before, after):
+    if before == 0:
+        return 0.0
+    return (after - before) / before * 100
+
+
+def compare_command(args):
+    with open(args.before) as file:
+        before = json.load(file)["results"]
+    with open(args.after) as file:
+        after = json.load(file)["results"]
+
+    regressions = 0
+    for key in sorted(set(before) & set(after)):
+        old, new = before[key], after[key]
+        change = percent_change(old["frame_ms"][args.metric], new["frame_ms"][args.metric])
+        flag = "  <-- regression" if change > args.threshold else ""
+        regressions += bool(flag)
+        print(f"{key}: frame {args.metric} {old['frame_ms'][args.metric]:.3f} -> "
+              f"{new['frame_ms'][args.metric]:.3f} ms ({change:+.1f}%){flag}")
+
+        for stage in sorted(set(old["stages_ms"]) & set(new["stages_ms"])):
+            old_ms = old["stages_ms"][stage][args.metric]
+            new_ms = new["stages_ms"][stage][args.metric]
+            print(f"    {stage}: {old_ms:.3f} -> {new_ms:.3f} ms ({percent_change(old_ms, new_ms):+.1f}%)")
+
+        print(f"    alloc peak: {old['alloc_peak_bytes']} -> {new['alloc_peak_bytes']} bytes "
+              f"({percent_change(old['alloc_peak_bytes'], new['alloc_peak_bytes']):+.1f}%)")
+
+    for key in sorted(set(before) ^ set(after)):
+        print(f"{key}: only in {'before' if key in before else 'after'}")
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de temps de frame des modes de jeu.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Jouer les scénarios et écrire les résultats en JSON")
+    run_parser.add_argument("--modes", nargs="+", choices=sorted(GAME_MODES), default=sorted(GAME_MODES))
+    run_parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    run_parser.add_argument("--frames", type=int, default=600, help="Pas de simulation par scénario")
+    run_parser.add_argument("--seed", type=int, default=1234)
+    run_parser.add_argument("--output", help="Fichier JSON de sortie (sortie standard par défaut)")
+
+    compare_parser = subparsers.add_parser("compare", help="Comparer deux fichiers de résultats")
+    compare_parser.add_argument("before")
+    compare_parser.add_argument("after")
+    compare_parser.add_argument("--metric", choices=("mean", "p50", "p95", "p99", "max"), default="p95")
+    compare_parser.add_argument("--threshold", type=float, default=10.0,
+                                help="Hausse en %% au-delà de laquelle une frame est signalée comme régression")
+
+    args = parser.parse_args()
+    if args.command == "run":
+        run_command(args)
+    else:
+        sys.exit(compare_command(args))
+
+
+if __name__ == "__main__":
+    main()
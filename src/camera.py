@@ -0,0 +1,54 @@
+import math
+from config import SCREEN_HEIGHT, PHYSICS_DT, CAMERA_ANCHOR_Y, CAMERA_FOLLOW_RATE, CAMERA_TOP_MARGIN
+
+
+class Camera:
+    """Caméra verticale : position dans le monde du haut de l'écran.
+
+    Le joueur, les plateformes et les pièces restent en coordonnées monde ; seul
+    le dessin retranche self.y. La caméra ne fait que monter : soit elle défile
+    d'une distance fixe (scroll), soit elle rattrape le joueur de façon
+    exponentielle dès qu'il passe au-dessus de anchor_y (follow).
+    """
+
+    def __init__(self, y=0.0, anchor_y=CAMERA_ANCHOR_Y, follow_rate=CAMERA_FOLLOW_RATE, top_margin=CAMERA_TOP_MARGIN):
+        self.y = y
+        self.anchor_y = anchor_y
+        self.follow_rate = follow_rate
+        self.top_margin = top_margin
+        # Position avant le dernier pas de simulation, pour l'interpolation du rendu
+        self.render_prev = None
+
+    @property
+    def bottom(self):
+        """Position dans le monde du bas de l'écran."""
+        return self.y + SCREEN_HEIGHT
+
+    def scroll(self, distance, target_y):
+        """
+        Monter la caméra de distance, et davantage si target_y sortait par le haut de l'écran.
+
+        Returns:
+            float: Distance dont la caméra est montée pendant ce pas
+        """
+        new_y = min(self.y - distance, target_y - self.top_margin)
+        moved = self.y - new_y
+        self.y = new_y
+        return moved
+
+    def follow(self, target_y, dt=PHYSICS_DT):
+        """
+        Rapprocher la caméra de la position qui place target_y à la hauteur anchor_y de l'écran.
+
+        Returns:
+            float: Distance dont la caméra est montée pendant ce pas (0 si elle n'a pas bougé)
+        """
+        desired = target_y - self.anchor_y
+        if desired >= self.y:
+            return 0.0
+        new_y = self.y + (desired - self.y) * (1 - math.exp(-self.follow_rate * dt))
+        # Ne jamais laisser la cible sortir par le haut de l'écran
+        new_y = min(new_y, target_y - self.top_margin)
+        moved = self.y - new_y
+        self.y = new_y
+        return moved
@@ -1,12 +1,11 @@
 import pygame
-import os
-from config import ASSETS_DIR, ANIMATION_SPEED
+from config import ANIMATION_SPEED, PHYSICS_DT
+from asset_manager import asset_manager
+from utils import prepare_surface
 
 class Coin:
     """Classe pour les pièces que le joueur peut collecter"""
     def __init__(self, x, y):
-        self.x = x
-        self.y = y
         self.width = 30
         self.height = 30
         self.rect = pygame.Rect(x, y, self.width, self.height)
@@ -14,25 +13,39 @@ class Coin:
         # Charger l'animation de la pièce
         self.frames = []
         self.load_animation()
+        self.animation_speed = ANIMATION_SPEED  # Temps en secondes entre chaque frame
+        
+        self.reset(x, y)
+        
+    def reset(self, x, y):
+        """(Ré)initialiser la pièce à une nouvelle position, qu'elle soit neuve ou recyclée par le pool"""
+        self.x = x
+        self.y = y
+        self.rect.x = x
+        self.rect.y = int(y)
         
         # État de l'animation
         self.current_frame = 0
         self.animation_timer = 0
-        self.animation_speed = ANIMATION_SPEED  # Temps en secondes entre chaque frame
         
         # État de la pièce
         self.collected = False
+        self.render_prev = None
         
     def load_animation(self):
-        """Charger les frames d'animation de la pièce à partir des images individuelles"""
+        """Récupérer les frames d'animation de la pièce, construites une seule fois par processus"""
+        self.frames = asset_manager.get_or_create(("coin_frames", self.width, self.height), self.build_frames)
+        
+    def build_frames(self):
+        """Construire les frames d'animation de la pièce à partir des images individuelles"""
+        frames = []
         try:
             # Charger chaque image individuellement
             for i in range(5):  # 5 images: coin0, coin1, coin2, coin3, coin4
-                sprite_path = os.path.join(ASSETS_DIR, "sprites", "coins", f"coin{i}.png")
-                original_image = pygame.image.load(sprite_path).convert_alpha()
+                name = f"coin/{i}"
                 
                 # Récupérer les dimensions originales
-                orig_width, orig_height = original_image.get_size()
+                orig_width, orig_height = asset_manager.image_size(name)
                 
                 # Calculer le facteur d'échelle pour préserver le ratio d'aspect
                 # Utiliser la plus petite dimension pour éviter l'étirement
@@ -42,8 +55,8 @@ class Coin:
                 new_width = int(orig_width * scale_factor)
                 new_height = int(orig_height * scale_factor)
                 
-                # Redimensionner l'image en préservant le ratio d'aspect
-                scaled_image = pygame.transform.scale(original_image, (new_width, new_height))
+                # Redimensionner l'image en préservant le ratio d'aspect (relue du cache disque si possible)
+                scaled_image = asset_manager.scaled(name, (new_width, new_height))
                 
                 # Créer une surface transparente pour centrer l'image
                 frame = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
@@ -53,12 +66,14 @@ class Coin:
                 y_offset = (self.height - new_height) // 2
                 frame.blit(scaled_image, (x_offset, y_offset))
                 
-                self.frames.append(frame)
+                frames.append(prepare_surface(frame))
                 
         except Exception as e:
             print(f"Erreur lors du chargement de l'animation de la pièce: {e}")
             # Créer une image par défaut si le chargement échoue
-            self.frames = [self.create_fallback_image() for _ in range(5)]
+            frames = [self.create_fallback_image() for _ in range(5)]
+        
+        return tuple(frames)
             
     def create_fallback_image(self):
         """Créer une image par défaut pour la pièce en cas d'erreur"""
@@ -66,37 +81,55 @@ class Coin:
         pygame.draw.circle(surface, (255, 215, 0), (self.width//2, self.height//2), self.width//2)
         return surface
             
-    def update(self, scroll_speed=0):
-        """Mettre à jour l'animation de la pièce et sa position"""
+    def update(self, dt=PHYSICS_DT):
+        """Mettre à jour l'animation de la pièce"""
         if self.collected:
             return
             
-        # Faire défiler la pièce avec le reste du jeu
-        self.y += scroll_speed
-        self.rect.y = int(self.y)
-        
         # Mettre à jour l'animation
-        self.animation_timer += 1/60  # Basé sur 60 FPS
+        self.animation_timer += dt
         if self.animation_timer >= self.animation_speed:
             self.animation_timer = 0
             self.current_frame = (self.current_frame + 1) % len(self.frames)
             
-    def draw(self, screen):
-        """Dessiner la pièce à l'écran"""
+    def draw(self, screen, camera_y=0):
+        """Dessiner la pièce à l'écran, camera_y étant la position dans le monde du haut de l'écran"""
         if not self.collected:
-            screen.blit(self.frames[self.current_frame], self.rect)
+            screen.blit(self.frames[self.current_frame], (self.x, int(self.y - camera_y)))
+    
+    def get_bounds(self):
+        """Renvoie (x, y, largeur, hauteur) de la pièce, en coordonnées monde."""
+        return self.x, self.y, self.width, self.height
+    
+    def get_rect(self, camera_y=0):
+        """Renvoie le rectangle occupé à l'écran par la pièce, à sa position affichée."""
+        return pygame.Rect(self.x, int(self.y - camera_y), self.width, self.height)
     
     def check_collision(self, player):
         """Vérifier si le joueur a collecté la pièce"""
         if self.collected:
             return False
             
-        # Créer un rectangle pour le joueur à partir de ses attributs
-        player_rect = pygame.Rect(player.x, player.y, player.size, player.size)
-        
         # Vérifier la collision
-        if self.rect.colliderect(player_rect):
+        if self.rect.colliderect(player.get_hitbox()):
             self.collected = True
             return True
             
-        return False 
\ No newline at end of file
+        return False
+
+
+def collect_coins(coins, player_rect):
+    """
+    Marquer comme collectées toutes les pièces touchées par player_rect, en une seule requête.
+    
+    Args:
+        coins (list): Pièces en jeu (non collectées)
+        player_rect (pygame.Rect): Rectangle de collision du joueur
+    
+    Returns:
+        int: Nombre de pièces collectées
+    """
+    hits = player_rect.collidelistall([coin.rect for coin in coins])
+    for index in hits:
+        coins[index].collected = True
+    return len(hits) 
\ No newline at end of file
@@ -1,13 +1,25 @@
 import pygame
 import os
 
+# Mode sans fenêtre ni son (tests, mesures, lots de parties simulées)
+HEADLESS = os.environ.get("CLOUD_JUMP_HEADLESS") == "1"
+if HEADLESS:
+    # Les pilotes factices doivent être choisis avant pygame.init()
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
 # Initialize Pygame
 pygame.init()
 
 # Display settings
 SCREEN_WIDTH = 500
 SCREEN_HEIGHT = 750
-FPS = 60
+FPS = 60  # Limite d'affichage (0 = pas de limite), indépendante de la simulation
+DIRTY_RECT_RENDERING = False  # Ne redessiner et n'afficher que les zones modifiées (expérimental)
+SHOW_PROFILER = False  # Afficher l'overlay de performances au démarrage (basculer avec F3)
+PROFILER_HISTORY = 300  # Nombre de frames conservées pour les statistiques de performances
+RECORD_INPUTS = False  # Enregistrer les entrées de chaque partie dans REPLAY_DIR (voir replay.py)
+WORLD_STORE = False  # Stocker plateformes et pièces dans des tableaux NumPy (voir world_store.py)
 
 # Colors
 BLACK = (0, 0, 0)
@@ -18,6 +30,23 @@ BLUE = (0, 100, 255)
 YELLOW = (255, 255, 0)
 ORANGE = (255, 165, 0)
 
+# Simulation settings
+# Pas fixes de simulation par seconde. GRAVITY, CHARGE_RATE, les vitesses du joueur et
+# MovingPlatform (self.time += self.speed) avancent d'une quantité fixe par pas, réglée pour 60 pas
+# par seconde, comme l'enveloppe des sauts (jump_envelope.py) et la vitesse de la neige : changer
+# cette valeur change la vitesse du jeu et demande de retoucher toutes ces constantes.
+PHYSICS_HZ = 60
+PHYSICS_DT = 1 / PHYSICS_HZ
+MAX_FRAME_TIME = 0.25  # Temps réel maximal rattrapé en une frame, pour ne pas s'emballer après un blocage
+
+# Camera settings
+CAMERA_ANCHOR_Y = SCREEN_HEIGHT // 2 - 50  # Hauteur à l'écran au-dessus de laquelle la caméra suit le joueur
+CAMERA_FOLLOW_RATE = 8.0  # Vitesse de rattrapage de la caméra (par seconde), suivi exponentiel
+CAMERA_TOP_MARGIN = 60  # Distance minimale entre le joueur et le haut de l'écran
+SCROLL_LIFT = 5  # Pixels dont le joueur et la caméra montent à chaque pas quand le joueur est au-dessus de CAMERA_ANCHOR_Y, comme l'ancien défilement (0 = caméra qui suit le joueur, sans poussée)
+SCORE_DISTANCE = 5  # Pixels de montée de la caméra par point de score (avec SCROLL_LIFT = 5 : un point par pas de défilement, comme avant)
+CULL_MARGIN = 20  # Marge autour de l'écran dans laquelle les objets sont encore dessinés
+
 # Physics settings
 GRAVITY = 0.5
 MAX_CHARGE = 20
@@ -27,8 +56,18 @@ CHARGE_RATE = 0.5
 PLATFORM_HEIGHT = 10
 MIN_PLATFORM_WIDTH = 60
 MAX_PLATFORM_WIDTH = 120
+PLATFORM_WIDTH = 100  # Largeur de toutes les plateformes générées
 PLATFORM_SPACING = 100
 
+# Level generation settings
+GENERATION_CHUNK_SIZE = 8  # Plateformes par tranche de niveau générée à l'avance
+GENERATION_QUEUE_SIZE = 4  # Tranches gardées prêtes par le thread de génération
+GENERATION_LOOKAHEAD = SCREEN_HEIGHT  # Hauteur de niveau déjà placée au-dessus du haut de l'écran
+THREADED_GENERATION = True  # Générer les tranches dans un thread (sinon à la demande, même contenu)
+DIFFICULTY_STEP = 10  # Points de score par pas de difficulté (une table de tirage par pas)
+GENERATION_RETRIES = 4  # Nouveaux tirages de x pour une plateforme hors de portée de la précédente
+REACTION_TIME = 0.5  # Temps laissé au joueur, avant de charger son saut, sur une plateforme cassable
+
 # Player settings
 PLAYER_SIZE = 40  # Increased size to better show the frog sprite
 JUMP_HORIZONTAL_FACTOR = 0.05
@@ -37,12 +76,21 @@ MAX_HORIZONTAL_DISTANCE = 150
 # Animation settings
 ANIMATION_SPEED = 0.15  # Seconds per frame for idle animation
 
+# Ice mode settings
+SNOW_PARTICLE_COUNT = 600  # Nombre de flocons de neige dans le fond du mode glace
+
 # Paths
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
 ASSETS_DIR = os.path.join(PROJECT_ROOT, "assets")
 BG_ASSETS_DIR = os.path.join(ASSETS_DIR, "backgrounds")
 AUDIO_DIR = os.path.join(ASSETS_DIR, "audios")
+REPLAY_DIR = os.path.join(PROJECT_ROOT, "replays")
+ASSET_CACHE_DIR = os.path.join(PROJECT_ROOT, "asset_cache")
+
+# Asset settings
+ASSET_BUDGET_MB = 64  # Mémoire des images gardées en cache sans être utilisées par la scène en cours
+ASSET_DISK_CACHE = True  # Garder les images redimensionnées sur le disque pour les relire sans rééchantillonner
 
 # Gestion du nombre total de pièces
 TOTAL_COINS = 0
@@ -0,0 +1,65 @@
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, CULL_MARGIN
+
+
+class ViewportCuller:
+    """Étape commune avant dessin : ne garder que ce qui recoupe l'écran, élargi de margin pixels.
+
+    Chaque objet testé fournit get_bounds() -> (x, y, largeur, hauteur) en
+    coordonnées monde (ou écran avec screen_space=True, pour les effets du fond).
+    Le nombre d'objets dessinés et écartés est compté par catégorie, pour la
+    frame en cours et depuis la création.
+    """
+
+    def __init__(self, margin=CULL_MARGIN):
+        self.margin = margin
+        self.camera_y = 0
+        self.drawn = {}
+        self.culled = {}
+        self.total_drawn = {}
+        self.total_culled = {}
+
+    def begin_frame(self, camera_y=0):
+        """Fixer la position de la caméra pour la frame et remettre les compteurs de frame à zéro."""
+        self.camera_y = camera_y
+        self.drawn.clear()
+        self.culled.clear()
+
+    def get_viewport(self, screen_space=False):
+        """Renvoyer les bornes (gauche, haut, droite, bas) de la zone conservée."""
+        top = -self.margin if screen_space else self.camera_y - self.margin
+        return -self.margin, top, SCREEN_WIDTH + self.margin, top + SCREEN_HEIGHT + 2 * self.margin
+
+    def count(self, category, drawn, total):
+        """Ajouter aux compteurs d'une catégorie."""
+        culled = total - drawn
+        self.drawn[category] = self.drawn.get(category, 0) + drawn
+        self.culled[category] = self.culled.get(category, 0) + culled
+        self.total_drawn[category] = self.total_drawn.get(category, 0) + drawn
+        self.total_culled[category] = self.total_culled.get(category, 0) + culled
+
+    def visible(self, category, objects, screen_space=False):
+        """Renvoyer, dans leur ordre, les objets dont les bornes recoupent la zone conservée."""
+        left, top, right, bottom = self.get_viewport(screen_space)
+        visible = []
+        for obj in objects:
+            x, y, width, height = obj.get_bounds()
+            if x < right and x + width > left and y < bottom and y + height > top:
+                visible.append(obj)
+        self.count(category, len(visible), len(objects))
+        return visible
+
+    def visible_mask(self, category, x, y, width, height, screen_space=False):
+        """Version vectorisée de visible() pour des tableaux NumPy de positions : renvoie un masque."""
+        left, top, right, bottom = self.get_viewport(screen_space)
+        mask = (x < right) & (x + width > left) & (y < bottom) & (y + height > top)
+        self.count(category, int(mask.sum()), len(mask))
+        return mask
+
+    def get_frame_counts(self):
+        """Renvoyer « dessinés/total » par catégorie pour la dernière frame."""
+        return {category: f"{drawn}/{drawn + self.culled[category]}" for category, drawn in self.drawn.items()}
+
+    def get_stats(self):
+        """Renvoyer les totaux d'objets dessinés et écartés par catégorie depuis la création."""
+        return {category: {"drawn": drawn, "culled": self.total_culled[category]}
+                for category, drawn in self.total_drawn.items()}
@@ -0,0 +1,113 @@
+import pygame
+from config import DIRTY_RECT_RENDERING
+
+
+class DirtyRectRenderer:
+    """Rendu optionnel qui ne redessine et n'envoie à l'écran que les zones modifiées.
+
+    À chaque frame, l'appelant fournit une fonction qui dessine toute la scène et
+    les rectangles de tout ce qui a pu changer. Les rectangles de la frame
+    précédente y sont ajoutés pour effacer les anciennes positions, et ceux qui
+    se chevauchent sont fusionnés. La scène est dessinée une seule fois, limitée
+    (set_clip) au rectangle englobant ces zones : le fond n'est donc restauré que
+    là. Seules les zones modifiées sont ensuite envoyées à l'écran avec
+    pygame.display.update(rects).
+
+    Quand le rendu est désactivé, quand la caméra défile ou quand la zone modifiée
+    est trop grande, tout est redessiné puis affiché avec pygame.display.flip().
+    """
+
+    def __init__(self, screen, enabled=DIRTY_RECT_RENDERING, max_rects=8, full_redraw_ratio=0.5):
+        self.screen = screen
+        self.enabled = enabled
+        self.max_rects = max_rects
+        self.screen_rect = screen.get_rect()
+        self.full_redraw_area = int(self.screen_rect.width * self.screen_rect.height * full_redraw_ratio)
+        self.previous_rects = []
+        self.force_full = True
+
+        # Statistiques
+        self.last_pixels = 0
+        self.last_rect_count = 0
+        self.full_frames = 0
+        self.partial_frames = 0
+        self.total_pixels = 0
+
+    def invalidate(self):
+        """Forcer un rendu complet à la prochaine frame (par exemple après un changement que personne ne signale)."""
+        self.force_full = True
+
+    def merge_rects(self, rects):
+        """Limiter les rectangles à l'écran et fusionner ceux qui se chevauchent."""
+        merged = []
+        for rect in rects:
+            # Élargir légèrement pour couvrir les arrondis des positions flottantes
+            rect = pygame.Rect(rect).inflate(4, 4).clip(self.screen_rect)
+            if rect.width == 0 or rect.height == 0:
+                continue
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect = rect.union(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+
+        if len(merged) > self.max_rects:
+            merged = [merged[0].unionall(merged[1:])]
+        return merged
+
+    def render(self, draw, dirty_rects=(), scrolling=False):
+        """
+        Dessiner et afficher une frame.
+
+        Args:
+            draw (callable): Dessine toute la scène à l'écran ; ne doit pas modifier l'état du jeu
+            dirty_rects (iterable): Zones modifiées pendant cette frame
+            scrolling (bool): True quand la caméra a bougé, ce qui change tout l'écran
+        """
+        current_rects = [pygame.Rect(rect) for rect in dirty_rects]
+
+        if not self.enabled or self.force_full or scrolling:
+            self.present_full(draw)
+        else:
+            rects = self.merge_rects(self.previous_rects + current_rects)
+            pixels = sum(rect.width * rect.height for rect in rects)
+            if pixels > self.full_redraw_area:
+                self.present_full(draw)
+            else:
+                if rects:
+                    # Un seul dessin de la scène, limité au rectangle englobant toutes les zones
+                    self.screen.set_clip(rects[0].unionall(rects[1:]))
+                    draw()
+                    self.screen.set_clip(None)
+                pygame.display.update(rects)
+                self.record_frame(pixels, len(rects), full=False)
+
+        self.previous_rects = current_rects
+
+    def present_full(self, draw):
+        """Dessiner toute la scène et afficher l'écran entier."""
+        draw()
+        pygame.display.flip()
+        self.force_full = False
+        self.record_frame(self.screen_rect.width * self.screen_rect.height, 1, full=True)
+
+    def record_frame(self, pixels, rect_count, full):
+        """Mettre à jour les statistiques par frame."""
+        self.last_pixels = pixels
+        self.last_rect_count = rect_count
+        self.total_pixels += pixels
+        if full:
+            self.full_frames += 1
+        else:
+            self.partial_frames += 1
+
+    def get_stats(self):
+        """Renvoyer les pixels envoyés à l'écran par la dernière frame et les totaux."""
+        frames = self.full_frames + self.partial_frames
+        return {
+            "last_pixels": self.last_pixels,
+            "last_rects": self.last_rect_count,
+            "full_frames": self.full_frames,
+            "partial_frames": self.partial_frames,
+            "average_pixels": self.total_pixels / frames if frames else 0
+        }
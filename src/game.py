@@ -16,6 +16,7 @@ try:
     from lava_game import LavaGame
     from ice_game import IceGame
     from main_menu import MainMenu
+    from asset_manager import asset_manager
     print("All modules imported successfully")
 except ImportError as e:
     print(f"Import error: {e}")
@@ -39,8 +40,10 @@ def main():
         
         while running:
             # Afficher le menu principal et récupérer le mode sélectionné
-            menu = MainMenu()
-            menu_outcome = menu.run() # Attendre un dictionnaire
+            # Les images du menu restent en cache pendant la partie tant qu'elles tiennent dans le budget
+            with asset_manager.scene("menu"):
+                menu = MainMenu()
+                menu_outcome = menu.run() # Attendre un dictionnaire
 
             if not menu_outcome: # Si l'utilisateur ferme le menu sans choisir
                 running = False
@@ -60,26 +63,28 @@ def main():
                 continue
             
             # Démarrer le mode de jeu sélectionné
-            game_instance = None
-            if game_mode == "NORMAL":
-                # Mode de jeu normal avec différents types de plateformes
-                game_instance = Game(player_skin_path=selected_skin) # Passer le skin
-            elif game_mode == "LAVA":
-                # Mode de jeu lave avec plateformes cassables et fond de lave
-                game_instance = LavaGame(player_skin_path=selected_skin) # Passer le skin
-            elif game_mode == "ICE":
-                # Mode de jeu glace avec plateformes glissantes et fond de glace
-                game_instance = IceGame(player_skin_path=selected_skin) # Passer le skin
-            else:
-                # Quitter si aucun mode n'est sélectionné ou si l'utilisateur a quitté
-                running = False
-                continue
+            # Les images du mode sont référencées par sa scène pendant toute la partie
+            with asset_manager.scene(game_mode):
+                game_instance = None
+                if game_mode == "NORMAL":
+                    # Mode de jeu normal avec différents types de plateformes
+                    game_instance = Game(player_skin_path=selected_skin) # Passer le skin
+                elif game_mode == "LAVA":
+                    # Mode de jeu lave avec plateformes cassables et fond de lave
+                    game_instance = LavaGame(player_skin_path=selected_skin) # Passer le skin
+                elif game_mode == "ICE":
+                    # Mode de jeu glace avec plateformes glissantes et fond de glace
+                    game_instance = IceGame(player_skin_path=selected_skin) # Passer le skin
+                else:
+                    # Quitter si aucun mode n'est sélectionné ou si l'utilisateur a quitté
+                    running = False
+                    continue
             
-            if game_instance:
-                result = game_instance.run()
-            else: # Should not happen if game_mode is one of the above
-                running = False
-                continue
+                if game_instance:
+                    result = game_instance.run()
+                else: # Should not happen if game_mode is one of the above
+                    running = False
+                    continue
                 
             # Traiter le résultat du jeu
             if result == "QUIT":
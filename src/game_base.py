@@ -1,19 +1,65 @@
+import time
+import random
+import hashlib
 import pygame
-from config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, WHITE, YELLOW, RED
+from contextlib import contextmanager
+from config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, PHYSICS_DT, MAX_FRAME_TIME, SHOW_PROFILER,
+    RECORD_INPUTS, REPLAY_DIR, WORLD_STORE, SCROLL_LIFT, SCORE_DISTANCE, PLATFORM_WIDTH, PLATFORM_SPACING, GENERATION_LOOKAHEAD,
+    WHITE, YELLOW, RED
+)
 from utils import create_pixel_text
 from player import Player
+from game_platform import Platform, preload_platform_sprites
+from coin import Coin
+from dirty_renderer import DirtyRectRenderer
+from profiler import FrameProfiler, ProfilerOverlay
+from replay import InputRecorder
+from pool import ObjectPool
+from platform_index import PlatformIndex
+from world_store import WorldStore
+from camera import Camera
+from culling import ViewportCuller
+from level_generator import ChunkBuilder, LevelGenerator
 from audio_manager import audio_manager  # Import the audio manager
 
 class GameBase:
     """Classe de base pour les modes de jeu, contenant la logique commune"""
     
-    def __init__(self, title="Cloud Jump", game_mode="normal"):
+    # Génération du niveau, redéfinie par chaque mode (voir level_generator.py)
+    coin_chance = 0.0  # Probabilité d'une pièce sur une plateforme qui ne bouge pas
+    opening_weights = None  # Poids fixes des premières plateformes, None = ceux de la difficulté
+    
+    @staticmethod
+    def platform_weights(difficulty):
+        """Renvoyer ((classe de plateforme, poids), ...) pour une difficulté donnée"""
+        return ((Platform, 1.0),)
+    
+    def __init__(self, title="Cloud Jump", game_mode="normal", seed=None):
         """Initialiser la classe de base avec les éléments communs aux différents modes"""
+        # Générateur aléatoire propre à la partie : même graine et mêmes entrées = même partie
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
+        print(f"Log: {game_mode} game seed {self.seed}")
+        
         # Configuration de base
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption(title)
         self.clock = pygame.time.Clock()
         
+        # Rendu par rectangles modifiés (désactivé par défaut, voir DIRTY_RECT_RENDERING)
+        self.renderer = DirtyRectRenderer(self.screen)
+        # Zone du score et du compteur de pièces
+        self.hud_rect = pygame.Rect(0, 0, SCREEN_WIDTH // 2, 90)
+        
+        # Mesure du temps passé dans chaque étape de la boucle (overlay basculé avec F3)
+        self.profiler = FrameProfiler()
+        self.profiler_overlay = ProfilerOverlay(self.profiler)
+        self.show_profiler = SHOW_PROFILER
+        
+        # Préconstruire les sprites de plateformes à la largeur utilisée par le générateur
+        preload_platform_sprites()
+        
         # Store the game mode for audio
         self.game_mode = game_mode
         
@@ -25,15 +71,271 @@ class GameBase:
         self.pixel_font_large = pygame.font.Font(None, 64)
         self.pixel_font_small = pygame.font.Font(None, 36)
         
-        # Joueur et plateformes (initialisés dans les classes dérivées)
+        # Fond, joueur et plateformes (initialisés dans les classes dérivées)
+        self.background = None
         self.player = None
         self.platforms = []
         
+        # Plateformes et pièces sorties du jeu, réutilisées au lieu d'en construire de nouvelles
+        self.pool = ObjectPool()
+        
+        # Plateformes triées par hauteur, pour les tests d'atterrissage du joueur
+        self.platform_index = PlatformIndex()
+        
+        # Stockage optionnel des plateformes et pièces en tableaux NumPy (les objets deviennent des vues)
+        self.world = WorldStore() if WORLD_STORE else None
+        
+        # Caméra : tout le monde simulé est en coordonnées monde, décalé seulement au dessin
+        self.camera = Camera()
+        # Tri avant dessin des objets hors de l'écran, avec comptage des objets dessinés et écartés
+        self.culler = ViewportCuller()
+        
+        # Tranches de niveau générées à l'avance (créé par generate_platforms)
+        self.generator = None
+        self.level_top = 0.0  # Hauteur de la plus haute plateforme placée
+        self.start_score = 0  # Score de départ pris en compte par la génération (voir benchmark.py)
+        
         # États du jeu
         self.score = 0
+        self.score_climb = 0.0  # Montée de la caméra pas encore comptée dans le score
         self.game_over = False
-        self.scroll_speed = 0
+        self.scroll_speed = 0  # Distance dont la caméra est montée au dernier pas
         self.difficulty = 1.0
+        
+        # Image figée de l'écran de game over (capturée une seule fois)
+        self.game_over_frame = None
+        
+        # Nombre de pas de simulation effectués, et enregistrement des entrées (voir replay.py)
+        self.sim_frame = 0
+        self.recorder = InputRecorder(game_mode, self.seed) if RECORD_INPUTS else None
+    
+    def spawn(self, cls, *args):
+        """Obtenir du pool une plateforme ou une pièce de classe cls (une vue sur self.world s'il est activé)"""
+        if self.world:
+            cls = self.world.view_class(cls)
+        return self.pool.acquire(cls, *args)
+    
+    def release_all(self, objects):
+        """Rendre au pool tous les objets d'une liste et la vider"""
+        if self.world:
+            for obj in objects:
+                obj.detach()
+        self.pool.release_all(objects)
+    
+    def add_platform(self, platform):
+        """Ajouter une plateforme au jeu et à l'index des hauteurs"""
+        self.platforms.append(platform)
+        self.platform_index.add(platform)
+    
+    def clear_platforms(self):
+        """Rendre toutes les plateformes au pool et vider l'index"""
+        self.release_all(self.platforms)
+        self.platform_index.clear()
+    
+    def generate_platforms(self):
+        """Placer la plateforme de départ et relancer la génération du niveau au-dessus"""
+        # Rendre les plateformes et pièces existantes au pool
+        self.clear_platforms()
+        if hasattr(self, 'coins'):
+            self.release_all(self.coins)
+        
+        # Créer la plateforme de sol initiale, toujours normale
+        platform_width = PLATFORM_WIDTH  # Taille standard pour toutes les plateformes
+        ground_x = SCREEN_WIDTH//2 - platform_width//2
+        ground_y = SCREEN_HEIGHT - 100
+        self.add_platform(self.spawn(Platform, ground_x, ground_y, platform_width))
+        
+        # Nouveau générateur, seedé depuis le générateur de la partie ; l'ancien thread s'arrête
+        if self.generator:
+            self.generator.close()
+        builder = ChunkBuilder(self.platform_weights, self.rng.getrandbits(64), ground_y - PLATFORM_SPACING,
+                               score_offset=self.start_score, coin_chance=self.coin_chance,
+                               opening_weights=self.opening_weights, opening_count=12,
+                               platform_width=platform_width, start=(Platform, ground_x, ground_y, platform_width))
+        self.generator = LevelGenerator(builder)
+        self.level_top = ground_y
+        self.spawn_chunks()
+    
+    def spawn_chunks(self):
+        """Faire apparaître les tranches prêtes jusqu'à GENERATION_LOOKAHEAD au-dessus du haut de l'écran"""
+        while self.level_top > self.camera.y - GENERATION_LOOKAHEAD:
+            platforms, coins, self.level_top = self.generator.next_chunk()
+            for cls, args in platforms:
+                self.add_platform(self.spawn(cls, *args))
+            for x, y in coins:
+                self.coins.append(self.spawn(Coin, x, y))
+    
+    def update_platforms(self, dt):
+        """Avancer toutes les plateformes d'un pas"""
+        if self.world:
+            for platform in self.world.update_platforms(dt):
+                platform.update_fade()
+        else:
+            for platform in self.platforms:
+                platform.update(dt)
+    
+    def update_camera(self, dt):
+        """Faire suivre le joueur par la caméra et compter le score ; fin de partie si le joueur est sous l'écran"""
+        if self.player.y > self.camera.bottom:
+            self.game_over = True
+            return
+        
+        if not SCROLL_LIFT:
+            self.scroll_speed = self.camera.follow(self.player.y, dt)
+        elif self.player.y - self.camera.y < self.camera.anchor_y:
+            # Ancien défilement : le monde descendait de SCROLL_LIFT pixels sous le joueur
+            # resté en place à l'écran, soit une poussée vers le haut en coordonnées monde
+            self.player.y -= SCROLL_LIFT
+            self.scroll_speed = self.camera.scroll(SCROLL_LIFT, self.player.y)
+        else:
+            self.scroll_speed = 0
+        if self.scroll_speed > 0:
+            # Un point tous les SCORE_DISTANCE pixels de montée
+            self.score_climb += self.scroll_speed
+            points = int(self.score_climb // SCORE_DISTANCE)
+            if points:
+                self.score += points
+                self.score_climb -= points * SCORE_DISTANCE
+                
+                # Augmenter progressivement la difficulté avec le score
+                self.difficulty = 1.0 + (self.score / 500)  # Augmente de 1.0 à 2.0 sur 500 points
+    
+    def draw_platforms(self):
+        """Dessiner les plateformes visibles, décalées par la caméra"""
+        camera_y = self.camera.y
+        for platform in self.culler.visible("platforms", self.platforms):
+            platform.draw(self.screen, camera_y)
+    
+    def cull_platforms(self, limit):
+        """Rendre au pool (et retirer de l'index) les plateformes cassées ou descendues sous y = limit"""
+        index = self.platform_index
+        if self.world:
+            removed = self.world.platforms_to_remove(limit)
+            keep = lambda platform: not removed[platform.slot]
+        else:
+            keep = lambda platform: platform.y < limit and not platform.should_remove()
+        
+        def keep_or_unindex(platform):
+            if keep(platform):
+                return True
+            index.remove(platform)
+            if self.world:
+                platform.detach()
+            return False
+        
+        self.pool.recycle(self.platforms, keep_or_unindex)
+    
+    def get_dirty_rects(self):
+        """Renvoyer les zones de l'écran susceptibles d'avoir changé depuis la frame précédente"""
+        camera_y = self.camera.y
+        rects = [self.hud_rect]
+        if self.background:
+            rects.extend(self.background.get_dirty_rects())
+        if self.player:
+            rects.append(self.player.get_draw_rect(camera_y))
+        for platform in self.platforms:
+            if platform.is_animated():
+                rects.append(platform.get_rect(camera_y))
+        for coin in getattr(self, 'coins', []):
+            rects.append(coin.get_rect(camera_y))
+        if self.show_profiler:
+            rects.append(self.profiler_overlay.rect)
+        return rects
+    
+    def get_entity_counts(self):
+        """Renvoyer le nombre d'entités par catégorie, pour l'overlay de performances (« dessinés/total » si triés)"""
+        counts = {"platforms": len(self.platforms)}
+        if hasattr(self, 'coins'):
+            counts["coins"] = len(self.coins)
+        snow = getattr(self.background, 'snow', None)
+        if snow is not None:
+            counts["snow"] = snow.count
+        counts.update(self.culler.get_frame_counts())
+        counts["pool hits"] = f"{self.pool.get_stats()['hit_rate']:.0%}"
+        return counts
+    
+    def draw_frame(self):
+        """Dessiner la scène puis, si activé, l'overlay de performances"""
+        self.culler.begin_frame(self.camera.y)
+        self.draw()
+        if self.show_profiler:
+            self.profiler_overlay.draw(self.screen, self.clock.get_fps(), self.get_entity_counts())
+            self.profiler.lap("draw_overlay")
+    
+    def get_interpolated_entities(self):
+        """Renvoyer les objets dont la position est interpolée entre deux pas de simulation"""
+        entities = list(self.platforms)
+        entities.extend(getattr(self, 'coins', []))
+        if self.player:
+            entities.append(self.player)
+        return entities
+    
+    def snapshot_positions(self):
+        """Mémoriser la position de chaque objet avant un pas de simulation"""
+        for entity in self.get_interpolated_entities():
+            entity.render_prev = (entity.x, entity.y)
+        self.camera.render_prev = self.camera.y
+    
+    @contextmanager
+    def interpolated(self, alpha):
+        """
+        Placer temporairement les objets entre leur position précédente et actuelle pour le rendu.
+        
+        Args:
+            alpha (float): Fraction du pas de simulation écoulée depuis le dernier pas (0 à 1)
+        """
+        saved = []
+        for entity in self.get_interpolated_entities():
+            prev = getattr(entity, 'render_prev', None)
+            if prev is None:
+                continue  # Objet créé pendant le dernier pas : pas d'état précédent
+            saved.append((entity, entity.x, entity.y))
+            entity.x = prev[0] + (entity.x - prev[0]) * alpha
+            entity.y = prev[1] + (entity.y - prev[1]) * alpha
+        camera = self.camera
+        camera_y = camera.y
+        if camera.render_prev is not None:
+            camera.y = camera.render_prev + (camera_y - camera.render_prev) * alpha
+        try:
+            yield
+        finally:
+            for entity, x, y in saved:
+                entity.x = x
+                entity.y = y
+            camera.y = camera_y
+    
+    def state_digest(self):
+        """Empreinte de l'état simulé, pour vérifier qu'une relecture reproduit la partie exactement"""
+        # Valeurs normalisées (float, bool) : les listes d'objets gardent des int, les vues de
+        # WorldStore renvoient des flottants NumPy, pour un même état simulé
+        state = [self.sim_frame, self.score, bool(self.game_over), float(self.camera.y)]
+        if self.player:
+            player = self.player
+            state.append(tuple(float(value) for value in (player.x, player.y, player.vel_x, player.vel_y, player.charge)))
+        state.extend((type(platform).__name__, float(platform.x), float(platform.y)) for platform in self.platforms)
+        state.extend((float(coin.x), float(coin.y), bool(coin.collected)) for coin in getattr(self, 'coins', []))
+        return hashlib.sha1(repr(state).encode()).hexdigest()
+    
+    def save_recording(self):
+        """Écrire l'enregistrement des entrées de la partie, s'il est activé"""
+        if self.recorder:
+            self.recorder.save(REPLAY_DIR, self.sim_frame, self.state_digest())
+    
+    def draw_frozen_game_over(self):
+        """Réafficher l'écran de game over figé s'il a déjà été capturé. Renvoie True dans ce cas."""
+        if self.game_over_frame is None:
+            return False
+        self.screen.blit(self.game_over_frame, (0, 0))
+        return True
+    
+    def capture_game_over_frame(self):
+        """Composer une seule fois l'overlay et les textes de game over sur la dernière image du jeu, puis la figer."""
+        self.draw_game_over_screen()
+        self.game_over_frame = self.screen.copy()
+    
+    def game_over_lines(self):
+        """Lignes affichées en jaune sur l'écran de game over (redéfini par les modes qui comptent autre chose)."""
+        return [f"Score: {self.score}"]
     
     def draw_game_over_screen(self):
         """Afficher l'écran de game over avec texte pixelisé"""
@@ -47,70 +349,176 @@ class GameBase:
         game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 40))
         self.screen.blit(game_over_text, game_over_rect)
         
-        # Texte du score
-        score_text = create_pixel_text(f"Score: {self.score}", self.pixel_font_small, YELLOW)
-        score_rect = score_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 20))
-        self.screen.blit(score_text, score_rect)
+        # Score (et pièces), espacés de 30 pixels ; chaque ligne en plus remonte le bloc de 10 pixels
+        lines = self.game_over_lines()
+        top = SCREEN_HEIGHT//2 + 20 - 10 * (len(lines) - 1)
+        for i, line in enumerate(lines):
+            text = create_pixel_text(line, self.pixel_font_small, YELLOW)
+            self.screen.blit(text, text.get_rect(center=(SCREEN_WIDTH//2, top + 30 * i)))
         
         # Instructions pour retourner au menu
         restart_text = create_pixel_text("Press SPACE for menu", self.pixel_font_small, WHITE)
-        restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 70))
+        restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 70 + 10 * (len(lines) - 1)))
         self.screen.blit(restart_text, restart_rect)
     
     def handle_events(self):
         """Gérer les événements utilisateur"""
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+            result = self.handle_event(event)
+            if result != "CONTINUE":
+                return result
+        return "CONTINUE"
+    
+    def handle_event(self, event):
+        """Traiter un seul événement, réel ou scripté (voir headless.py)"""
+        # Après le game over, les entrées n'agissent plus sur la simulation : ne plus les noter
+        if self.recorder and not self.game_over:
+            self.recorder.record(self.sim_frame, event)
+        if event.type == pygame.QUIT:
+            return "QUIT"
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
                 return "QUIT"
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    return "QUIT"
-                elif event.key == pygame.K_SPACE and self.game_over:
-                    return "MENU"  # Retour au menu principal
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1 and not self.game_over:  # Clic gauche
-                    if self.player:
-                        self.player.start_charge()
-            elif event.type == pygame.MOUSEBUTTONUP:
-                if event.button == 1 and not self.game_over:  # Relâchement du clic gauche
-                    if self.player:
-                        mouse_x, _ = pygame.mouse.get_pos()
-                        self.player.release_jump(mouse_x)
+            elif event.key == pygame.K_F3:
+                # Afficher ou masquer l'overlay de performances
+                self.show_profiler = not self.show_profiler
+                self.renderer.invalidate()
+            elif event.key == pygame.K_SPACE and self.game_over:
+                return "MENU"  # Retour au menu principal
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1 and not self.game_over:  # Clic gauche
+                if self.player:
+                    self.player.start_charge()
+        elif event.type == pygame.MOUSEBUTTONUP:
+            if event.button == 1 and not self.game_over:  # Relâchement du clic gauche
+                if self.player:
+                    mouse_x, _ = event.pos
+                    self.player.release_jump(mouse_x)
         return "CONTINUE"
     
     def reset(self):
         """Réinitialiser l'état du jeu pour une nouvelle partie"""
         self.player = Player()
+        self.camera = Camera()
         self.score = 0
+        self.score_climb = 0.0
         self.game_over = False
         self.scroll_speed = 0
         self.difficulty = 1.0
-        self.generate_platforms()  # Cette méthode doit être implémentée dans les classes dérivées
+        self.game_over_frame = None
+        self.sim_frame = 0
+        self.generate_platforms()
     
     def run(self):
         """Boucle principale du jeu"""
-        running = True
         result = "CONTINUE"
         
-        while running:
-            # Gérer les événements
-            result = self.handle_events()
+        # La simulation avance par pas fixes de PHYSICS_DT, quel que soit le framerate d'affichage
+        accumulator = 0.0
+        previous_time = time.perf_counter()
+        # Position de la caméra à la frame précédente : si elle a changé, tout l'écran change
+        drawn_camera_y = None
+        
+        try:
+            while True:
+                # Temps réel écoulé, borné pour qu'un blocage ne déclenche pas des centaines de pas
+                now = time.perf_counter()
+                accumulator += min(now - previous_time, MAX_FRAME_TIME)
+                previous_time = now
+                self.profiler.begin_frame()
             
-            if result == "QUIT":
-                running = False
-            elif result == "MENU":
-                # Switch to menu music when returning to the menu
-                audio_manager.play_music("menu")
-                return "MENU"  # Signal pour retourner au menu
+                # Gérer les événements
+                result = self.handle_events()
+                self.profiler.lap("events")
             
-            # Mettre à jour l'état du jeu
-            self.update()
+                if result == "QUIT":
+                    self.save_recording()
+                    # Sortir tout de suite : l'écran figé attendrait sinon un nouvel événement
+                    break
+                elif result == "MENU":
+                    self.save_recording()
+                    # Switch to menu music when returning to the menu
+                    audio_manager.play_music("menu")
+                    return "MENU"  # Signal pour retourner au menu
             
-            # Dessiner tous les éléments
-            self.draw()
+                # Mettre à jour l'état du jeu autant de pas que le temps écoulé l'exige,
+                # sans compter de pas après le game over (run_headless s'arrête au même pas)
+                while accumulator >= PHYSICS_DT and not self.game_over:
+                    self.snapshot_positions()
+                    self.profiler.lap("snapshot")
+                    self.update(PHYSICS_DT)
+                    self.sim_frame += 1
+                    accumulator -= PHYSICS_DT
             
-            # Mettre à jour l'affichage et maintenir le framerate
-            pygame.display.flip()
-            self.clock.tick(FPS)
+                # Dessiner et afficher (tout l'écran, ou seulement les zones modifiées si activé)
+                if self.game_over:
+                    self.renderer.invalidate()
+                with self.interpolated(accumulator / PHYSICS_DT):
+                    scrolling = self.camera.y != drawn_camera_y
+                    drawn_camera_y = self.camera.y
+                    self.renderer.render(self.draw_frame, self.get_dirty_rects(), scrolling=scrolling)
+                self.profiler.lap("present")
+                self.profiler.end_frame()
             
-        return "QUIT"  # Le jeu s'est terminé par une demande de sortie 
\ No newline at end of file
+                # Limiter le framerate d'affichage
+                self.clock.tick(FPS)
+            
+                # Écran de game over figé : dormir jusqu'au prochain événement au lieu de redessiner
+                if self.game_over_frame is not None:
+                    pygame.event.post(pygame.event.wait())
+                    # Le temps passé à attendre ne doit pas être simulé
+                    previous_time = time.perf_counter()
+                    accumulator = 0.0
+            
+            return "QUIT"  # Le jeu s'est terminé par une demande de sortie
+        finally:
+            # Arrêter le thread de génération quelle que soit la sortie : menu, fermeture ou erreur
+            self.generator.close()
+    
+    def run_headless(self, max_frames, input_source=None, render=False):
+        """
+        Simuler la partie aussi vite que possible, sans flip ni limite de framerate.
+        
+        Args:
+            max_frames (int): Nombre maximal de pas de simulation
+            input_source: Objet fournissant get_events(game, frame), voir headless.py (None = aucune entrée)
+            render (bool): Dessiner aussi chaque pas sur l'écran hors champ
+        
+        Le générateur de niveau est fermé en sortant : la partie ne peut pas être reprise.
+        
+        Returns:
+            dict: Pas simulés, durée, pas par seconde, score et état de fin de la partie
+        """
+        frames = 0
+        result = "CONTINUE"
+        start = time.perf_counter()
+        
+        try:
+            while frames < max_frames and result == "CONTINUE" and not self.game_over:
+                if input_source:
+                    for event in input_source.get_events(self, frames):
+                        result = self.handle_event(event)
+                        if result != "CONTINUE":
+                            break
+                    # Comme run : un QUIT ou un MENU quitte la boucle avant de simuler le pas
+                    if result != "CONTINUE":
+                        break
+                
+                self.update(PHYSICS_DT)
+                self.sim_frame += 1
+                if render:
+                    self.draw_frame()
+                frames += 1
+        finally:
+            # Comme run : la partie est finie, son thread de génération aussi
+            self.generator.close()
+        
+        elapsed = time.perf_counter() - start
+        return {
+            "frames": frames,
+            "seconds": elapsed,
+            "fps": frames / elapsed if elapsed > 0 else 0.0,
+            "score": self.score,
+            "game_over": self.game_over,
+            "result": result
+        } 
\ No newline at end of file
@@ -1,25 +1,34 @@
-import pygame
-import random
-
-from config import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, BLACK, WHITE, YELLOW, RED,
-    MIN_PLATFORM_WIDTH, MAX_PLATFORM_WIDTH, PLATFORM_SPACING,
-    add_coins, update_high_score
-)
+from config import PHYSICS_DT, WHITE, YELLOW, add_coins, update_high_score
 from utils import create_pixel_text
 from game_base import GameBase
+from camera import Camera
 from background import Background
 from player import Player
 from game_platform import Platform, MovingPlatform, BreakablePlatform, IcePlatform  # Import from our renamed game_platform classes
-from coin import Coin
+from coin import collect_coins
 from audio_manager import audio_manager
 
 class Game(GameBase):
     """Mode de jeu normal avec plateformes variées et fond de nuages."""
     
-    def __init__(self, player_skin_path):
+    # 30% de chance d'avoir une pièce sur une plateforme (si ce n'est pas une plateforme mobile)
+    coin_chance = 0.3
+    # Premières plateformes : surtout des plateformes normales
+    opening_weights = ((Platform, 0.6), (MovingPlatform, 0.2), (IcePlatform, 0.1), (BreakablePlatform, 0.1))
+    
+    @staticmethod
+    def platform_weights(difficulty):
+        """Avec le score qui augmente, ajouter des plateformes plus difficiles."""
+        return (
+            (Platform, max(0.1, 0.7 - difficulty * 0.25)),  # De 0.7 à 0.1
+            (MovingPlatform, 0.2 + difficulty * 0.15),  # De 0.2 à 0.5
+            (IcePlatform, min(0.25, 0.05 + difficulty * 0.1)),  # De 0.05 à 0.25
+            (BreakablePlatform, min(0.25, 0.05 + difficulty * 0.1))  # De 0.05 à 0.25
+        )
+    
+    def __init__(self, player_skin_path, seed=None):
         # Appel du constructeur de la classe parente avec le mode de jeu "normal"
-        super().__init__(title="Cloud Jump", game_mode="normal")
+        super().__init__(title="Cloud Jump", game_mode="normal", seed=seed)
         
         self.player_skin_path = player_skin_path # Store the skin path
 
@@ -27,177 +36,98 @@ class Game(GameBase):
         self.background = Background()
         self.player = Player(skin_path=self.player_skin_path) # Pass skin path to Player
         
-        # Initialiser le système de pièces
+        # Initialiser le système de pièces (placées avec les plateformes par le générateur)
         self.coins = []
         self.coin_count = 0
         
-        # Générer les plateformes initiales
+        # Générer les plateformes et pièces initiales
         self.generate_platforms()
         
-        # Générer les pièces initiales
-        self.generate_coins()
-        
-    def generate_platforms(self):
-        """Générer les plateformes initiales pour le jeu."""
-        # Vider les plateformes existantes
-        self.platforms = []
-        
-        # Taille fixe de plateforme
-        platform_width = 100  # Taille standard pour toutes les plateformes
-        
-        # Créer la plateforme de sol initiale
-        self.platforms.append(Platform(SCREEN_WIDTH//2 - platform_width//2, SCREEN_HEIGHT - 100, platform_width))
-        
-        # Générer des plateformes aléatoires
-        for i in range(12):
-            x = random.randint(20, SCREEN_WIDTH - platform_width)
-            y = SCREEN_HEIGHT - 200 - i * PLATFORM_SPACING
-            
-            # Choisir un type de plateforme au hasard avec probabilités différentes
-            platform_type = random.choices(
-                ["normal", "moving", "ice", "breakable"],
-                weights=[0.6, 0.2, 0.1, 0.1],
-                k=1
-            )[0]
+    def cull_coins(self, limit):
+        """Rendre au pool les pièces collectées ou descendues sous y = limit."""
+        if self.world:
+            removed = self.world.coins_to_remove(limit)
             
-            if platform_type == "normal":
-                self.platforms.append(Platform(x, y, platform_width))
-            elif platform_type == "moving":
-                self.platforms.append(MovingPlatform(x, y, platform_width))
-            elif platform_type == "ice":
-                self.platforms.append(IcePlatform(x, y, platform_width))
-            elif platform_type == "breakable":
-                self.platforms.append(BreakablePlatform(x, y, platform_width))
-    
-    def generate_coins(self):
-        """Générer des pièces sur certaines plateformes."""
-        # Vider la liste des pièces
-        self.coins = []
-        
-        # Placer des pièces sur certaines plateformes (pas toutes)
-        for platform in self.platforms:
-            # Ne pas placer de pièces sur les plateformes mobiles
-            if hasattr(platform, 'platform_type') and platform.platform_type == "moving":
-                continue
-                
-            # 30% de chance d'avoir une pièce sur une plateforme (si ce n'est pas une plateforme mobile)
-            if random.random() < 0.3:
-                # Positionner la pièce au-dessus de la plateforme
-                coin_x = platform.x + platform.width // 2 - 15  # Centrer la pièce (largeur de pièce = 30)
-                coin_y = platform.y - 40  # Positionner au-dessus de la plateforme
-                self.coins.append(Coin(coin_x, coin_y))
+            def keep(coin):
+                if not removed[coin.slot]:
+                    return True
+                coin.detach()
+                return False
+        else:
+            keep = lambda coin: not coin.collected and coin.y < limit
+        self.pool.recycle(self.coins, keep)
     
-    def update(self):
-        """Mettre à jour tous les éléments du jeu pour une frame."""
+    def update(self, dt=PHYSICS_DT):
+        """Avancer tous les éléments du jeu d'un pas de simulation."""
         if self.game_over:
             return
             
         # Mettre à jour le fond
-        self.background.update()
+        self.background.update(dt)
+        self.profiler.lap("background")
         
         # Mettre à jour le joueur
-        player_update_result = self.player.update(self.platforms)
+        self.player.update(self.platforms, dt, self.platform_index)
+        self.profiler.lap("player")
         
-        # Vérifier si le joueur est tombé en bas
-        if player_update_result == "GAME_OVER":
-            self.game_over = True
+        # Faire suivre le joueur par la caméra ; fin de partie s'il est tombé sous l'écran
+        self.update_camera(dt)
+        if self.game_over:
             return
-        
-        # Système de caméra simplifié
-        should_scroll = player_update_result  # Le joueur renvoie directement un booléen
-        self.scroll_speed = 5 if should_scroll else 0
-        if self.scroll_speed > 0:
-            self.score += 1
             
-            # Augmenter progressivement la difficulté avec le score
-            self.difficulty = 1.0 + (self.score / 500)  # Augmente de 1.0 à 2.0 sur 500 points
+        # Mettre à jour les plateformes
+        self.update_platforms(dt)
+        self.profiler.lap("platforms")
             
-        # Mettre à jour les plateformes avec le défilement
-        for platform in self.platforms:
-            platform.update(self.scroll_speed)
-            
-        # Mettre à jour les pièces et vérifier les collisions
-        for coin in self.coins:
-            coin.update(self.scroll_speed)
-            if coin.check_collision(self.player):
-                self.coin_count += 1
-                # Play coin sound effect
-                audio_manager.play_sound("coin")
+        # Mettre à jour les pièces, puis une seule requête de collision pour toutes, contre le rectangle du joueur
+        if self.world:
+            if self.coins:
+                self.world.update_coins(dt, self.coins[0].animation_speed, len(self.coins[0].frames))
+            collected = self.world.collect_coins(self.player.get_hitbox())
+        else:
+            for coin in self.coins:
+                coin.update(dt)
+            collected = collect_coins(self.coins, self.player.get_hitbox())
+        if collected:
+            self.coin_count += collected
+            # Play coin sound effect
+            audio_manager.play_sound("coin")
                 
-        # Supprimer les pièces collectées ou hors écran
-        self.coins = [c for c in self.coins if not c.collected and c.y < SCREEN_HEIGHT + 50]
+        # Rendre au pool les pièces collectées ou hors écran, dans la même passe
+        self.cull_coins(self.camera.bottom + 50)
+        self.profiler.lap("coins")
             
-        # Supprimer les plateformes cassées ou qui sont sorties de l'écran
-        self.platforms = [p for p in self.platforms if p.y < SCREEN_HEIGHT + 50 and 
-                         (not hasattr(p, 'should_remove') or not p.should_remove())]
+        # Rendre au pool les plateformes cassées ou sorties de l'écran
+        self.cull_platforms(self.camera.bottom + 50)
         
-        # Ajouter de nouvelles plateformes au fur et à mesure
-        while len(self.platforms) < 13:
-            # Obtenir la position Y de la plateforme la plus haute et ajouter une nouvelle au-dessus
-            highest_y = min([p.y for p in self.platforms])
-            platform_width = 100  # Taille standard
-            
-            # Calculer l'espacement vertical en fonction du score
-            # Plus le score est élevé, plus l'espacement est grand
-            current_spacing = PLATFORM_SPACING + int(self.score / 100) * 5
-            # Limiter l'espacement maximum pour éviter que le jeu devienne impossible
-            current_spacing = min(current_spacing, PLATFORM_SPACING * 2)
-            
-            x = random.randint(20, SCREEN_WIDTH - platform_width)
-            y = highest_y - current_spacing
-            
-            # Avec le score qui augmente, ajouter des plateformes plus difficiles
-            platform_type_chances = {
-                "normal": max(0.1, 0.7 - self.difficulty * 0.25),  # De 0.7 à 0.1
-                "moving": 0.2 + self.difficulty * 0.15,  # De 0.2 à 0.5
-                "ice": min(0.25, 0.05 + self.difficulty * 0.1),  # De 0.05 à 0.25
-                "breakable": min(0.25, 0.05 + self.difficulty * 0.1)  # De 0.05 à 0.25
-            }
-            
-            # Normaliser les probabilités
-            total = sum(platform_type_chances.values())
-            normalized_chances = {k: v / total for k, v in platform_type_chances.items()}
-            
-            platform_type = random.choices(
-                list(normalized_chances.keys()),
-                weights=list(normalized_chances.values()),
-                k=1
-            )[0]
-            
-            # Créer la plateforme en fonction du type
-            if platform_type == "normal":
-                platform = Platform(x, y, platform_width)
-            elif platform_type == "moving":
-                platform = MovingPlatform(x, y, platform_width)
-            elif platform_type == "ice":
-                platform = IcePlatform(x, y, platform_width)
-            else:  # "breakable"
-                platform = BreakablePlatform(x, y, platform_width)
-                
-            self.platforms.append(platform)
-            
-            # 30% de chance de placer une pièce sur cette nouvelle plateforme (sauf si c'est une plateforme mobile)
-            if platform_type != "moving" and random.random() < 0.3:
-                coin_x = x + platform_width // 2 - 15  # Centrer la pièce
-                coin_y = y - 40  # Positionner au-dessus de la plateforme
-                self.coins.append(Coin(coin_x, coin_y))
+        # Faire apparaître les tranches de niveau déjà générées au fur et à mesure
+        self.spawn_chunks()
+        self.profiler.lap("generation")
     
     def draw(self):
         """Dessiner tous les éléments du jeu à l'écran."""
+        # L'écran de game over est figé : le réafficher sans redessiner le monde
+        if self.draw_frozen_game_over():
+            return
+            
         # Dessiner le fond
-        self.background.draw(self.screen)
+        self.background.draw(self.screen, self.culler)
+        self.profiler.lap("draw_background")
         
         # Dessiner les plateformes
-        for platform in self.platforms:
-            platform.draw(self.screen)
+        self.draw_platforms()
+        self.profiler.lap("draw_platforms")
             
         # Dessiner les pièces
-        for coin in self.coins:
-            coin.draw(self.screen)
+        camera_y = self.camera.y
+        for coin in self.culler.visible("coins", self.coins):
+            coin.draw(self.screen, camera_y)
+        self.profiler.lap("draw_coins")
         
         # Dessiner le joueur si le jeu est actif
         if not self.game_over:
-            self.player.draw(self.screen)
+            self.player.draw(self.screen, camera_y=self.camera.y)
+            self.profiler.lap("draw_player")
             
             # Dessiner le score avec style pixel art
             score_text = create_pixel_text(f"Score: {self.score}", self.pixel_font_small, WHITE)
@@ -207,93 +137,35 @@ class Game(GameBase):
             coin_text = create_pixel_text(f"Coins: {self.coin_count}", self.pixel_font_small, YELLOW)
             self.screen.blit(coin_text, (10, 50))
         else:
-            self.draw_game_over_screen()
+            # Composer l'écran de game over une seule fois puis le figer
+            self.capture_game_over_frame()
+        self.profiler.lap("draw_hud")
     
-    def draw_game_over_screen(self):
-        """Draw the game over screen with pixelated text."""
-        # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))  # Black with 70% opacity
-        self.screen.blit(overlay, (0, 0))
-        
-        # Game Over text
-        game_over_text = create_pixel_text("GAME OVER", self.pixel_font_large, RED)
-        game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 40))
-        self.screen.blit(game_over_text, game_over_rect)
-        
-        # Score text
-        score_text = create_pixel_text(f"Score: {self.score}", self.pixel_font_small, YELLOW)
-        score_rect = score_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 10))
-        self.screen.blit(score_text, score_rect)
-        
-        # Coin text
-        coin_text = create_pixel_text(f"Coins: {self.coin_count}", self.pixel_font_small, YELLOW)
-        coin_rect = coin_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 40))
-        self.screen.blit(coin_text, coin_rect)
-        
-        # Instruction pour retourner au menu
-        restart_text = create_pixel_text("Press SPACE for menu", self.pixel_font_small, WHITE)
-        restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 80))
-        self.screen.blit(restart_text, restart_rect)
+    def game_over_lines(self):
+        """Le score, puis les pièces ramassées pendant la partie."""
+        return [f"Score: {self.score}", f"Coins: {self.coin_count}"]
     
     def reset(self):
         """Reset the game state to start a new game."""
         # Re-initialize player with the stored skin path
         self.player = Player(skin_path=self.player_skin_path) 
+        self.camera = Camera()
         self.score = 0
+        self.score_climb = 0.0
         self.coin_count = 0
         self.game_over = False
+        self.game_over_frame = None
+        self.sim_frame = 0
         self.scroll_speed = 0
         self.difficulty = 1.0
         self.generate_platforms()
-        self.generate_coins()
-    
-    def handle_events(self):
-        """Handle all user input events."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return "QUIT"
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    return "QUIT"
-                elif event.key == pygame.K_SPACE and self.game_over:
-                    # Update high score before returning to menu
-                    update_high_score("normal", self.score)
-                    # Ajouter les pièces collectées au compteur total
-                    add_coins(self.coin_count)
-                    return "MENU"  # Retourner au menu principal
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1 and not self.game_over:  # Left mouse button
-                    self.player.start_charge()
-            elif event.type == pygame.MOUSEBUTTONUP:
-                if event.button == 1 and not self.game_over:  # Relâchement du clic gauche
-                    mouse_x, _ = pygame.mouse.get_pos()
-                    self.player.release_jump(mouse_x)
-                    
-        return "CONTINUE"
     
-    def run(self):
-        """Main game loop."""
-        running = True
-        result = "CONTINUE"
-        
-        while running:
-            # Handle events
-            result = self.handle_events()
-            
-            if result == "QUIT":
-                running = False
-            elif result == "MENU":
-                return "MENU"  # Signal to return to the menu
-            
-            # Update game state
-            self.update()
-            
-            # Draw everything
-            self.draw()
-            
-            # Update display and maintain framerate
-            pygame.display.flip()
-            self.clock.tick(FPS)
-            
-        return "QUIT"  # Le jeu s'est terminé par une demande de sortie 
\ No newline at end of file
+    def handle_event(self, event):
+        """Handle one user input event, recording the score when leaving for the menu."""
+        result = super().handle_event(event)
+        if result == "MENU":
+            # Update high score before returning to menu
+            update_high_score("normal", self.score)
+            # Ajouter les pièces collectées au compteur total
+            add_coins(self.coin_count)
+        return result
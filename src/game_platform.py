@@ -1,113 +1,132 @@
 import pygame
 import random
 import math
-import os
-from config import GREEN, BLUE, YELLOW, RED, PLATFORM_HEIGHT, ASSETS_DIR
+from config import GREEN, BLUE, YELLOW, RED, PLATFORM_HEIGHT, PLATFORM_WIDTH, PHYSICS_DT
+from asset_manager import asset_manager
 
 class Platform:
     """Plateforme de base sur laquelle le joueur peut sauter."""
     
-    def __init__(self, x, y, width):
+    # Nom logique du sprite (voir asset_manager.ASSET_FILES), redéfini par chaque sous-classe
+    sprite_name = "platform/normal"
+    # La plateforme se déplace-t-elle verticalement (voir MovingPlatform)
+    is_moving = False
+    # Part de la vitesse horizontale du joueur conservée à chaque pas au sol
+    friction = 0.85  # Friction normale
+    
+    def __init__(self, x, y, width, *params):
+        self.color = GREEN  # Couleur de secours
+        self.platform_type = "normal"
+        self.reset(x, y, width, *params)
+        
+    def reset(self, x, y, width):
+        """(Ré)initialiser la plateforme à une nouvelle position, qu'elle soit neuve ou recyclée par le pool."""
         self.x = x
         self.y = y
         self.width = width
-        self.color = GREEN  # Couleur de secours
-        self.platform_type = "normal"
-        self.friction = 0.85  # Friction normale
         
-        # Charger le sprite
-        self.sprite = self.load_sprite("normal_platform.png")
+        # Sprite déjà redimensionné à la largeur de la plateforme (partagé entre
+        # toutes les plateformes du même type et de la même largeur)
+        self.sprite = self.get_scaled_sprite(width)
+        
+        # Pas de position précédente à interpoler pour une plateforme qui apparaît
+        self.render_prev = None
+        
+    @classmethod
+    def get_scaled_sprite(cls, width):
+        """
+        Renvoie le sprite du type de plateforme redimensionné à la largeur donnée, en conservant ses proportions.
         
-    def load_sprite(self, filename):
-        """Charge le sprite de la plateforme sans redimensionnement."""
+        Toute largeur (MIN_PLATFORM_WIDTH à MAX_PLATFORM_WIDTH, ou PLATFORM_WIDTH pour le générateur)
+        est construite à sa première demande puis partagée par le gestionnaire d'images, qui la garde
+        aussi sur le disque : les largeurs jamais utilisées ne coûtent rien au chargement.
+        """
         try:
-            sprite_path = os.path.join(ASSETS_DIR, "sprites", "platforms", filename)
-            sprite = pygame.image.load(sprite_path).convert_alpha()
-            return sprite
+            sprite_width, sprite_height = asset_manager.image_size(cls.sprite_name)
+            new_height = int(sprite_height * (width / sprite_width))
+            return asset_manager.scaled(cls.sprite_name, (width, new_height))
         except Exception as e:
-            print(f"Erreur lors du chargement du sprite {filename}: {e}")
+            print(f"Erreur lors du chargement du sprite {cls.sprite_name}: {e}")
             return None
         
-    def update(self, scroll_speed=0):
-        """Update platform position, handling scrolling."""
-        # Move platform down for scrolling effect
-        self.y += scroll_speed
+    def update(self, dt=PHYSICS_DT):
+        """Avancer la plateforme d'un pas (une plateforme fixe ne bouge pas : la caméra gère le défilement)."""
+        pass
         
-    def draw(self, screen):
-        """Draw the platform to the screen."""
+    def draw(self, screen, camera_y=0):
+        """Draw the platform to the screen, camera_y being the world position of the top of the screen."""
         if self.sprite:
-            # Redimensionner le sprite pour qu'il corresponde à la largeur de la plateforme
-            # tout en conservant ses proportions (ratio d'aspect)
-            original_width = self.sprite.get_width()
-            original_height = self.sprite.get_height()
-            
-            # Calculer la nouvelle hauteur pour conserver le ratio d'aspect
-            scale_factor = self.width / original_width
-            new_height = int(original_height * scale_factor)
-            
-            # Redimensionner le sprite
-            scaled_sprite = pygame.transform.scale(self.sprite, (self.width, new_height))
-            
-            # Dessiner le sprite redimensionné
-            screen.blit(scaled_sprite, (self.x, self.y))
+            # Le sprite est déjà à la bonne taille : un simple blit suffit
+            screen.blit(self.sprite, (self.x, self.y - camera_y))
         else:
             # Fallback to rectangle if sprite not available
-            pygame.draw.rect(screen, self.color, (self.x, self.y, self.width, PLATFORM_HEIGHT))
+            pygame.draw.rect(screen, self.color, (self.x, self.y - camera_y, self.width, PLATFORM_HEIGHT))
+    
+    def get_height(self):
+        """Hauteur dessinée de la plateforme (celle du sprite, plus haute que la zone de collision)."""
+        return self.sprite.get_height() if self.sprite else PLATFORM_HEIGHT
+        
+    def get_bounds(self):
+        """Renvoie (x, y, largeur, hauteur) de la zone dessinée, en coordonnées monde."""
+        return self.x, self.y, self.width, self.get_height()
+        
+    def get_rect(self, camera_y=0):
+        """Renvoie le rectangle occupé à l'écran par la plateforme."""
+        return pygame.Rect(int(self.x), int(self.y - camera_y), self.width, self.get_height())
+    
+    def is_animated(self):
+        """Indique si l'apparence de la plateforme change d'une frame à l'autre sans défilement."""
+        return False
         
     def on_landing(self, player):
         """Appelé quand le joueur atterrit sur la plateforme."""
         # La classe de base ne fait rien de spécial
         pass
     
-    @staticmethod
-    def create_random_platform(x, y, width, difficulty=1.0):
-        """Crée une plateforme aléatoire basée sur la difficulté."""
-        # Plus la difficulté est élevée, plus il y a de chances d'avoir une plateforme spéciale
-        chance = random.random() * difficulty
-        
-        # Ajuster les seuils en fonction de la difficulté
-        # À mesure que la difficulté augmente, les plateformes normales sont moins fréquentes
-        ice_threshold = max(0.7, 0.85 - (difficulty - 1.0) * 0.15)      # Descend de 0.85 à 0.7
-        moving_threshold = max(0.5, 0.7 - (difficulty - 1.0) * 0.2)     # Descend de 0.7 à 0.5
-        breakable_threshold = max(0.3, 0.55 - (difficulty - 1.0) * 0.25) # Descend de 0.55 à 0.3
-        
-        if chance > ice_threshold:
-            return IcePlatform(x, y, width)
-        elif chance > moving_threshold:
-            return MovingPlatform(x, y, width)
-        elif chance > breakable_threshold:
-            return BreakablePlatform(x, y, width)
-        else:
-            return Platform(x, y, width)
+    def should_remove(self):
+        """Indique si la plateforme doit disparaître alors qu'elle est encore à l'écran."""
+        return False
 
 
 class MovingPlatform(Platform):
     """Plateforme qui se déplace verticalement."""
     
-    def __init__(self, x, y, width):
-        super().__init__(x, y, width)
+    sprite_name = "platform/moving"
+    is_moving = True
+    friction = 0.95  # Conserver une partie de la vitesse horizontale pour un mouvement plus fluide
+    
+    def __init__(self, x, y, width, rng=random, motion=None):
+        super().__init__(x, y, width, rng, motion)
         self.color = BLUE
         self.platform_type = "moving"
+        
+    def reset(self, x, y, width, rng=random, motion=None):
+        """Replacer la plateforme avec le mouvement donné, ou en tirer un nouveau."""
+        super().reset(x, y, width)
         self.original_y = y
-        self.amplitude = random.randint(30, 60)  # Distance de déplacement
-        self.speed = random.uniform(0.02, 0.04)  # Vitesse de déplacement
-        self.time = random.uniform(0, 2 * math.pi)  # Phase aléatoire
+        # motion : mouvement déjà tiré par le générateur de niveau (voir level_generator.py) ;
+        # sinon rng, générateur du mode de jeu, pour que le mouvement soit reproductible à partir de sa graine
+        # Distance de déplacement, vitesse de déplacement et phase
+        self.amplitude, self.speed, self.time = motion or self.random_motion(rng)
         self.prev_y = y  # Mémoriser la position précédente pour calculer le mouvement
+    
+    @staticmethod
+    def random_motion(rng=random):
+        """Tirer (amplitude, vitesse, phase) d'un mouvement vertical."""
+        return rng.randint(30, 60), rng.uniform(0.02, 0.04), rng.uniform(0, 2 * math.pi)
         
-        # Charger le sprite spécifique
-        self.sprite = self.load_sprite("sliding_platform.png")
-        
-    def update(self, scroll_speed=0):
-        """Mettre à jour la position avec mouvement vertical + défilement."""
+    def update(self, dt=PHYSICS_DT):
+        """Mettre à jour la position avec le mouvement vertical."""
         # Mémoriser la position actuelle
         self.prev_y = self.y
         
         # Mettre à jour le mouvement vertical
         self.time += self.speed
         self.y = self.original_y + math.sin(self.time) * self.amplitude
-        
-        # Ajouter le défilement de l'écran
-        self.original_y += scroll_speed
+    
+    def is_animated(self):
+        """La plateforme mobile bouge à chaque frame."""
+        return True
     
     def on_landing(self, player):
         """Ajuster la position du joueur quand la plateforme se déplace."""
@@ -127,40 +146,59 @@ class MovingPlatform(Platform):
 class BreakablePlatform(Platform):
     """Plateforme qui se casse après qu'on l'ait touchée."""
     
+    sprite_name = "platform/breakable"
+    break_time = 1.8  # Secondes avant de se casser
+    
     def __init__(self, x, y, width):
+        # Copie du sprite que la plateforme estompe, conservée d'une réutilisation à l'autre
+        self.fade_sprite = None
         super().__init__(x, y, width)
-        self.color = YELLOW
         self.platform_type = "breakable"
+        
+    def reset(self, x, y, width):
+        """Replacer la plateforme intacte."""
+        super().reset(x, y, width)
+        self.color = YELLOW
         self.breaking = False
         self.break_timer = 0
-        self.break_time = 1.8  # Secondes avant de se casser
         
-        # Charger le sprite spécifique
-        self.sprite = self.load_sprite("breakable_platform.png")
-        
-    def update(self, scroll_speed=0):
+    def update(self, dt=PHYSICS_DT):
         """Mettre à jour la plateforme, gérer le timer de destruction."""
-        super().update(scroll_speed)
+        super().update(dt)
         
         if self.breaking:
-            self.break_timer += 1/60  # Incrémenter d'1/60 sec (à 60 FPS)
-            
-            # Modifier l'opacité du sprite en fonction du temps restant
-            if self.sprite:
-                alpha = 255 * (1 - self.break_timer / self.break_time)
-                self.sprite.set_alpha(max(0, int(alpha)))
-            else:
-                # Mettre à jour la couleur pour un effet visuel si pas de sprite
-                progress = min(self.break_timer / self.break_time, 1.0)
-                r = int(YELLOW[0] + (RED[0] - YELLOW[0]) * progress)
-                g = int(YELLOW[1] + (RED[1] - YELLOW[1]) * progress)
-                b = int(YELLOW[2] + (RED[2] - YELLOW[2]) * progress)
-                self.color = (r, g, b)
+            self.break_timer += dt
+            self.update_fade()
+    
+    def update_fade(self):
+        """Accorder l'apparence de la plateforme au temps écoulé depuis l'atterrissage."""
+        # Modifier l'opacité du sprite en fonction du temps restant
+        if self.sprite:
+            alpha = 255 * (1 - self.break_timer / self.break_time)
+            self.sprite.set_alpha(max(0, int(alpha)))
+        else:
+            # Mettre à jour la couleur pour un effet visuel si pas de sprite
+            progress = min(self.break_timer / self.break_time, 1.0)
+            r = int(YELLOW[0] + (RED[0] - YELLOW[0]) * progress)
+            g = int(YELLOW[1] + (RED[1] - YELLOW[1]) * progress)
+            b = int(YELLOW[2] + (RED[2] - YELLOW[2]) * progress)
+            self.color = (r, g, b)
         
     def on_landing(self, player):
         """Déclencher le compte à rebours de destruction."""
         if not self.breaking:
             self.breaking = True
+            # Le sprite est partagé : l'estomper sur une copie propre à la plateforme,
+            # faite une seule fois tant que la largeur ne change pas
+            if self.sprite:
+                if self.fade_sprite is None or self.fade_sprite.get_size() != self.sprite.get_size():
+                    self.fade_sprite = self.sprite.copy()
+                self.fade_sprite.set_alpha(255)
+                self.sprite = self.fade_sprite
+            
+    def is_animated(self):
+        """La plateforme s'estompe pendant sa destruction."""
+        return self.breaking
             
     def should_remove(self):
         """Vérifier si la plateforme doit être supprimée."""
@@ -170,16 +208,26 @@ class BreakablePlatform(Platform):
 class IcePlatform(Platform):
     """Plateforme glissante avec moins de friction."""
     
+    sprite_name = "platform/ice"
+    friction = 0.98  # Beaucoup moins de friction
+    
     def __init__(self, x, y, width):
         super().__init__(x, y, width)
         self.color = (150, 230, 250)  # Bleu clair pour la glace
         self.platform_type = "ice"
-        self.friction = 0.98  # Beaucoup moins de friction
-        
-        # Charger le sprite spécifique
-        self.sprite = self.load_sprite("ice_platform.png")
                             
     def on_landing(self, player):
         """Appliquer un effet de glisse au joueur."""
         # Le joueur utilisera la friction de cette plateforme
-        pass 
\ No newline at end of file
+        pass
+
+
+# Tous les types de plateformes, pour préconstruire leurs sprites
+PLATFORM_CLASSES = (Platform, MovingPlatform, BreakablePlatform, IcePlatform)
+
+
+def preload_platform_sprites(widths=(PLATFORM_WIDTH,)):
+    """Préconstruit les sprites de chaque type de plateforme aux largeurs données ; les autres sont construites à la demande."""
+    for platform_class in PLATFORM_CLASSES:
+        for width in widths:
+            platform_class.get_scaled_sprite(width)
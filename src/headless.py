@@ -0,0 +1,134 @@
+"""Simulation sans fenêtre, sans son et sans limite de framerate.
+
+Lance des parties complètes pilotées par une source d'entrées scriptée, pour
+mesurer le débit brut de la simulation ou jouer des milliers de parties en lot:
+
+    python headless.py --mode lava --games 100 --frames 3600
+"""
+import os
+
+# Doit être défini avant le premier import de config (qui appelle pygame.init())
+os.environ.setdefault("CLOUD_JUMP_HEADLESS", "1")
+
+import argparse
+import math
+import random
+from config import ASSETS_DIR, SCREEN_WIDTH, GRAVITY, MAX_CHARGE, JUMP_HORIZONTAL_FACTOR, MAX_HORIZONTAL_DISTANCE
+from game_logic import Game
+from lava_game import LavaGame
+from ice_game import IceGame
+from replay import mouse_down, mouse_up
+
+DEFAULT_SKIN = os.path.join(ASSETS_DIR, "sprites", "frog", "Idle frog", "frog_idle0.png")
+
+GAME_MODES = {
+    "normal": Game,
+    "lava": LavaGame,
+    "ice": IceGame
+}
+
+
+class ScriptedInput:
+    """Source d'entrées rejouant une liste fixe de (frame, événement)."""
+
+    def __init__(self, script):
+        self.events = {}
+        for frame, event in script:
+            self.events.setdefault(frame, []).append(event)
+
+    def get_events(self, game, frame):
+        """Renvoyer les événements prévus pour ce pas de simulation."""
+        return self.events.get(frame, ())
+
+    @classmethod
+    def periodic_jumps(cls, frames, period=40, charge_frames=25, seed=None):
+        """Script de sauts réguliers vers des positions horizontales aléatoires."""
+        rng = random.Random(seed)
+        script = []
+        for start in range(1, frames, period):
+            script.append((start, mouse_down()))
+            script.append((start + charge_frames, mouse_up(rng.randint(0, SCREEN_WIDTH))))
+        return cls(script)
+
+
+class JumpBot:
+    """Source d'entrées qui vise la plateforme la plus proche au-dessus du joueur."""
+
+    def __init__(self, margin=30):
+        self.margin = margin  # Hauteur supplémentaire visée au-dessus de la plateforme
+        self.target_charge = 0
+        self.target_x = 0
+
+    def get_events(self, game, frame):
+        """Charger puis relâcher un saut calculé à partir de l'état courant de la partie."""
+        player = game.player
+        if player.charging:
+            if player.charge >= self.target_charge:
+                return (mouse_up(self.target_x),)
+            return ()
+
+        if player.on_ground and not player.jumping and self.aim(game):
+            return (mouse_down(),)
+        return ()
+
+    def aim(self, game):
+        """Choisir la plateforme cible, la charge et la position de relâchement. Renvoie False sans cible."""
+        player = game.player
+        feet = player.y + player.size
+        above = [p for p in game.platforms if p.y < feet - 10]
+        if not above:
+            return False
+        target = max(above, key=lambda p: p.y)
+
+        # Vitesse verticale pour dépasser la plateforme de self.margin : v² = 2·G·h
+        height = feet - target.y + self.margin
+        charge = min(math.ceil(math.sqrt(2 * GRAVITY * height)), MAX_CHARGE)
+
+        # Durée du vol jusqu'à la plateforme (montée puis descente), pour régler la vitesse horizontale
+        v = charge - GRAVITY / 2
+        discriminant = v * v - 2 * GRAVITY * (feet - target.y)
+        flight_frames = (v + math.sqrt(max(discriminant, 0))) / GRAVITY
+
+        player_center = player.x + player.size // 2
+        dx = (target.x + target.width / 2) - player_center
+        release_dx = dx / (max(flight_frames, 1) * JUMP_HORIZONTAL_FACTOR)
+        release_dx = max(min(release_dx, MAX_HORIZONTAL_DISTANCE), -MAX_HORIZONTAL_DISTANCE)
+
+        self.target_charge = charge
+        self.target_x = player_center + release_dx
+        return True
+
+
+def run_batch(mode, games, max_frames, render=False, seed=None):
+    """Jouer plusieurs parties d'un mode et renvoyer les résultats de chacune (graines seed, seed + 1, ...)."""
+    results = []
+    for index in range(games):
+        game = GAME_MODES[mode](player_skin_path=DEFAULT_SKIN, seed=None if seed is None else seed + index)
+        results.append(game.run_headless(max_frames, JumpBot(), render=render))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simuler des parties sans fenêtre ni limite de framerate.")
+    parser.add_argument("--mode", choices=sorted(GAME_MODES), default="normal")
+    parser.add_argument("--games", type=int, default=1, help="Nombre de parties à simuler")
+    parser.add_argument("--frames", type=int, default=3600, help="Pas de simulation maximum par partie")
+    parser.add_argument("--render", action="store_true", help="Dessiner chaque pas hors champ")
+    parser.add_argument("--seed", type=int, help="Graine de la première partie (aléatoire par défaut)")
+    args = parser.parse_args()
+
+    results = run_batch(args.mode, args.games, args.frames, render=args.render, seed=args.seed)
+    for index, result in enumerate(results):
+        print(f"Game {index}: {result['frames']} frames, score {result['score']}, "
+              f"game over {result['game_over']}, {result['fps']:.0f} frames/s")
+
+    total_frames = sum(result["frames"] for result in results)
+    total_seconds = sum(result["seconds"] for result in results)
+    mean_score = sum(result["score"] for result in results) / len(results) if results else 0
+    fps = total_frames / total_seconds if total_seconds > 0 else 0.0
+    print(f"Total: {len(results)} games, {total_frames} frames in {total_seconds:.2f} s "
+          f"({fps:.0f} frames/s), mean score {mean_score:.1f}")
+
+
+if __name__ == "__main__":
+    main()
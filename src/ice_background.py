@@ -1,78 +1,96 @@
 import pygame
-import os
 import math
-from config import SCREEN_WIDTH, SCREEN_HEIGHT, ASSETS_DIR, BG_ASSETS_DIR
+from itertools import repeat
+import numpy as np
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, SNOW_PARTICLE_COUNT, PHYSICS_DT, PHYSICS_HZ
 from background_manager import BackgroundBase
 
-class IceParticle:
-    """Classe pour les particules de neige qui tombent en arrière-plan"""
-    def __init__(self, x, y, scale=1.0):
-        self.x = x
-        self.y = y
-        self.scale = scale
-        self.fall_speed = 1 + scale  # Les particules plus grandes tombent plus vite
-        self.drift_speed = 0.2 + 0.2 * scale  # Dérive horizontale
-        self.drift_offset = 0
-        self.drift_direction = 1 if pygame.time.get_ticks() % 2 == 0 else -1
-        self.size = int(3 * scale)
-        self.alpha = min(255, int(150 + scale * 100))
+# Vitesse de la phase de dérive horizontale des flocons, en radians par seconde
+SNOW_DRIFT_SPEED = 3.0
+
+class SnowField:
+    """Champ de particules de neige stocké dans des tableaux NumPy et mis à jour en une seule opération vectorisée"""
+    def __init__(self, count=SNOW_PARTICLE_COUNT, rng=None):
+        self.count = count
+        self.rng = rng if rng is not None else np.random.default_rng()
+        
+        # Taille aléatoire entre 0.5 et 2.0
+        scale = self.rng.uniform(0.5, 2.0, count)
+        
+        # Position, vitesse de chute et dérive horizontale de chaque particule
+        self.x = self.rng.uniform(0, SCREEN_WIDTH, count)
+        self.y = self.rng.uniform(0, SCREEN_HEIGHT, count)
+        # Vitesses en pixels par seconde : les plus grandes particules tombent plus vite
+        self.fall_speed = (1 + scale) * PHYSICS_HZ
+        self.drift_speed = (0.2 + 0.2 * scale) * PHYSICS_HZ  # Dérive horizontale
+        self.drift_direction = self.rng.choice((-1.0, 1.0), count)
+        self.drift_offset = self.rng.uniform(0, 2 * math.pi, count)  # Phase de dérive
+        
+        # Regrouper les particules par taille pour dessiner chaque groupe avec une image partagée
+        sizes = np.maximum(1, (3 * scale).astype(np.int32))
+        order = np.argsort(sizes, kind="stable")
+        for name in ("x", "y", "fall_speed", "drift_speed", "drift_direction", "drift_offset"):
+            setattr(self, name, getattr(self, name)[order])
+        sizes = sizes[order]
         
-        # Créer l'image de la particule
-        self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, (255, 255, 255, self.alpha), (self.size//2, self.size//2), self.size//2)
+        self.buckets = []
+        for size in np.unique(sizes):
+            indices = np.nonzero(sizes == size)[0]
+            self.buckets.append((self.create_particle_image(int(size)), indices[0], indices[-1] + 1))
     
-    def update(self):
-        """Mettre à jour la position de la particule"""
-        # Faire tomber la particule
-        self.y += self.fall_speed
+    @staticmethod
+    def create_particle_image(size):
+        """Créer l'image partagée par toutes les particules d'une même taille"""
+        alpha = min(255, int(150 + size / 3 * 100))
+        image = pygame.Surface((size, size), pygame.SRCALPHA)
+        if size < 3:
+            # Trop petit pour un cercle : un point plein
+            image.fill((255, 255, 255, alpha))
+        else:
+            pygame.draw.circle(image, (255, 255, 255, alpha), (size//2, size//2), size//2)
+        return image
+    
+    def update(self, dt=PHYSICS_DT):
+        """Avancer toutes les particules de dt secondes"""
+        # Faire tomber les particules
+        self.y += self.fall_speed * dt
         
         # Appliquer une dérive horizontale
-        self.drift_offset += 0.05
-        self.x += self.drift_direction * self.drift_speed * math.sin(self.drift_offset)
+        self.drift_offset += SNOW_DRIFT_SPEED * dt
+        self.x += self.drift_direction * self.drift_speed * dt * np.sin(self.drift_offset)
         
-        # Si la particule sort de l'écran, la replacer en haut
-        if self.y > SCREEN_HEIGHT:
-            self.y = -10
-            self.x = pygame.time.get_ticks() % SCREEN_WIDTH
+        # Replacer en haut les particules sorties de l'écran
+        fallen = self.y > SCREEN_HEIGHT
+        fallen_count = int(np.count_nonzero(fallen))
+        if fallen_count:
+            self.y[fallen] = -10
+            self.x[fallen] = self.rng.uniform(0, SCREEN_WIDTH, fallen_count)
     
-    def draw(self, screen):
-        """Dessiner la particule"""
-        screen.blit(self.image, (int(self.x), int(self.y)))
+    def draw(self, screen, culler=None):
+        """Dessiner les particules, un appel blits par groupe de taille (sans celles hors de l'écran si un culler est fourni)"""
+        xs = self.x.astype(np.int32)
+        ys = self.y.astype(np.int32)
+        for image, start, end in self.buckets:
+            bucket_x = xs[start:end]
+            bucket_y = ys[start:end]
+            if culler:
+                size = image.get_width()
+                visible = culler.visible_mask("snow", bucket_x, bucket_y, size, size, screen_space=True)
+                bucket_x = bucket_x[visible]
+                bucket_y = bucket_y[visible]
+            screen.blits(zip(repeat(image), zip(bucket_x.tolist(), bucket_y.tolist())), doreturn=False)
 
 class IceBackground(BackgroundBase):
     """Classe pour gérer le fond de glace avec des particules de neige"""
-    def __init__(self):
+    def __init__(self, particle_count=SNOW_PARTICLE_COUNT, seed=None):
         # Initialiser la classe parente
         super().__init__()
         
-        # Charger l'image de fond de glace
-        try:
-            # Utiliser l'image spécifique pour le mode glace
-            bg_path = os.path.join(BG_ASSETS_DIR, "Ice_background", "ice_background.jpg")
-            print(f"Chargement du fond spécifique: {bg_path}")
-            
-            # Utiliser la méthode de la classe de base pour charger l'image
-            bg_image = self.load_image(bg_path)
-            
-            if bg_image:
-                # Utiliser directement l'image de fond de glace sans teinte additionnelle
-                # Utiliser la méthode de la classe de base pour redimensionner l'image
-                self.background = self.scale_background(bg_image)
-            else:
-                raise FileNotFoundError(f"Fichier ice_background.jpg introuvable dans {BG_ASSETS_DIR}/Ice_background")
-                
-        except Exception as e:
-            print(f"Erreur lors du chargement du fond: {e}")
-            # Utiliser la méthode de la classe de base pour créer un fond de secours
-            self.background = self.create_fallback_background((200, 230, 255))  # Bleu très clair pour indiquer un mode glace
+        # Charger l'image de fond de glace (sans teinte additionnelle), fond bleu très clair de secours
+        self.background = self.load_background("background/ice", (200, 230, 255))
         
-        # Créer des particules de neige
-        self.snow_particles = []
-        for _ in range(10000):  # Nombre de particules
-            x = pygame.time.get_ticks() % SCREEN_WIDTH
-            y = pygame.time.get_ticks() % SCREEN_HEIGHT
-            scale = 0.5 + 1.5 * pygame.time.get_ticks() % 100 / 100  # Taille aléatoire entre 0.5 et 2.0
-            self.snow_particles.append(IceParticle(x, y, scale))
+        # Créer le champ de particules de neige
+        self.snow = SnowField(particle_count, np.random.default_rng(seed))
     
     def add_blue_tint(self, surface):
         """Ajouter une teinte bleue à une surface pour l'effet de glace"""
@@ -84,21 +102,24 @@ class IceBackground(BackgroundBase):
         tinted.blit(blue_overlay, (0, 0))
         return tinted
     
-    def update(self):
+    def update(self, dt=PHYSICS_DT):
         """Mettre à jour les particules de neige"""
-        for particle in self.snow_particles:
-            particle.update()
+        self.snow.update(dt)
+    
+    def get_dirty_rects(self):
+        """La neige couvre tout l'écran"""
+        return [pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)]
     
-    def draw(self, screen):
-        """Dessiner le fond et les particules de neige"""
+    def draw_static(self, surface):
+        """Dessiner le fond et le brouillard dans la composition statique"""
         # Dessiner le fond
-        screen.blit(self.background, (self.bg_x, self.bg_y))
+        surface.blit(self.background, (self.bg_x, self.bg_y))
         
         # Ajouter un léger overlay de brouillard
         fog = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
         fog.fill((220, 235, 255, 20))  # Bleu très clair presque blanc
-        screen.blit(fog, (0, 0))
-        
-        # Dessiner les particules de neige
-        for particle in self.snow_particles:
-            particle.draw(screen) 
\ No newline at end of file
+        surface.blit(fog, (0, 0))
+    
+    def draw_dynamic(self, screen, culler=None):
+        """Dessiner les particules de neige"""
+        self.snow.draw(screen, culler)
@@ -0,0 +1,126 @@
+"""Enveloppe des sauts du joueur : une plateforme est-elle atteignable depuis une autre ?
+
+L'enveloppe est calculée une seule fois en simulant, pas par pas, tous les sauts
+possibles avec la physique de Player.release_jump et Player.update : vitesse
+verticale -charge, gravité, vitesse de chute limitée, atterrissage quand les
+pieds tombent dans la bande PLATFORM_HEIGHT de la plateforme ou la traversent.
+
+Pour chaque écart vertical dy entre le dessus de la plateforme de départ et celui
+de la cible, elle retient le vol le plus long (en pas) qui peut se terminer sur
+la cible. La vitesse horizontale peut prendre n'importe quelle valeur jusqu'à son
+maximum : les écarts horizontaux atteignables à la hauteur dy sont donc tous
+ceux jusqu'à ce nombre de pas × cette vitesse. Tester un couple (dx, dy) revient
+à lire une case et faire une comparaison.
+
+La poussée SCROLL_LIFT (voir GameBase.update_camera) n'est pas simulée : elle
+dépend de la position de la caméra, pas des plateformes, et ne fait que
+rallonger les vols. L'enveloppe sans poussée reste donc une borne prudente.
+"""
+from functools import lru_cache
+import numpy as np
+from config import (
+    SCREEN_WIDTH, GRAVITY, MAX_CHARGE, CHARGE_RATE, PLAYER_SIZE, PLATFORM_HEIGHT,
+    JUMP_HORIZONTAL_FACTOR, MAX_HORIZONTAL_DISTANCE, PHYSICS_HZ, REACTION_TIME
+)
+
+# Vitesse de chute maximale du joueur (voir Player.update)
+MAX_FALL_SPEED = 15
+# Plus grand écart vertical, vers le bas, couvert par la table
+MAX_DROP = 800
+
+
+class JumpEnvelope:
+    """Vol le plus long atterrissant à chaque écart vertical, pour des charges jusqu'à max_charge."""
+
+    def __init__(self, max_charge=MAX_CHARGE):
+        # Toutes les charges que le joueur peut relâcher, CHARGE_RATE par pas
+        charges = np.arange(CHARGE_RATE, max_charge + CHARGE_RATE / 2, CHARGE_RATE)
+        max_rise = max_charge * max_charge / (2 * GRAVITY)
+        # Assez de pas pour monter, atteindre la vitesse de chute maximale et descendre jusqu'à MAX_DROP
+        steps = int((max_charge + MAX_FALL_SPEED) / GRAVITY + (max_rise + MAX_DROP) / MAX_FALL_SPEED) + 2
+
+        # Position des pieds après n pas (négatif = plus haut que le départ), comme Player.update
+        n = np.arange(1, steps + 1)
+        velocities = np.minimum(-charges[:, None] + GRAVITY * n, MAX_FALL_SPEED)
+        heights = np.cumsum(velocities, axis=1)
+
+        self.top = -int(np.ceil(max_rise)) - 1
+        dy = np.arange(self.top, MAX_DROP + 1)
+        best = np.full(len(dy), -1)
+        for charge_heights, charge_velocities in zip(heights, velocities):
+            # Le joueur ne peut atterrir qu'en tombant ; en tombant, ses pieds ne font que descendre
+            first = int(np.argmax(charge_velocities > 0))
+            falling = charge_heights[first:]
+            before = np.concatenate(([charge_heights[first - 1] if first else 0.0], falling))
+            # Premier pas de chute où les pieds ont dépassé le bas de la bande de la cible
+            below = np.searchsorted(falling, dy + PLATFORM_HEIGHT, side="right")
+            # Dernier pas d'atterrissage possible (le joueur peut ne recouvrir la cible qu'à la fin) :
+            # le dernier pas dans la bande, sinon le pas qui traverse la bande d'un coup
+            in_band = (below > 0) & (falling[np.maximum(below - 1, 0)] >= dy)
+            crossing = ~in_band & (below < len(falling)) & (before[below] <= dy)
+            landing = first + np.where(in_band, below - 1, below)
+            # Numéro de pas (à partir de 1) de l'atterrissage
+            best = np.maximum(best, np.where(in_band | crossing, landing + 1, -1))
+
+        # Distance horizontale maximale par écart vertical, à pleine vitesse horizontale
+        self.max_speed = MAX_HORIZONTAL_DISTANCE * JUMP_HORIZONTAL_FACTOR
+        self.reach = [float(s) * self.max_speed if s > 0 else -1.0 for s in best]
+
+        # Plus grande montée telle que toutes les hauteurs de 0 à -safe_rise soient atteignables à la verticale
+        ground = -self.top
+        self.safe_rise = next((ground - row - 1 for row in range(ground, -1, -1) if self.reach[row] < 0), ground)
+
+    def reachable(self, dx, dy, speed_factor=1.0):
+        """
+        Indiquer si le joueur peut parcourir dx pixels horizontalement en atterrissant dy pixels plus bas.
+
+        Args:
+            dx (float): Distance horizontale à parcourir
+            dy (float): Dessus de la cible moins dessus du départ (négatif = plus haut)
+            speed_factor (float): Part de la vitesse horizontale conservée au décollage
+        """
+        row = int(np.floor(dy)) - self.top
+        if row < 0:
+            return False
+        return self.reach[min(row, len(self.reach) - 1)] * speed_factor >= abs(dx)
+
+
+@lru_cache(maxsize=None)
+def get_envelope(max_charge=MAX_CHARGE):
+    """Renvoyer l'enveloppe pour une charge maximale, calculée une seule fois."""
+    return JumpEnvelope(max_charge)
+
+
+def get_launch_envelope(platform_class):
+    """Renvoyer l'enveloppe des sauts possibles depuis une plateforme de cette classe."""
+    break_time = getattr(platform_class, "break_time", None)
+    if break_time is None:
+        return get_envelope(MAX_CHARGE)
+    # Plateforme cassable : le saut doit être chargé, après un temps de réaction, avant qu'elle ne casse
+    # (CHARGE_RATE est ajouté une fois par pas : voir PHYSICS_HZ dans config.py)
+    charge_steps = max(1, int((break_time - REACTION_TIME) * PHYSICS_HZ))
+    return get_envelope(min(MAX_CHARGE, charge_steps * CHARGE_RATE))
+
+
+def travel_needed(source_x, source_width, target_x, target_width):
+    """Distance horizontale à parcourir pour recouvrir la cible depuis la pire position sur le départ."""
+    # Bord gauche du joueur quand il recouvre une plateforme, dans les limites de l'écran
+    low = max(source_x - PLAYER_SIZE + 1, 0)
+    high = min(source_x + source_width - 1, SCREEN_WIDTH - PLAYER_SIZE)
+    return max(target_x - PLAYER_SIZE + 1 - low, high - (target_x + target_width - 1), 0)
+
+
+def can_reach(source, target):
+    """
+    Indiquer si la cible est atteignable depuis le départ, quelle que soit la phase des plateformes mobiles.
+
+    Args:
+        source, target (tuple): (classe, x, y, largeur, amplitude) d'une plateforme, y étant
+            sa hauteur de repos et amplitude son déplacement vertical (0 si elle ne bouge pas)
+    """
+    source_class, source_x, source_y, source_width, source_amplitude = source
+    target_class, target_x, target_y, target_width, target_amplitude = target
+    # Pire cas : départ au plus bas de sa course, cible au plus haut de la sienne
+    dy = (target_y - target_amplitude) - (source_y + source_amplitude)
+    dx = travel_needed(source_x, source_width, target_x, target_width)
+    return get_launch_envelope(source_class).reachable(dx, dy, source_class.friction)
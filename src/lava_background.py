@@ -1,7 +1,8 @@
 import pygame
 import os
-from config import SCREEN_WIDTH, SCREEN_HEIGHT, ASSETS_DIR, BG_ASSETS_DIR
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, PHYSICS_DT
 from background_manager import BackgroundBase
+from asset_manager import asset_manager
 import random
 import math
 
@@ -17,35 +18,8 @@ class FireBall:
         self.frames = []
         
         try:
-            # Charger le sprite IdleLoop-Sheet.png
-            sprite_path = os.path.join(BG_ASSETS_DIR, "Lava_background", "IdleLoop-Sheet.png")
-            if os.path.exists(sprite_path):
-                # Charger l'image
-                spritesheet = pygame.image.load(sprite_path).convert_alpha()
-                
-                # IdleLoop-Sheet.png contient 4 frames pour l'animation de fireball
-                # Taille de chaque frame dans la spritesheet
-                num_frames = 4  # Nombre de frames dans la spritesheet
-                frame_width = spritesheet.get_width() // num_frames
-                frame_height = spritesheet.get_height()
-                
-                # Découper chaque frame de la spritesheet
-                for i in range(num_frames):
-                    frame_rect = pygame.Rect(i * frame_width, 0, frame_width, frame_height)
-                    frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-                    frame.blit(spritesheet, (0, 0), frame_rect)
-                    
-                    # Redimensionner la frame selon l'échelle
-                    scaled_width = int(frame_width * self.scale)
-                    scaled_height = int(frame_height * self.scale)
-                    scaled_frame = pygame.transform.scale(frame, (scaled_width, scaled_height))
-                    
-                    # Ajouter à la liste des frames
-                    self.frames.append(scaled_frame)
-                
-                print(f"Animation de fireball chargée avec succès: {num_frames} frames de {frame_width}x{frame_height}, échelle: {self.scale}")
-            else:
-                raise FileNotFoundError(f"Fichier IdleLoop-Sheet.png introuvable dans {BG_ASSETS_DIR}/Lava_background")
+            # Frames découpées et redimensionnées une seule fois par échelle, partagées entre les boules de feu
+            self.frames = list(asset_manager.get_or_create(("fireball_frames", self.scale), self.build_frames))
         except Exception as e:
             print(f"Erreur lors du chargement du sprite fireball: {e}")
             # Créer un sprite de secours rouge
@@ -55,15 +29,44 @@ class FireBall:
             scaled_fallback = pygame.transform.scale(fallback, (int(fallback_size * self.scale), int(fallback_size * self.scale)))
             self.frames.append(scaled_fallback)
     
-    def update(self):
+    def build_frames(self):
+        """Découper les frames de IdleLoop-Sheet.png et les redimensionner selon l'échelle"""
+        sheet_width, sheet_height = asset_manager.image_size("background/fireball")
+        
+        # IdleLoop-Sheet.png contient 4 frames pour l'animation de fireball
+        # Taille de chaque frame dans la spritesheet
+        num_frames = 4  # Nombre de frames dans la spritesheet
+        frame_width = sheet_width // num_frames
+        frame_height = sheet_height
+        
+        # Redimensionner la spritesheet entière selon l'échelle (relue du cache disque si possible)
+        scaled_width = int(frame_width * self.scale)
+        scaled_height = int(frame_height * self.scale)
+        spritesheet = asset_manager.scaled("background/fireball", (scaled_width * num_frames, scaled_height))
+        
+        # Découper chaque frame de la spritesheet (sous-surfaces, sans copie des pixels)
+        frames = []
+        for i in range(num_frames):
+            frame_rect = pygame.Rect(i * scaled_width, 0, scaled_width, scaled_height)
+            frames.append(spritesheet.subsurface(frame_rect))
+        
+        print(f"Animation de fireball chargée avec succès: {num_frames} frames de {frame_width}x{frame_height}, échelle: {self.scale}")
+        return tuple(frames)
+    
+    def update(self, dt=PHYSICS_DT):
         """Mettre à jour l'animation"""
         # Si nous avons plusieurs frames, faire l'animation
         if len(self.frames) > 1:
-            self.animation_timer += 1/60  # 60 FPS
+            self.animation_timer += dt
             if self.animation_timer >= self.animation_speed:
                 self.animation_timer = 0
                 self.frame = (self.frame + 1) % len(self.frames)
     
+    def get_bounds(self):
+        """Renvoyer (x, y, largeur, hauteur) de la frame courante, à l'écran"""
+        width, height = self.frames[self.frame].get_size() if self.frames else (0, 0)
+        return self.x, self.y, width, height
+    
     def draw(self, screen):
         """Dessiner la boule de feu"""
         if self.frames:
@@ -78,23 +81,20 @@ class LavaAnimation:
         self.y = y
         self.scale = scale
 
-        # Charge les frames de l'animation
-        sprites_dir = os.path.join(BG_ASSETS_DIR, "Lava_background")
+        # Charge les frames de l'animation, redimensionnées à la largeur de l'écran une seule fois
         for i in range(5):  # 5 frames: lava_animation0.png à lava_animation4.png
-            path = os.path.join(sprites_dir, f"lava_animation{i}.png")
-            if os.path.exists(path):
-                img = pygame.image.load(path).convert_alpha()
-                height = int(img.get_height() * self.scale)
-                img = pygame.transform.scale(img, (SCREEN_WIDTH, height))
-                self.frames.append(img)
+            name = f"background/lava_flow{i}"
+            if os.path.exists(asset_manager.resolve(name)):
+                height = int(asset_manager.image_size(name)[1] * self.scale)
+                self.frames.append(asset_manager.scaled(name, (SCREEN_WIDTH, height)))
         if not self.frames:
             # Fallback
             surf = pygame.Surface((SCREEN_WIDTH, 40))
             surf.fill((255, 80, 0))
             self.frames = [surf]
 
-    def update(self):
-        self.animation_timer += 1/60
+    def update(self, dt=PHYSICS_DT):
+        self.animation_timer += dt
         if self.animation_timer >= self.animation_speed:
             self.animation_timer = 0
             self.frame = (self.frame + 1) % len(self.frames)
@@ -111,20 +111,7 @@ class LavaBackground(BackgroundBase):
         super().__init__()
         
         # Charger l'image de fond de lave
-        try:
-            bg_path = os.path.join(BG_ASSETS_DIR, "Lava_background", "background_lava_mode.jpg")
-            print(f"Chargement du fond spécifique: {bg_path}")
-            
-            bg_image = self.load_image(bg_path)
-            
-            if bg_image:
-                self.background = self.scale_background(bg_image)
-            else:
-                raise FileNotFoundError(f"Fichier background_lava_mode.jpg introuvable dans {BG_ASSETS_DIR}/Lava_background")
-                
-        except Exception as e:
-            print(f"Erreur lors du chargement du fond: {e}")
-            self.background = self.create_fallback_background((100, 0, 0))
+        self.background = self.load_background("background/lava", (100, 0, 0))
         
         # Créer les 2 boules de feu dans les coins du bas
         fireball_scale = 3.0
@@ -153,20 +140,30 @@ class LavaBackground(BackgroundBase):
             lava_height = 40
         self.lava_anim = LavaAnimation(SCREEN_HEIGHT - lava_height, scale=1.0)  # Plus de décalage, position exacte en bas
     
-    def update(self):
+    def update(self, dt=PHYSICS_DT):
         """Mettre à jour les animations des boules de feu et de la lave"""
         for fireball in self.fireballs:
-            fireball.update()
-        self.lava_anim.update()
+            fireball.update(dt)
+        self.lava_anim.update(dt)
     
-    def draw(self, screen):
-        """Dessiner le fond, la lave animée et les boules de feu"""
-        # Dessiner le fond
-        screen.blit(self.background, (self.bg_x, self.bg_y))
+    def get_dirty_rects(self):
+        """Renvoyer les zones de la lave animée et des boules de feu"""
+        rects = [self.lava_anim.frames[self.lava_anim.frame].get_rect(topleft=(0, self.lava_anim.y))]
+        for fireball in self.fireballs:
+            rects.append(fireball.frames[fireball.frame].get_rect(topleft=(fireball.x, fireball.y)))
+        return rects
+    
+    def draw_static(self, surface):
+        """Dessiner le fond dans la composition statique"""
+        surface.blit(self.background, (self.bg_x, self.bg_y))
+    
+    def draw_dynamic(self, screen, culler=None):
+        """Dessiner la lave animée et les boules de feu"""
         # Dessiner l'animation de lave en bas
         self.lava_anim.draw(screen)
-        # Dessiner les boules de feu
-        for fireball in self.fireballs:
+        # Dessiner les boules de feu (seulement celles à l'écran si un culler est fourni)
+        fireballs = culler.visible("effects", self.fireballs, screen_space=True) if culler else self.fireballs
+        for fireball in fireballs:
             fireball.draw(screen)
     
     def draw_foreground(self, screen):
@@ -0,0 +1,212 @@
+"""Génération procédurale du niveau par tranches, à l'avance, dans un thread.
+
+ChunkBuilder tire des tranches de plateformes (et de pièces) de plus en plus
+haut, depuis son propre générateur aléatoire seedé. Le type de chaque
+plateforme est tiré dans une table de poids cumulés calculée une seule fois
+par pas de difficulté. La difficulté et l'espacement dépendent de l'altitude
+de la plateforme (le score qu'aura le joueur quand elle entrera à l'écran),
+pas du moment où elle est tirée.
+
+LevelGenerator fait tourner un ChunkBuilder dans un thread qui garde quelques
+tranches d'avance dans une file : la boucle de jeu ne fait que prendre les
+tranches prêtes. Le contenu ne dépend que de la graine, jamais de la vitesse
+du thread.
+
+Chaque plateforme doit être atteignable depuis la précédente (voir
+jump_envelope.py) : sinon sa position x est retirée, puis elle est rapprochée
+de la précédente, en nombre d'essais limité.
+"""
+import bisect
+import itertools
+import queue
+import random
+import threading
+import weakref
+from config import (
+    SCREEN_WIDTH, PLATFORM_WIDTH, PLATFORM_SPACING, PLATFORM_HEIGHT, PLAYER_SIZE, SCORE_DISTANCE, DIFFICULTY_STEP,
+    GENERATION_CHUNK_SIZE, GENERATION_QUEUE_SIZE, GENERATION_RETRIES, THREADED_GENERATION
+)
+from jump_envelope import can_reach, get_launch_envelope
+
+# Essais de placement d'une plateforme : les nouveaux tirages de x, la verticale de la
+# précédente, puis assez de pas de PLATFORM_HEIGHT pour couvrir l'espacement maximal
+PLACEMENT_ATTEMPTS = GENERATION_RETRIES + 1 + PLATFORM_SPACING * 2 // PLATFORM_HEIGHT
+
+
+def make_table(weights):
+    """Construire (classes, poids cumulés) à partir de ((classe, poids), ...)."""
+    classes = [cls for cls, _ in weights]
+    cumulative = list(itertools.accumulate(weight for _, weight in weights))
+    return classes, cumulative
+
+
+class ChunkBuilder:
+    """Tire les tranches successives du niveau, de bas en haut."""
+
+    def __init__(self, platform_weights, seed, first_y, score_offset=0, coin_chance=0.0,
+                 opening_weights=None, opening_count=0, chunk_size=GENERATION_CHUNK_SIZE, platform_width=PLATFORM_WIDTH,
+                 start=None):
+        """
+        Args:
+            platform_weights (callable): Difficulté -> ((classe de plateforme, poids), ...).
+                Appelé depuis le thread : ne doit pas lire l'état de la partie
+            seed (int): Graine du générateur aléatoire des tranches
+            first_y (float): Hauteur monde de la première plateforme
+            score_offset (int): Score de départ de la partie
+            coin_chance (float): Probabilité d'une pièce sur une plateforme qui ne bouge pas
+            opening_weights: Poids fixes des opening_count premières plateformes
+            chunk_size (int): Nombre de plateformes par tranche
+            platform_width (int): Largeur des plateformes
+            start (tuple): (classe, x, y, largeur) de la plateforme de départ, d'où la première doit être atteignable
+        """
+        self.rng = random.Random(seed)
+        self.platform_weights = platform_weights
+        self.next_y = first_y
+        self.score_offset = score_offset
+        self.coin_chance = coin_chance
+        self.opening_table = make_table(opening_weights) if opening_weights else None
+        self.opening_count = opening_count if opening_weights else 0
+        self.chunk_size = chunk_size
+        self.platform_width = platform_width
+        self.count = 0
+        self.tables = {}
+        # (classe, x, y, largeur, amplitude) de la dernière plateforme tirée
+        self.previous = start + (0,) if start else None
+        self.rejected = 0  # Positions retirées car hors de portée
+
+    def score_at(self, y):
+        """Score du joueur quand la hauteur y arrive en haut de l'écran (la caméra part de y = 0)."""
+        return self.score_offset + max(0.0, -y) / SCORE_DISTANCE
+
+    def get_table(self, step):
+        """Renvoyer la table de tirage du pas de difficulté step, calculée une seule fois."""
+        table = self.tables.get(step)
+        if table is None:
+            # Même formule que GameBase.update_camera, arrondie au pas inférieur
+            table = self.tables[step] = make_table(self.platform_weights(1.0 + step * DIFFICULTY_STEP / 500))
+        return table
+
+    def build_chunk(self):
+        """
+        Tirer la tranche suivante.
+
+        Returns:
+            tuple: (plateformes en (classe, arguments de spawn), pièces en (x, y), hauteur de la plus haute plateforme)
+        """
+        rng = self.rng
+        width = self.platform_width
+        platforms = []
+        coins = []
+        for _ in range(self.chunk_size):
+            y = self.next_y
+            score = self.score_at(y)
+            if self.count < self.opening_count:
+                classes, cumulative = self.opening_table
+            else:
+                classes, cumulative = self.get_table(int(score // DIFFICULTY_STEP))
+
+            x = rng.randint(20, SCREEN_WIDTH - width)
+            cls = classes[bisect.bisect_right(cumulative, rng.random() * cumulative[-1])]
+            # Mouvement tiré ici aussi, pour que l'apparition ne consomme plus d'aléatoire
+            motion = cls.random_motion(rng) if cls.is_moving else None
+            amplitude = motion[0] if motion else 0
+            x, y = self.place(cls, x, y, amplitude)
+            self.previous = (cls, x, y, width, amplitude)
+            if motion:
+                platforms.append((cls, (x, y, width, None, motion)))
+            else:
+                platforms.append((cls, (x, y, width)))
+                # Pièce centrée au-dessus de la plateforme (largeur de pièce = 30)
+                if self.coin_chance and rng.random() < self.coin_chance:
+                    coins.append((x + width // 2 - 15, y - 40))
+
+            # Espacement croissant avec le score, limité pour éviter que le jeu devienne impossible
+            self.next_y = y - min(PLATFORM_SPACING + int(score / 100) * 5, PLATFORM_SPACING * 2)
+            self.count += 1
+        return platforms, coins, y
+
+    def place(self, cls, x, y, amplitude):
+        """Renvoyer une position (x, y) atteignable depuis la plateforme précédente, proche de celle tirée."""
+        width = self.platform_width
+        previous = self.previous
+        if not previous:
+            return x, y
+        source_class, previous_x, previous_y, _, previous_amplitude = previous
+        # Jamais plus bas que ce que permet le joueur debout sur la précédente, sans s'y cogner la tête
+        lowest = previous_y - PLATFORM_HEIGHT - PLAYER_SIZE
+        y = min(y, lowest)
+        for retries in range(PLACEMENT_ATTEMPTS):
+            if can_reach(previous, (cls, x, y, width, amplitude)):
+                return x, y
+            self.rejected += 1
+            if retries < GENERATION_RETRIES:
+                x = self.rng.randint(20, SCREEN_WIDTH - width)
+            elif x != previous_x:
+                # À la verticale de la précédente, seul l'écart de hauteur compte encore
+                x = previous_x
+            elif y < lowest:
+                # Trop haut même à la verticale : rapprocher la plateforme
+                y = min(y + PLATFORM_HEIGHT, lowest)
+            else:
+                break
+        # Aucun essai atteignable : à la verticale de la précédente, à mi-hauteur de la montée que
+        # l'enveloppe garantit (pire cas des plateformes mobiles compris)
+        rise = get_launch_envelope(source_class).safe_rise // 2
+        return previous_x, min(previous_y + previous_amplitude + amplitude - rise, lowest)
+
+
+def produce_chunks(builder, chunks, stop):
+    """Boucle du thread : garder la file pleine jusqu'à l'arrêt du générateur."""
+    try:
+        while not stop.is_set():
+            chunk = builder.build_chunk()
+            while not stop.is_set():
+                try:
+                    chunks.put(chunk, timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
+    except Exception as e:
+        # Relancée par next_chunk() au lieu de laisser la boucle de jeu attendre pour rien
+        print(f"Log: level generation failed: {e}")
+        chunks.put(e)
+
+
+class LevelGenerator:
+    """Tranches de niveau préparées à l'avance par un thread, prises dans l'ordre par la boucle de jeu."""
+
+    def __init__(self, builder, threaded=THREADED_GENERATION, queue_size=GENERATION_QUEUE_SIZE):
+        self.builder = builder
+        self.chunks = queue.Queue(queue_size)
+        self.stop = threading.Event()
+        self.served = 0
+        self.stalls = 0  # Tranches pas encore prêtes quand la boucle de jeu les a demandées
+        self.thread = None
+        if threaded:
+            # Le thread ne référence pas le générateur : s'il est abandonné sans close(), le thread s'arrête aussi
+            self.thread = threading.Thread(target=produce_chunks, args=(builder, self.chunks, self.stop),
+                                           name="level-generator", daemon=True)
+            self.thread.start()
+            weakref.finalize(self, self.stop.set)
+
+    def next_chunk(self):
+        """Renvoyer la tranche suivante (voir ChunkBuilder.build_chunk), en l'attendant si elle n'est pas prête."""
+        self.served += 1
+        if self.thread is None:
+            return self.builder.build_chunk()
+        try:
+            chunk = self.chunks.get_nowait()
+        except queue.Empty:
+            self.stalls += 1
+            chunk = self.chunks.get()
+        if isinstance(chunk, Exception):
+            raise chunk
+        return chunk
+
+    def close(self):
+        """Arrêter le thread de génération."""
+        self.stop.set()
+
+    def get_stats(self):
+        """Renvoyer le nombre de tranches servies, d'attentes de la boucle de jeu et de positions retirées."""
+        return {"chunks": self.served, "stalls": self.stalls, "rejected": self.builder.rejected}
@@ -2,16 +2,17 @@ import pygame
 import os
 import sys
 from utils import create_pixel_text
+from asset_manager import asset_manager
 from background import Background
-from config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, ASSETS_DIR, WHITE, YELLOW, get_total_coins, BLACK, get_high_score, ORANGE, is_skin_unlocked, unlock_skin, spend_coins, add_coins
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, SHOW_PROFILER, ASSETS_DIR, WHITE, YELLOW, get_total_coins, BLACK, get_high_score, ORANGE, is_skin_unlocked, unlock_skin, spend_coins, add_coins
 from audio_manager import audio_manager
+from dirty_renderer import DirtyRectRenderer
+from profiler import FrameProfiler, ProfilerOverlay
 
 class Button:
     def __init__(self, x, y, width, height):
         # Charger les images des boutons
-        button_path = os.path.join(ASSETS_DIR, "Main menu", "Buttons")
-        self.normal_img = pygame.image.load(os.path.join(button_path, "Button_basic.png"))
-        self.pressed_img = pygame.image.load(os.path.join(button_path, "Button_pushed.png"))
+        self.normal_img = asset_manager.load("menu/button")
         
         # Conserver le ratio d'aspect original mais redimensionner à la taille demandée
         original_width = self.normal_img.get_width()
@@ -22,9 +23,9 @@ class Button:
         self.width = width
         self.height = int(width / aspect_ratio) if width > 0 else original_height
         
-        # Redimensionner les deux sprites
-        self.normal_img = pygame.transform.scale(self.normal_img, (self.width, self.height))
-        self.pressed_img = pygame.transform.scale(self.pressed_img, (self.width, self.height))
+        # Redimensionner les deux sprites (une seule fois par taille, partagés ensuite)
+        self.normal_img = asset_manager.scaled("menu/button", (self.width, self.height))
+        self.pressed_img = asset_manager.scaled("menu/button_pushed", (self.width, self.height))
         
         # Centrer le bouton à la position demandée
         self.x = x - self.width // 2
@@ -79,10 +80,12 @@ class SkinButton:
         self.is_locked = is_locked
         self.price = price
         
-        # Load character skin image
+        # Load character skin image (None name = placeholder, scaled locally)
+        skin_name = image_path
         try:
-            self.original_image = pygame.image.load(image_path)
+            self.original_image = asset_manager.load(image_path)
         except pygame.error as e:
+            skin_name = None
             print(f"Warning: Could not load skin image at {image_path}: {e}")
             # Fallback to a placeholder surface if image loading fails
             self.original_image = pygame.Surface((50, 50)) # Default placeholder size
@@ -93,10 +96,9 @@ class SkinButton:
             self.original_image.blit(text_surface, text_rect)
 
         # Load cadre images
-        cadre_path = os.path.join(ASSETS_DIR, "sprites", "frog", "cadre")
         try:
-            self.normal_cadre = pygame.image.load(os.path.join(cadre_path, "cadre_skins.png"))
-            self.pushed_cadre = pygame.image.load(os.path.join(cadre_path, "cadre_skins_pushed.png"))
+            self.normal_cadre = asset_manager.load("menu/cadre")
+            self.pushed_cadre = asset_manager.load("menu/cadre_pushed")
         except pygame.error as e:
             print(f"Warning: Could not load cadre images: {e}")
             # Fallback to simple rectangles if cadre images fail to load
@@ -105,10 +107,11 @@ class SkinButton:
             
         # Load lock sprite if this skin is locked
         if self.is_locked:
-            lock_path = os.path.join(ASSETS_DIR, "Main menu", "Buttons", "lock_sprites.png")
+            lock_name = "menu/lock"
             try:
-                self.lock_sprite = pygame.image.load(lock_path)
+                self.lock_sprite = asset_manager.load(lock_name)
             except pygame.error as e:
+                lock_name = None
                 print(f"Warning: Could not load lock sprite: {e}")
                 # Create a basic lock placeholder
                 self.lock_sprite = pygame.Surface((30, 30))
@@ -143,7 +146,11 @@ class SkinButton:
             img_width = img_height * img_aspect_ratio
         
         # Scale the character image to the calculated dimensions
-        self.image = pygame.transform.scale(self.original_image, (int(img_width), int(img_height)))
+        img_size = (int(img_width), int(img_height))
+        if skin_name:
+            self.image = asset_manager.scaled(skin_name, img_size)
+        else:
+            self.image = pygame.transform.scale(self.original_image, img_size)
         
         # For the cadre, make it larger (135% of original size)
         cadre_scale = 1.35  # Increased from 1.25 to 1.35
@@ -167,8 +174,8 @@ class SkinButton:
                 cadre_width = cadre_height * cadre_aspect
             
             # Scale the cadre images while preserving aspect ratio
-            self.normal_cadre = pygame.transform.scale(self.normal_cadre, (int(cadre_width), int(cadre_height)))
-            self.pushed_cadre = pygame.transform.scale(self.pushed_cadre, (int(cadre_width), int(cadre_height)))
+            self.normal_cadre = asset_manager.scaled("menu/cadre", (cadre_width, cadre_height))
+            self.pushed_cadre = asset_manager.scaled("menu/cadre_pushed", (cadre_width, cadre_height))
             
             # Update dimensions to match cadre size
             self.width = int(cadre_width)
@@ -198,18 +205,20 @@ class SkinButton:
             lock_scale = 0.20  # Reduced from 0.25 to 0.20
             lock_width = int(self.width * lock_scale)
             lock_height = int(lock_width * (self.lock_sprite.get_height() / self.lock_sprite.get_width()))
-            self.lock_sprite = pygame.transform.scale(self.lock_sprite, (lock_width, lock_height))
+            if lock_name:
+                self.lock_sprite = asset_manager.scaled(lock_name, (lock_width, lock_height))
+            else:
+                self.lock_sprite = pygame.transform.scale(self.lock_sprite, (lock_width, lock_height))
             
             # Load the coins image instead of creating text
-            coins_display_path = os.path.join(ASSETS_DIR, "Main menu", "Buttons", "20coin_display.png")
             try:
-                self.coins_image = pygame.image.load(coins_display_path)
+                self.coins_image = asset_manager.load("menu/price")
                 
                 # Scale up the coin image to make it bigger (2x original size)
                 coin_scale = 2.0  # Increased from 1.5 to 2.0
                 coin_width = int(self.coins_image.get_width() * coin_scale)
                 coin_height = int(self.coins_image.get_height() * coin_scale)
-                self.coins_image = pygame.transform.scale(self.coins_image, (coin_width, coin_height))
+                self.coins_image = asset_manager.scaled("menu/price", (coin_width, coin_height))
                 
                 # Position it to overlap with the bottom part of the cadre
                 self.coins_image_rect = self.coins_image.get_rect(
@@ -304,12 +313,12 @@ class SoundButton:
     def __init__(self, x, y):
         """Create a sound toggle button at the specified position (top-right corner)"""
         # Load the sound and nosound images
-        button_path = os.path.join(ASSETS_DIR, "Main menu", "Buttons")
-        
+        loaded = True
         try:
-            self.sound_on_img = pygame.image.load(os.path.join(button_path, "sound_logo.png"))
-            self.sound_off_img = pygame.image.load(os.path.join(button_path, "nosound_logo.png"))
+            self.sound_on_img = asset_manager.load("menu/sound_on")
+            self.sound_off_img = asset_manager.load("menu/sound_off")
         except pygame.error as e:
+            loaded = False
             print(f"Warning: Could not load sound button images: {e}")
             # Create fallback surfaces
             self.sound_on_img = pygame.Surface((32, 32))
@@ -329,8 +338,12 @@ class SoundButton:
         self.height = int(original_height * scale_factor)
         
         # Resize the images
-        self.sound_on_img = pygame.transform.scale(self.sound_on_img, (self.width, self.height))
-        self.sound_off_img = pygame.transform.scale(self.sound_off_img, (self.width, self.height))
+        if loaded:
+            self.sound_on_img = asset_manager.scaled("menu/sound_on", (self.width, self.height))
+            self.sound_off_img = asset_manager.scaled("menu/sound_off", (self.width, self.height))
+        else:
+            self.sound_on_img = pygame.transform.scale(self.sound_on_img, (self.width, self.height))
+            self.sound_off_img = pygame.transform.scale(self.sound_off_img, (self.width, self.height))
         
         # Set the position (top-right corner with 20px margin)
         self.x = x - self.width - 20
@@ -374,6 +387,14 @@ class MainMenu:
         pygame.display.set_caption("Cloud Jump - Main Menu")
         self.clock = pygame.time.Clock()
         
+        # Dirty-rect renderer (disabled by default, see DIRTY_RECT_RENDERING)
+        self.renderer = DirtyRectRenderer(self.screen)
+        
+        # Per-stage frame timing, shown with F3
+        self.profiler = FrameProfiler()
+        self.profiler_overlay = ProfilerOverlay(self.profiler)
+        self.show_profiler = SHOW_PROFILER
+        
         # Play menu theme music
         audio_manager.play_music("menu")
         
@@ -381,19 +402,19 @@ class MainMenu:
         self.sound_button = SoundButton(SCREEN_WIDTH, 0)
         
         # Charger les deux frames du logo pour l'animation
-        logo_path = os.path.join(ASSETS_DIR, "Main menu", "Logo", "Main Logo.png")
-        logo_second_frame_path = os.path.join(ASSETS_DIR, "Main menu", "Logo", "Main_ Logo_secondframe.png")
+        logo_names = ["menu/logo", "menu/logo2"]
         
         # Charger les deux images
         self.logo_frames = []
-        self.logo_frames.append(pygame.image.load(logo_path))
+        self.logo_frames.append(asset_manager.load(logo_names[0]))
         
         try:
-            self.logo_frames.append(pygame.image.load(logo_second_frame_path))
+            self.logo_frames.append(asset_manager.load(logo_names[1]))
         except pygame.error as e:
             print(f"Warning: Could not load second logo frame: {e}")
             # En cas d'erreur, dupliquer le premier frame comme fallback
             self.logo_frames.append(self.logo_frames[0])
+            logo_names[1] = logo_names[0]
         
         # Variables d'animation
         self.logo_animation_speed = 0.5  # Secondes par frame
@@ -404,7 +425,7 @@ class MainMenu:
         for i in range(len(self.logo_frames)):
             logo_width = min(SCREEN_WIDTH * 0.99, self.logo_frames[i].get_width() * 6.5)
             logo_height = logo_width * (self.logo_frames[i].get_height() / self.logo_frames[i].get_width())
-            self.logo_frames[i] = pygame.transform.scale(self.logo_frames[i], (int(logo_width), int(logo_height)))
+            self.logo_frames[i] = asset_manager.scaled(logo_names[i], (logo_width, logo_height))
         
         # Positionner le logo
         self.logo_rect = self.logo_frames[0].get_rect(centerx=SCREEN_WIDTH//2, top=SCREEN_HEIGHT//30)
@@ -538,6 +559,56 @@ class MainMenu:
         else: # Handle case with no skins
             print("Warning: No skin buttons created.")
 
+    def get_dirty_rects(self):
+        """Return the screen regions that change without user input: animated background and logo."""
+        rects = self.background.get_dirty_rects() + [self.logo_rect]
+        if self.show_profiler:
+            rects.append(self.profiler_overlay.rect)
+        return rects
+    
+    def draw_frame(self):
+        """Draw the menu, then the performance overlay if enabled."""
+        self.draw()
+        self.profiler.lap("draw")
+        if self.show_profiler:
+            self.profiler_overlay.draw(self.screen, self.clock.get_fps(), {})
+            self.profiler.lap("draw_overlay")
+    
+    def draw(self):
+        """Draw the whole menu on the screen."""
+        # Le fond couvre tout l'écran : pas besoin de l'effacer avant
+        self.background.draw(self.screen)
+
+        # Draw the current logo frame
+        self.screen.blit(self.logo_frames[self.current_logo_frame], self.logo_rect)
+
+        # Display total coins
+        total_coins = get_total_coins()
+        coin_text = create_pixel_text(f"Total Coins: {total_coins}", self.font, YELLOW)
+        coin_rect = coin_text.get_rect(centerx=SCREEN_WIDTH//2, top=self.logo_rect.bottom + 10)
+        self.screen.blit(coin_text, coin_rect)
+
+        # Display high scores
+        high_scores_y = coin_rect.bottom + 5  # Reduced from 10 to 5
+        high_score = get_high_score("normal")
+        score_text = create_pixel_text(f"High Score: {high_score}", self.font, ORANGE)
+        score_rect = score_text.get_rect(centerx=SCREEN_WIDTH//2, top=high_scores_y)
+        self.screen.blit(score_text, score_rect)
+
+        self.start_button.draw(self.screen)
+        self.lava_button.draw(self.screen)
+        self.ice_button.draw(self.screen)
+
+        # Draw the sound toggle button
+        self.sound_button.draw(self.screen)
+
+        # Disp"SKIN CHOICE"
+        if hasattr(self, 'skin_choice_text_surface'): # Check if it's initialized
+            self.screen.blit(self.skin_choice_text_surface, self.skin_choice_text_rect)
+
+        for skin_button in self.skin_buttons:
+            skin_button.draw(self.screen)
+
     def run(self):
         running = True
         # result will now be a dictionary: {"mode": "MODE_NAME", "skin": "path/to/skin.png"}
@@ -547,8 +618,12 @@ class MainMenu:
         while running and menu_outcome is None: # Loop until an outcome is determined
             # Get the time elapsed since last frame for animation timing
             delta_time = self.clock.tick(FPS) / 1000.0  # Convert to seconds
+            self.profiler.begin_frame()
             
             for event in pygame.event.get():
+                # Clicks and keys change buttons, texts or selection: redraw the whole menu
+                if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                    self.renderer.invalidate()
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -556,6 +631,8 @@ class MainMenu:
                     if event.key == pygame.K_ESCAPE:
                         pygame.quit()
                         sys.exit()
+                    elif event.key == pygame.K_F3:
+                        self.show_profiler = not self.show_profiler
                     elif event.key == pygame.K_c:  # Press 'C' to add coins for testing
                         add_coins(10)
                         print(f"Added 10 coins for testing. Total: {get_total_coins()}")
@@ -625,6 +702,7 @@ class MainMenu:
                                         self.selected_skin_path = skin_button.image_path
                                         print(f"Skin selected: {self.selected_skin_path}")
                                     break
+            self.profiler.lap("events")
             
             # Update the logo animation
             self.logo_animation_timer += delta_time
@@ -632,41 +710,12 @@ class MainMenu:
                 self.current_logo_frame = (self.current_logo_frame + 1) % len(self.logo_frames)
                 self.logo_animation_timer = 0
                 
-            self.background.update()
-            
-            self.screen.fill((0, 0, 0))
-            self.background.draw(self.screen)
-            
-            # Draw the current logo frame
-            self.screen.blit(self.logo_frames[self.current_logo_frame], self.logo_rect)
-            
-            # Display total coins
-            total_coins = get_total_coins()
-            coin_text = create_pixel_text(f"Total Coins: {total_coins}", self.font, YELLOW)
-            coin_rect = coin_text.get_rect(centerx=SCREEN_WIDTH//2, top=self.logo_rect.bottom + 10)
-            self.screen.blit(coin_text, coin_rect)
-            
-            # Display high scores
-            high_scores_y = coin_rect.bottom + 5  # Reduced from 10 to 5
-            high_score = get_high_score("normal")
-            score_text = create_pixel_text(f"High Score: {high_score}", self.font, ORANGE)
-            score_rect = score_text.get_rect(centerx=SCREEN_WIDTH//2, top=high_scores_y)
-            self.screen.blit(score_text, score_rect)
-            
-            self.start_button.draw(self.screen)
-            self.lava_button.draw(self.screen)
-            self.ice_button.draw(self.screen)
-
-            # Draw the sound toggle button
-            self.sound_button.draw(self.screen)
-
-            # Disp"SKIN CHOICE"
-            if hasattr(self, 'skin_choice_text_surface'): # Check if it's initialized
-                self.screen.blit(self.skin_choice_text_surface, self.skin_choice_text_rect)
-
-            for skin_button in self.skin_buttons:
-                skin_button.draw(self.screen)
+            self.background.update(delta_time)
+            self.profiler.lap("update")
             
-            pygame.display.flip()
+            # Dessiner et afficher (tout l'écran, ou seulement les zones modifiées si activé)
+            self.renderer.render(self.draw_frame, self.get_dirty_rects())
+            self.profiler.lap("present")
+            self.profiler.end_frame()
             
         return menu_outcome # Return the dictionary 
\ No newline at end of file
@@ -0,0 +1,113 @@
+import pygame
+from collections import OrderedDict
+
+
+class PixelFont:
+    """Pixel-art text renderer for one (font, color, scale_factor) combination.
+
+    Each character is rendered and pixelated once into a glyph atlas; strings
+    are then built by blitting the pre-baked glyphs where the font places them
+    in the whole string, so kerning is kept.
+    """
+
+    def __init__(self, font, color, scale_factor=3):
+        self.font = font
+        self.color = color
+        self.scale_factor = scale_factor
+        # Hauteur finale, alignée sur la grille de pixels comme le rendu d'origine
+        self.height = (font.get_height() // scale_factor) * scale_factor
+        self.glyphs = {}
+
+    def get_glyph(self, char):
+        """Return the pixelated surface of a character, baking it on first use."""
+        glyph = self.glyphs.get(char)
+        if glyph is None:
+            glyph = self.bake_glyph(char)
+            self.glyphs[char] = glyph
+        return glyph
+
+    def bake_glyph(self, char):
+        """Render a character and pixelate it by scaling down then up with nearest neighbour."""
+        base_surface = self.font.render(char, True, self.color)
+        width, height = base_surface.get_size()
+        small_size = (width // self.scale_factor, height // self.scale_factor)
+        final_size = (small_size[0] * self.scale_factor, small_size[1] * self.scale_factor)
+
+        if small_size[0] == 0 or small_size[1] == 0:
+            # Caractère trop fin pour la grille (espace étroit, etc.) : glyphe vide
+            surface = pygame.Surface(final_size, pygame.SRCALPHA)
+        else:
+            # pygame.transform.scale échantillonne au plus proche voisin, comme Image.NEAREST
+            small_surface = pygame.transform.scale(base_surface, small_size)
+            surface = pygame.transform.scale(small_surface, final_size)
+        return surface
+
+    def render(self, text):
+        """Build the pixelated surface for a full string from the glyph atlas."""
+        font = self.font
+        width = (font.size(text)[0] // self.scale_factor) * self.scale_factor
+
+        surface = pygame.Surface((width, self.height), pygame.SRCALPHA)
+        for i, char in enumerate(text):
+            # Position du caractère dans la chaîne entière (crénage compris), alignée sur la grille de pixels agrandis
+            x = font.size(text[:i])[0]
+            snapped_x = (x // self.scale_factor) * self.scale_factor
+            # BLEND_RGBA_MAX copie le glyphe sur le fond transparent sans l'assombrir
+            surface.blit(self.get_glyph(char), (snapped_x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        return surface
+
+
+class PixelTextRenderer:
+    """LRU of glyph atlases per (font, color, scale_factor) plus an LRU of fully rendered strings.
+
+    Menus and game modes create their own Font objects, so both caches are
+    bounded: atlases (and the fonts they keep alive) of finished screens fall out.
+    """
+
+    def __init__(self, max_strings=256, max_atlases=16):
+        self.atlases = OrderedDict()
+        self.strings = OrderedDict()
+        self.max_strings = max_strings
+        self.max_atlases = max_atlases
+
+    def get_atlas(self, font, color, scale_factor):
+        """Return the PixelFont for this combination, creating it on first use."""
+        key = (font, color, scale_factor)
+        atlas = self.atlases.get(key)
+        if atlas is not None:
+            self.atlases.move_to_end(key)
+            return atlas
+
+        atlas = PixelFont(font, color, scale_factor)
+        self.atlases[key] = atlas
+        if len(self.atlases) > self.max_atlases:
+            self.atlases.popitem(last=False)
+        return atlas
+
+    def render(self, text, font, color, scale_factor=3):
+        """
+        Return the pixelated surface for text, reusing a cached one when possible.
+
+        The returned surface is shared with later calls: blit it, never draw on it.
+        """
+        color = tuple(color)
+        key = (text, font, color, scale_factor)
+        surface = self.strings.get(key)
+        if surface is not None:
+            self.strings.move_to_end(key)
+            return surface
+
+        surface = self.get_atlas(font, color, scale_factor).render(text)
+        self.strings[key] = surface
+        if len(self.strings) > self.max_strings:
+            self.strings.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Forget every atlas and cached string."""
+        self.atlases.clear()
+        self.strings.clear()
+
+
+# Create a singleton instance
+pixel_text_renderer = PixelTextRenderer()
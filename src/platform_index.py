@@ -0,0 +1,84 @@
+from bisect import bisect_left, bisect_right
+from config import PLATFORM_HEIGHT
+
+
+class PlatformIndex:
+    """Plateformes triées par hauteur, pour ne tester que celles proches du joueur.
+
+    Les plateformes sont en coordonnées monde et ne bougent pas quand la caméra
+    défile : l'index ne change qu'à leur apparition et leur disparition. Une
+    plateforme mobile est indexée par toute la bande verticale que couvre son
+    mouvement.
+
+    query() renvoie les plateformes dans leur ordre d'ajout, qui est aussi
+    leur ordre dans la liste du jeu : le joueur atterrit donc sur la même
+    plateforme qu'avec un parcours complet de la liste.
+    """
+
+    # Marge de sécurité autour de chaque bande
+    MARGIN = 10
+
+    def __init__(self):
+        self.tops = []     # Haut de bande de chaque entrée, trié
+        self.entries = []  # (haut de bande, bas de bande, numéro d'ajout, plateforme), dans le même ordre
+        self.max_extent = 0.0
+        self.added = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get_band(self, platform):
+        """Bande verticale (haut, bas) occupée par la plateforme."""
+        if platform.is_moving:
+            top = platform.original_y - platform.amplitude
+            bottom = platform.original_y + platform.amplitude + PLATFORM_HEIGHT
+        else:
+            top = platform.y
+            bottom = platform.y + PLATFORM_HEIGHT
+        return top - self.MARGIN, bottom + self.MARGIN
+
+    def add(self, platform):
+        """Indexer une plateforme qui vient d'apparaître."""
+        top, bottom = self.get_band(platform)
+        self.max_extent = max(self.max_extent, bottom - top)
+        index = bisect_right(self.tops, top)
+        self.tops.insert(index, top)
+        self.entries.insert(index, (top, bottom, self.added, platform))
+        self.added += 1
+
+    def remove(self, platform):
+        """Retirer une plateforme de l'index (sa bande n'a pas changé depuis add)."""
+        top, _ = self.get_band(platform)
+        index = bisect_left(self.tops, top)
+        while index < len(self.entries):
+            if self.entries[index][3] is platform:
+                del self.tops[index]
+                del self.entries[index]
+                return
+            index += 1
+        # Position inattendue (plateforme déplacée à la main) : recherche complète
+        for index, entry in enumerate(self.entries):
+            if entry[3] is platform:
+                del self.tops[index]
+                del self.entries[index]
+                return
+
+    def clear(self):
+        """Vider l'index."""
+        self.tops.clear()
+        self.entries.clear()
+        self.max_extent = 0.0
+        self.added = 0
+
+    def query(self, top, bottom):
+        """
+        Renvoyer les plateformes dont la bande croise [top, bottom].
+
+        Le résultat peut contenir quelques plateformes de trop : l'appelant fait le test exact.
+        """
+        start = bisect_left(self.tops, top - self.max_extent)
+        end = bisect_right(self.tops, bottom)
+        found = [entry for entry in self.entries[start:end] if entry[1] >= top]
+        if len(found) > 1:
+            found.sort(key=lambda entry: entry[2])
+        return [entry[3] for entry in found]
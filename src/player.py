@@ -1,11 +1,15 @@
 import pygame
 import os
+from functools import lru_cache
+import numpy as np
 from config import (
     SCREEN_WIDTH, SCREEN_HEIGHT, BLUE, WHITE, YELLOW, RED,
     GRAVITY, MAX_CHARGE, CHARGE_RATE, 
     PLAYER_SIZE, JUMP_HORIZONTAL_FACTOR, MAX_HORIZONTAL_DISTANCE,
-    PLATFORM_HEIGHT, PROJECT_ROOT, ASSETS_DIR, ANIMATION_SPEED
+    PLATFORM_HEIGHT, PROJECT_ROOT, ASSETS_DIR, ANIMATION_SPEED, PHYSICS_DT
 )
+from utils import prepare_surface
+from asset_manager import asset_manager
 
 # Physics constants for projectile motion
 # GRAVITY = acceleration due to gravity (pixels/frame²)
@@ -24,6 +28,31 @@ from config import (
 #  x[n+1] = x[n] + vₓ[n]·DELTA_T
 #  y[n+1] = y[n] + vᵧ[n]·DELTA_T
 #  vᵧ[n+1] = vᵧ[n] + GRAVITY·DELTA_T
+#
+# Summing the discrete steps gives the closed form used for the trajectory preview:
+#  x[n] = x₀ + n·v₀ₓ
+#  y[n] = y₀ + n·v₀ᵧ + GRAVITY·n·(n+1)/2
+
+# Number of discrete time steps shown in the trajectory preview
+TRAJECTORY_STEPS = 50
+
+
+@lru_cache(maxsize=1024)
+def trajectory_offsets(charge, delta_x):
+    """
+    Return the (x, y) offsets of the first TRAJECTORY_STEPS trajectory points from the jump origin.
+
+    Vectorized closed form of the discrete integration loop, memoized by (charge, delta_x).
+    """
+    n = np.arange(1, TRAJECTORY_STEPS + 1, dtype=np.float64)
+    v_0x = delta_x * JUMP_HORIZONTAL_FACTOR
+    v_0y = -charge
+    x_offsets = n * v_0x
+    y_offsets = n * v_0y + GRAVITY * n * (n + 1) / 2
+    x_offsets.flags.writeable = False
+    y_offsets.flags.writeable = False
+    return x_offsets, y_offsets
+
 
 class Player:
     """Player character (frog) with jumping mechanics."""
@@ -44,6 +73,11 @@ class Player:
         self.friction = 0.85
         # Plateforme actuelle sur laquelle le joueur se trouve
         self.current_platform = None
+        # Rectangle de collision, mis à jour sur place par get_hitbox()
+        self.hitbox = pygame.Rect(0, 0, self.size, self.size)
+        # Aperçu de trajectoire mis en cache : entrées et rendu correspondant
+        self.trajectory_key = None
+        self.trajectory_render = None
         
         # Animation properties
         self.animation_timer = 0
@@ -128,16 +162,34 @@ class Player:
                 # Fallback: if an action sprite is missing, Player.draw will use the fallback color for that action
                 self.sprites[action_key] = None # Explicitly set to None
             
+        # Versions miroir de chaque frame, construites une seule fois au chargement du skin
+        self.build_mirrored_sprites()
+            
         # État d'animation actuel
         self.current_animation = 'idle'
         
+    def build_mirrored_sprites(self):
+        """Get the horizontally flipped version of every idle and action frame, shared between players."""
+        self.mirrored_sprites = {
+            'idle': [self.get_mirrored_sprite(sprite) for sprite in self.sprites['idle']]
+        }
+        for action_key in ('charge', 'jump', 'sliding'):
+            sprite = self.sprites[action_key]
+            self.mirrored_sprites[action_key] = self.get_mirrored_sprite(sprite) if sprite else None
+            
+    @staticmethod
+    def get_mirrored_sprite(sprite):
+        """Renvoyer le sprite retourné horizontalement, construit une seule fois par sprite partagé."""
+        # La clé garde une référence au sprite : elle ne peut pas désigner un autre sprite plus tard
+        return asset_manager.get_or_create(("player_sprite_mirrored", sprite),
+                                           lambda: pygame.transform.flip(sprite, True, False))
+
     def load_default_idle_sprites(self):
         """Loads the default idle animation sequence."""
         self.sprites['idle'] = [] # Clear any previous attempts
         self.idle_sequence = [0, 1, 2, 3, 2, 1] # Reset to default sequence
-        default_idle_folder = os.path.join(ASSETS_DIR, "sprites", "frog", "Idle frog")
         for i in range(4):
-            sprite_path = os.path.join(default_idle_folder, f"frog_idle{i}.png")
+            sprite_path = f"frog/idle{i}"
             loaded_sprite = self.load_sprite(sprite_path)
             if loaded_sprite: # Check if sprite loaded successfully
                  self.sprites['idle'].append(loaded_sprite)
@@ -153,47 +205,57 @@ class Player:
             self.idle_sequence = [0]
 
     def load_sprite(self, path):
-        """Charger un sprite et le redimensionner à la taille du joueur en préservant le ratio d'aspect."""
+        """Renvoyer un sprite à la taille du joueur, construit une seule fois par le gestionnaire d'images."""
         try:
-            sprite = pygame.image.load(path).convert_alpha()
-            
-            # Récupérer les dimensions originales
-            orig_width, orig_height = sprite.get_size()
-            aspect_ratio = orig_width / orig_height
-            
-            # Déterminer la nouvelle taille en préservant le ratio
-            if aspect_ratio > 1:  # Plus large que haut
-                new_width = self.size
-                new_height = int(self.size / aspect_ratio)
-            else:  # Plus haut que large ou carré
-                new_height = self.size
-                new_width = int(self.size * aspect_ratio)
-                
-            # Créer une surface avec de la transparence pour le sprite
-            scaled_sprite = pygame.transform.scale(sprite, (new_width, new_height))
-            
-            # Créer une surface carrée pour positionner le sprite centré
-            final_surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-            
-            # Positionner le sprite centré horizontalement, mais au bas de la surface
-            # pour qu'il touche bien la plateforme
-            x_offset = (self.size - new_width) // 2
-            y_offset = self.size - new_height  # Aligner en bas plutôt que centrer
-            final_surface.blit(scaled_sprite, (x_offset, y_offset))
-            
-            return final_surface
-            
+            return asset_manager.get_or_create(("player_sprite", asset_manager.resolve(path), self.size),
+                                               lambda: self.build_sprite(path))
         except Exception as e:
             print(f"Erreur lors du chargement du sprite {path}: {e}")
             # Créer une surface de fallback
             surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
             surface.fill(self.color)
             return surface
+            
+    def build_sprite(self, path):
+        """Redimensionner un sprite (nom logique ou chemin) à la taille du joueur en préservant le ratio d'aspect."""
+        # Récupérer les dimensions originales
+        orig_width, orig_height = asset_manager.image_size(path)
+        aspect_ratio = orig_width / orig_height
+        
+        # Déterminer la nouvelle taille en préservant le ratio
+        if aspect_ratio > 1:  # Plus large que haut
+            new_width = self.size
+            new_height = int(self.size / aspect_ratio)
+        else:  # Plus haut que large ou carré
+            new_height = self.size
+            new_width = int(self.size * aspect_ratio)
+            
+        # Redimensionner le sprite (relu du cache disque si possible)
+        scaled_sprite = asset_manager.scaled(path, (new_width, new_height))
+        
+        # Créer une surface carrée pour positionner le sprite centré
+        final_surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
+        
+        # Positionner le sprite centré horizontalement, mais au bas de la surface
+        # pour qu'il touche bien la plateforme
+        x_offset = (self.size - new_width) // 2
+        y_offset = self.size - new_height  # Aligner en bas plutôt que centrer
+        final_surface.blit(scaled_sprite, (x_offset, y_offset))
+        
+        return prepare_surface(final_surface)
         
-    def update(self, platforms):
-        """Update player position and state based on physics and collisions."""
+    def update(self, platforms, dt=PHYSICS_DT, platform_index=None):
+        """
+        Update player position and state based on physics and collisions (world coordinates).
+        
+        Args:
+            platforms (list): Plateformes du jeu
+            dt (float): Durée du pas de simulation
+            platform_index (PlatformIndex): Index des hauteurs ; si fourni, seules les
+                plateformes proches des pieds du joueur sont testées
+        """
         # Mise à jour de l'animation
-        self.update_animation()
+        self.update_animation(dt)
         
         # Sauvegarder la position précédente pour détecter les franchissements
         prev_y = self.y
@@ -209,13 +271,8 @@ class Player:
         
         # Appliquer la friction lorsque le cube est au sol
         if self.on_ground and self.current_platform:
-            # Si on est sur une plateforme mobile, ajuster la vitesse horizontale
-            if self.current_platform.platform_type == "moving":
-                # Conserver une partie de la vitesse horizontale pour un mouvement plus fluide
-                self.vel_x *= 0.95
-            else:
-                # Pour les autres plateformes, utiliser leur friction normale
-                self.vel_x *= self.current_platform.friction
+            # Friction de la plateforme (plus faible sur la glace et les plateformes mobiles)
+            self.vel_x *= self.current_platform.friction
             
             # Arrêter complètement le mouvement si la vitesse est très faible
             if abs(self.vel_x) < 0.1:
@@ -238,6 +295,13 @@ class Player:
         self.on_ground = False
         self.current_platform = None
         
+        if platform_index is not None:
+            # Atterrissage : pieds dans [p.y, p.y + PLATFORM_HEIGHT] ; traversée : p.y entre les
+            # pieds avant et après le pas. Seules les plateformes de cette bande sont candidates.
+            feet = self.y + self.size
+            prev_feet = prev_y + self.size
+            platforms = platform_index.query(min(feet, prev_feet) - PLATFORM_HEIGHT, max(feet, prev_feet))
+        
         for platform in platforms:
             # Méthode standard de détection de collision
             if self.vel_y > 0 or (old_on_ground and platform == prev_platform):  # Chute ou déjà sur la plateforme
@@ -252,9 +316,9 @@ class Player:
                     self.current_platform = platform
                     
                     # Gestion spéciale pour les plateformes mobiles
-                    if platform.platform_type == "moving":
+                    if platform.is_moving:
                         # Calculer le delta de mouvement de la plateforme
-                        platform_delta_y = platform.y - platform.prev_y if hasattr(platform, 'prev_y') else 0
+                        platform_delta_y = platform.y - platform.prev_y
                         
                         # Si la plateforme monte, donner un petit boost au joueur
                         if platform_delta_y < 0:
@@ -295,26 +359,18 @@ class Player:
                     break
         
         # Si le joueur charge un saut et qu'il est sur une plateforme mobile
-        if self.charging and self.on_ground and self.current_platform and self.current_platform.platform_type == "moving":
+        if self.charging and self.on_ground and self.current_platform and self.current_platform.is_moving:
             # Assurer que le joueur reste collé à la plateforme pendant qu'il charge
             self.y = self.current_platform.y - self.size
             # Ajuster la vitesse verticale pour suivre la plateforme
-            platform_delta_y = self.current_platform.y - (self.current_platform.prev_y if hasattr(self.current_platform, 'prev_y') else self.current_platform.y)
+            platform_delta_y = self.current_platform.y - self.current_platform.prev_y
             self.vel_y = platform_delta_y
         
         # Charging jump
         if self.charging and self.on_ground:
             self.charge = min(self.charge + CHARGE_RATE, MAX_CHARGE)
-            
-        # Check if falling off the bottom of the screen -> game over
-        if self.y > SCREEN_HEIGHT:
-            return "GAME_OVER"
-            
-        # Camera follow - simplifier le système de caméra pour plus de stabilité
-        should_scroll = self.y < SCREEN_HEIGHT // 2 - 50
-        return should_scroll
     
-    def update_animation(self):
+    def update_animation(self, dt=PHYSICS_DT):
         """Mise à jour de l'animation en fonction de l'état du joueur."""
         # Déterminer l'animation actuelle en fonction de l'état
         if self.charging:
@@ -328,7 +384,7 @@ class Player:
             
         # Mettre à jour le timer d'animation uniquement pour l'animation idle
         if self.current_animation == 'idle':
-            self.animation_timer += 1/60  # Assume 60 FPS
+            self.animation_timer += dt
             if self.animation_timer >= self.animation_speed:
                 self.animation_timer = 0
                 self.current_frame = (self.current_frame + 1) % len(self.idle_sequence)
@@ -360,7 +416,20 @@ class Player:
             self.jump_target = (target_x, self.y - jump_power * 5)
             self.charge = 0
             
-    def predict_trajectory(self):
+    def get_trajectory_inputs(self, camera_y=0):
+        """Return the quantized inputs of the trajectory preview: (x₀, y₀, charge, Δx), in screen coordinates."""
+        # Get mouse position for direction vector calculation
+        mouse_x, _ = pygame.mouse.get_pos()
+        
+        # Initial position (x₀, y₀)
+        x_0 = int(self.x + self.size // 2)
+        y_0 = int(self.y - camera_y + self.size // 2)
+        
+        # Calculate direction vector Δx = mouse_x - x₀ (constraint to max horizontal distance)
+        delta_x = max(min(mouse_x - x_0, MAX_HORIZONTAL_DISTANCE), -MAX_HORIZONTAL_DISTANCE)
+        return x_0, y_0, self.charge, delta_x
+            
+    def predict_trajectory(self, camera_y=0):
         """
         Calculate and return points along predicted jump trajectory using projectile motion equations.
         
@@ -373,158 +442,173 @@ class Player:
         - (v₀ₓ, v₀ᵧ) are the initial velocity components
         - g is the gravitational acceleration (positive downward)
         - t is time
+        
+        The discrete steps are evaluated in closed form (see trajectory_offsets).
         """
         if not self.charging or not self.on_ground:
             return []
-            
-        # Get mouse position for direction vector calculation
-        mouse_x, mouse_y = pygame.mouse.get_pos()
+        x_0, y_0, charge, delta_x = self.get_trajectory_inputs(camera_y)
+        return self.compute_trajectory_points(x_0, y_0, charge, delta_x)
+    
+    @staticmethod
+    def compute_trajectory_points(x_0, y_0, charge, delta_x):
+        """Return the visible trajectory points for the given inputs, as integer screen positions."""
+        x_offsets, y_offsets = trajectory_offsets(charge, delta_x)
+        x_t = x_0 + x_offsets
+        y_t = y_0 + y_offsets
+        
+        # Stop at the first point that goes too far outside the visible bounds
+        outside = (x_t < 0) | (x_t > SCREEN_WIDTH) | (y_t > SCREEN_HEIGHT + 500)
+        if outside.any():
+            end = int(np.argmax(outside))
+            x_t = x_t[:end]
+            y_t = y_t[:end]
+        
+        # Only keep points within visible area plus some margin for showing complete parabolic arcs
+        visible = y_t <= SCREEN_HEIGHT + 400
+        return list(zip(x_t[visible].astype(int).tolist(), y_t[visible].astype(int).tolist()))
+    
+    def get_trajectory_surface(self, camera_y=0):
+        """
+        Return (surface, position) of the rendered trajectory preview.
         
-        # Initial position (x₀, y₀)
-        x_0 = self.x + self.size // 2
-        y_0 = self.y + self.size // 2
+        The arc is only rendered again when the charge, Δx or start position on screen change.
+        """
+        inputs = self.get_trajectory_inputs(camera_y)
+        if inputs != self.trajectory_key:
+            self.trajectory_key = inputs
+            self.trajectory_render = self.render_trajectory(self.compute_trajectory_points(*inputs))
+        return self.trajectory_render
+    
+    @staticmethod
+    def render_trajectory(points):
+        """Render the trajectory points and curve on a surface just large enough to hold them."""
+        if len(points) < 2:
+            return None
+        
+        # Bounding box of the arc, limited to the screen and padded for the point markers
+        margin = 3
+        left = max(min(x for x, _ in points) - margin, 0)
+        top = max(min(y for _, y in points) - margin, 0)
+        right = min(max(x for x, _ in points) + margin + 1, SCREEN_WIDTH)
+        bottom = min(max(y for _, y in points) + margin + 1, SCREEN_HEIGHT)
+        if right <= left or bottom <= top:
+            return None
+        surface = pygame.Surface((right - left, bottom - top), pygame.SRCALPHA)
+        local_points = [(x - left, y - top) for x, y in points]
+        
+        # Apex of the parabola (where dy/dt = 0): higher than both neighbours
+        ys = np.array([y for _, y in points])
+        apex = np.zeros(len(points), dtype=bool)
+        apex[1:-1] = (ys[:-2] > ys[1:-1]) & (ys[2:] > ys[1:-1])
+        
+        # Draw points along trajectory to visualize the discrete time steps
+        # of the parametric equation (x(t), y(t))
+        last = len(local_points) - 1
+        for i, point in enumerate(local_points):
+            if i == 0 or i == last:  # Initial and final positions
+                pygame.draw.circle(surface, (255, 0, 0), point, 3)  # Red
+            elif apex[i]:
+                pygame.draw.circle(surface, (255, 255, 0), point, 3)  # Yellow
+            else:
+                # Regular points along the trajectory
+                pygame.draw.circle(surface, (255, 100, 100), point, 2)  # Light red
+        
+        # Draw the parametric curve representing the trajectory
+        # This visualizes the continuous function (x(t), y(t)) for t ∈ [0, t_max]
+        pygame.draw.lines(surface, (255, 0, 0), False, local_points, 2)
+        return surface, (left, top)
+            
+    def get_hitbox(self):
+        """Return the player's collision rectangle at its current position (same Rect object every call)."""
+        self.hitbox.update(self.x, self.y, self.size, self.size)
+        return self.hitbox
+            
+    def get_draw_rect(self, camera_y=0):
+        """Return the screen region covered by the player, its charge bar and its trajectory preview."""
+        rect = pygame.Rect(int(self.x), int(self.y - camera_y) - 15, self.size, self.size + 15)
+        if self.charging and self.on_ground and self.trajectory_render:
+            surface, position = self.trajectory_render
+            rect.union_ip(surface.get_rect(topleft=position))
+        return rect
+            
+    def draw(self, screen, debug=False, camera_y=0):
+        """Dessine le joueur sur l'écran, camera_y étant la position dans le monde du haut de l'écran"""
+        # Position verticale à l'écran
+        y = self.y - camera_y
+        
+        # IMPORTANT: Default sprite orientation is facing RIGHT
+        # We need to flip when facing LEFT
+        
+        # Determine if we should flip the sprite based on direction
+        flip_sprite = False
+        
+        # When jumping, base flipping on horizontal velocity
+        if self.jumping and self.vel_x != 0:
+            # INVERTED: Flip if moving RIGHT (positive velocity) to match game logic
+            flip_sprite = self.vel_x > 0
+        # When charging, face toward mouse cursor
+        elif self.charging:
+            mouse_x, _ = pygame.mouse.get_pos()
+            # INVERTED: Flip if cursor is to the RIGHT of player
+            flip_sprite = mouse_x > self.x + self.size // 2
+        # When sliding or idle, determine based on recent movement
+        elif self.current_animation == 'sliding':
+            # INVERTED: When sliding, flip if moving RIGHT
+            flip_sprite = self.vel_x > 0
+        # For idle, we'd ideally remember the last direction
+        # Since we don't track that yet, we'll default to facing right
+        
+        # The mirrored frames are pre-built, so facing is just a lookup
+        sprites = self.mirrored_sprites if flip_sprite else self.sprites
         
-        # Calculate direction vector Δx = mouse_x - x₀ (constraint to max horizontal distance)
-        delta_x = mouse_x - x_0
-        delta_x = max(min(delta_x, MAX_HORIZONTAL_DISTANCE), -MAX_HORIZONTAL_DISTANCE)
-        
-        # Initial velocity components (v₀ₓ, v₀ᵧ)
-        # v₀ₓ = Δx × JUMP_HORIZONTAL_FACTOR
-        v_0x = delta_x * JUMP_HORIZONTAL_FACTOR
-        
-        # v₀ᵧ = -jump_power (negative because y-axis is inverted in screen coordinates)
-        jump_power = self.charge
-        v_0y = -jump_power
-        
-        # Trajectory points array for visualization
-        points = []
-        
-        # Simulate projectile motion over discrete time steps
-        # x(t) = x₀ + v₀ₓ·t
-        # y(t) = y₀ + v₀ᵧ·t + (1/2)·g·t²
-        # Discretized as:
-        # x[i+1] = x[i] + vₓ[i]
-        # y[i+1] = y[i] + vᵧ[i]
-        # vᵧ[i+1] = vᵧ[i] + g
-        x_t = x_0
-        y_t = y_0
-        v_x = v_0x
-        v_y = v_0y
-        
-        # Compute trajectory for multiple time steps
-        # Using t = 0, Δt, 2Δt, ..., 49Δt
-        for t_step in range(50):  # 50 discrete time steps
-            # Update velocity due to gravity: vᵧ[i+1] = vᵧ[i] + g
-            v_y += GRAVITY
-            
-            # Update position: x[i+1] = x[i] + vₓ[i], y[i+1] = y[i] + vᵧ[i]
-            x_t += v_x
-            y_t += v_y
-            
-            # Bounds checking: only add points within visible area plus some margin
-            # for showing complete parabolic arcs
-            if 0 <= x_t <= SCREEN_WIDTH and y_t <= SCREEN_HEIGHT + 400:
-                points.append((int(x_t), int(y_t)))
-            
-            # Break if trajectory goes too far outside visible bounds
-            if x_t < 0 or x_t > SCREEN_WIDTH or y_t > SCREEN_HEIGHT + 500:
-                break
-            
-        return points
-            
-    def draw(self, screen, debug=False):
-        """Dessine le joueur sur l'écran"""
         # Détermine le sprite à utiliser en fonction de l'animation en cours
         sprite = None
         if self.current_animation == 'idle':
-            if self.sprites['idle'] and self.current_frame < len(self.idle_sequence) and self.idle_sequence[self.current_frame] < len(self.sprites['idle']):
+            if sprites['idle'] and self.current_frame < len(self.idle_sequence) and self.idle_sequence[self.current_frame] < len(sprites['idle']):
                 frame_index = self.idle_sequence[self.current_frame]
-                sprite = self.sprites['idle'][frame_index]
-        elif self.current_animation in self.sprites and self.sprites[self.current_animation]:
-            sprite = self.sprites[self.current_animation]
+                sprite = sprites['idle'][frame_index]
+        elif self.current_animation in sprites and sprites[self.current_animation]:
+            sprite = sprites[self.current_animation]
             
         # Dessine le sprite ou un rectangle de couleur si pas de sprite
         if sprite:
-            # IMPORTANT: Default sprite orientation is facing RIGHT
-            # We need to flip when facing LEFT
-            
-            # Determine if we should flip the sprite based on direction
-            flip_sprite = False
-            
-            # When jumping, base flipping on horizontal velocity
-            if self.jumping and self.vel_x != 0:
-                # INVERTED: Flip if moving RIGHT (positive velocity) to match game logic
-                flip_sprite = self.vel_x > 0
-            # When charging, face toward mouse cursor
-            elif self.charging:
-                mouse_x, _ = pygame.mouse.get_pos()
-                # INVERTED: Flip if cursor is to the RIGHT of player
-                flip_sprite = mouse_x > self.x + self.size // 2
-            # When sliding or idle, determine based on recent movement
-            elif self.current_animation == 'sliding':
-                # INVERTED: When sliding, flip if moving RIGHT
-                flip_sprite = self.vel_x > 0
-            # For idle, we'd ideally remember the last direction
-            # Since we don't track that yet, we'll default to facing right
-            
-            # Create a copy of the sprite so we can flip it if needed
-            display_sprite = sprite
-            if flip_sprite:
-                display_sprite = pygame.transform.flip(sprite, True, False)
-                
             # Position the sprite centered on player's position
-            sprite_rect = display_sprite.get_rect(center=(self.x + self.size // 2, self.y + self.size // 2))
-            screen.blit(display_sprite, sprite_rect)
+            sprite_rect = sprite.get_rect(center=(self.x + self.size // 2, y + self.size // 2))
+            screen.blit(sprite, sprite_rect)
         else:
             # Fallback to rectangle if sprite is missing
-            pygame.draw.rect(screen, self.color, (self.x, self.y, self.size, self.size))
+            pygame.draw.rect(screen, self.color, (self.x, y, self.size, self.size))
     
         # Draw charge bar when charging
         if self.charging and self.on_ground:
             # Draw charge bar background
-            pygame.draw.rect(screen, WHITE, (self.x, self.y - 15, self.size, 10))
+            pygame.draw.rect(screen, WHITE, (self.x, y - 15, self.size, 10))
             # Draw charge level
             charge_width = int(self.size * (self.charge / MAX_CHARGE))
-            pygame.draw.rect(screen, YELLOW, (self.x, self.y - 15, charge_width, 10))
+            pygame.draw.rect(screen, YELLOW, (self.x, y - 15, charge_width, 10))
             
-            # Draw predicted trajectory
-            points = self.predict_trajectory()
-            if len(points) > 1:
-                # Draw points along trajectory to visualize the discrete time steps
-                # of the parametric equation (x(t), y(t))
-                for i, point in enumerate(points):
-                    # Draw larger points at key positions (start, apex, end)
-                    if i == 0:  # Initial position (t = 0)
-                        pygame.draw.circle(screen, (255, 0, 0), point, 3)  # Red
-                    elif i == len(points) - 1:  # Final position
-                        pygame.draw.circle(screen, (255, 0, 0), point, 3)  # Red
-                    elif i > 0 and points[i-1][1] > point[1] and i < len(points)-1 and points[i+1][1] > point[1]:
-                        # Apex of the parabola (where dy/dt = 0)
-                        pygame.draw.circle(screen, (255, 255, 0), point, 3)  # Yellow
-                    else:
-                        # Regular points along the trajectory
-                        pygame.draw.circle(screen, (255, 100, 100), point, 2)  # Light red
-                
-                # Draw the parametric curve representing the trajectory
-                # This visualizes the continuous function (x(t), y(t)) for t ∈ [0, t_max]
-                pygame.draw.lines(screen, (255, 0, 0), False, points, 2)
+            # Draw predicted trajectory (cached surface, rebuilt only when its inputs change)
+            trajectory = self.get_trajectory_surface(camera_y)
+            if trajectory:
+                screen.blit(*trajectory)
         
         # Affichage du debug
         if debug:
             # Contour du joueur
-            pygame.draw.rect(screen, RED, (self.x, self.y, self.size, self.size), 1)
+            pygame.draw.rect(screen, RED, (self.x, y, self.size, self.size), 1)
             
             # Affichage de la charge
             if self.charging:
                 charge_height = 5
                 charge_width = (self.charge / MAX_CHARGE) * 50
-                pygame.draw.rect(screen, RED, (self.x, self.y - 10, charge_width, charge_height))
+                pygame.draw.rect(screen, RED, (self.x, y - 10, charge_width, charge_height))
                 
             # Affichage du vecteur de saut
             if self.jump_target:
                 points = [
-                    (self.x + self.size // 2, self.y + self.size // 2),
-                    self.jump_target
+                    (self.x + self.size // 2, y + self.size // 2),
+                    (self.jump_target[0], self.jump_target[1] - camera_y)
                 ]
                 if len(points) >= 2:
                     pygame.draw.lines(screen, RED, False, points, 1)
@@ -0,0 +1,68 @@
+class ObjectPool:
+    """Listes libres d'objets de jeu réutilisables, une par classe exacte.
+
+    Un objet rendu au pool est réinitialisé sur place par sa méthode reset()
+    quand il est redemandé, au lieu d'être reconstruit : après quelques
+    secondes de jeu, faire apparaître une plateforme ou une pièce n'alloue
+    plus rien.
+    """
+
+    def __init__(self):
+        self.free = {}
+        self.hits = 0
+        self.misses = 0
+        self.released = 0
+
+    def acquire(self, cls, *args):
+        """
+        Renvoyer un objet de la classe cls initialisé avec args, recyclé si possible.
+
+        Args:
+            cls (type): Classe exacte de l'objet (Platform, MovingPlatform, Coin...)
+            *args: Arguments de cls() et de cls.reset()
+        """
+        free = self.free.get(cls)
+        if free:
+            self.hits += 1
+            obj = free.pop()
+            obj.reset(*args)
+            return obj
+
+        self.misses += 1
+        return cls(*args)
+
+    def release(self, obj):
+        """Rendre un objet qui n'est plus utilisé ; il ne doit plus être référencé ailleurs."""
+        self.released += 1
+        free = self.free.get(type(obj))
+        if free is None:
+            free = self.free[type(obj)] = []
+        free.append(obj)
+
+    def release_all(self, objects):
+        """Rendre tous les objets d'une liste, puis la vider."""
+        for obj in objects:
+            self.release(obj)
+        objects.clear()
+
+    def recycle(self, objects, keep):
+        """Rendre au pool les objets pour lesquels keep(obj) est faux, en compactant la liste sur place."""
+        kept = 0
+        for obj in objects:
+            if keep(obj):
+                objects[kept] = obj
+                kept += 1
+            else:
+                self.release(obj)
+        del objects[kept:]
+
+    def get_stats(self):
+        """Renvoyer le taux de recyclage et le nombre d'objets libres par classe."""
+        acquired = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / acquired if acquired else 0.0,
+            "released": self.released,
+            "free": {cls.__name__: len(objects) for cls, objects in self.free.items()}
+        }
@@ -0,0 +1,140 @@
+import time
+from collections import deque
+import pygame
+from config import FPS, PROFILER_HISTORY, WHITE, YELLOW, RED
+
+
+def percentile(sorted_values, fraction):
+    """Renvoyer le percentile d'une liste déjà triée (plus proche rang)."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+class FrameProfiler:
+    """Mesure le temps passé dans chaque étape de la boucle principale.
+
+    Chaque étape se termine par lap(nom) : le temps écoulé depuis l'appel
+    précédent lui est attribué. Les durées de chaque frame sont conservées
+    dans des buffers circulaires de PROFILER_HISTORY frames.
+    """
+
+    def __init__(self, history=PROFILER_HISTORY, budget=1 / FPS if FPS else None):
+        self.history = history
+        self.budget = budget
+        self.frame_times = deque(maxlen=history)
+        self.stage_times = {}
+        self.current = {}
+        self.frame_start = time.perf_counter()
+        self.last_mark = self.frame_start
+
+        # Dernière frame ayant dépassé le budget : (étape la plus lente, sa durée, durée de la frame)
+        self.last_spike = None
+        self.spike_count = 0
+
+    def begin_frame(self):
+        """Démarrer la mesure d'une nouvelle frame."""
+        self.current = {}
+        self.frame_start = self.last_mark = time.perf_counter()
+
+    def lap(self, stage):
+        """Attribuer à stage le temps écoulé depuis le dernier appel (cumulé sur la frame)."""
+        now = time.perf_counter()
+        self.current[stage] = self.current.get(stage, 0.0) + now - self.last_mark
+        self.last_mark = now
+
+    def end_frame(self):
+        """Enregistrer la frame terminée dans les buffers circulaires."""
+        total = time.perf_counter() - self.frame_start
+        self.frame_times.append(total)
+        for stage, duration in self.current.items():
+            times = self.stage_times.get(stage)
+            if times is None:
+                times = self.stage_times[stage] = deque(maxlen=self.history)
+            times.append(duration)
+
+        if self.budget and total > self.budget and self.current:
+            stage = max(self.current, key=self.current.get)
+            self.last_spike = (stage, self.current[stage], total)
+            self.spike_count += 1
+
+    def get_stats(self):
+        """Renvoyer les percentiles de durée de frame et de chaque étape, en secondes."""
+        frames = sorted(self.frame_times)
+        stages = {}
+        for stage, times in self.stage_times.items():
+            values = sorted(times)
+            stages[stage] = {"p50": percentile(values, 0.50), "p95": percentile(values, 0.95)}
+        return {
+            "frames": len(frames),
+            "p50": percentile(frames, 0.50),
+            "p95": percentile(frames, 0.95),
+            "p99": percentile(frames, 0.99),
+            "stages": stages,
+            "last_spike": self.last_spike,
+            "spike_count": self.spike_count
+        }
+
+
+class ProfilerOverlay:
+    """Panneau de performances affiché par-dessus le jeu (touche F3).
+
+    Le texte n'est reconstruit que quelques fois par seconde pour que
+    l'overlay ne fausse pas lui-même les mesures.
+    """
+
+    def __init__(self, profiler, refresh_frames=15, max_stages=6):
+        self.profiler = profiler
+        self.refresh_frames = refresh_frames
+        self.max_stages = max_stages
+        self.font = pygame.font.Font(None, 20)
+        self.surface = None
+        self.frames_until_refresh = 0
+        self.rect = pygame.Rect(0, 0, 0, 0)
+
+    def draw(self, screen, fps, counts):
+        """
+        Dessiner l'overlay en haut à droite de l'écran.
+
+        Args:
+            fps (float): Images par seconde affichées
+            counts (dict): Nombre d'entités par catégorie (plateformes, pièces...)
+        """
+        if self.surface is None or self.frames_until_refresh <= 0:
+            self.surface = self.build_surface(fps, counts)
+            self.frames_until_refresh = self.refresh_frames
+        self.frames_until_refresh -= 1
+
+        self.rect = self.surface.get_rect(topright=(screen.get_width() - 5, 5))
+        screen.blit(self.surface, self.rect)
+
+    def build_surface(self, fps, counts):
+        """Construire le panneau à partir des statistiques courantes."""
+        stats = self.profiler.get_stats()
+        lines = [
+            (f"FPS {fps:.1f}", WHITE),
+            (f"frame p50 {stats['p50'] * 1000:.2f}  p95 {stats['p95'] * 1000:.2f}  p99 {stats['p99'] * 1000:.2f} ms", WHITE)
+        ]
+        if counts:
+            lines.append(("  ".join(f"{name} {count}" for name, count in counts.items()), WHITE))
+
+        slowest = sorted(stats["stages"].items(), key=lambda item: item[1]["p95"], reverse=True)
+        for stage, values in slowest[:self.max_stages]:
+            lines.append((f"{stage}: p50 {values['p50'] * 1000:.2f}  p95 {values['p95'] * 1000:.2f} ms", YELLOW))
+
+        if stats["last_spike"]:
+            stage, duration, total = stats["last_spike"]
+            lines.append((f"over budget x{stats['spike_count']}: {stage} {duration * 1000:.1f} / {total * 1000:.1f} ms", RED))
+
+        rendered = [self.font.render(text, True, color) for text, color in lines]
+        width = max(text.get_width() for text in rendered) + 10
+        height = sum(text.get_height() for text in rendered) + 10
+
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 170))
+        y = 5
+        for text in rendered:
+            surface.blit(text, (5, y))
+            y += text.get_height()
+        return surface
@@ -0,0 +1,126 @@
+"""Enregistrement et relecture des entrées d'une partie.
+
+Une partie est entièrement déterminée par son mode, sa graine et les appuis et
+relâchements du bouton gauche (avec la position x du curseur), indexés par pas
+de simulation. Rejouer un enregistrement reproduit donc la partie à l'identique:
+
+    python replay.py replays/normal-1234-20250101-120000.json
+"""
+import json
+import os
+import time
+import pygame
+
+REPLAY_VERSION = 1
+
+
+def mouse_down(x=0):
+    """Événement d'appui sur le bouton gauche (début de la charge)."""
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(int(x), 0))
+
+
+def mouse_up(x):
+    """Événement de relâchement du bouton gauche (saut vers x)."""
+    return pygame.event.Event(pygame.MOUSEBUTTONUP, button=1, pos=(int(x), 0))
+
+
+class InputRecorder:
+    """Note les événements qui pilotent la simulation : [pas, "d" ou "u", x]."""
+
+    def __init__(self, mode, seed):
+        self.mode = mode
+        self.seed = seed
+        self.events = []
+
+    def record(self, frame, event):
+        """Mémoriser un événement s'il agit sur start_charge ou release_jump."""
+        if event.type not in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP) or event.button != 1:
+            return
+        action = "d" if event.type == pygame.MOUSEBUTTONDOWN else "u"
+        self.events.append([frame, action, event.pos[0]])
+
+    def to_dict(self, frames, digest):
+        """
+        Renvoyer l'enregistrement sous forme sérialisable.
+
+        Args:
+            frames (int): Nombre de pas simulés pendant la partie
+            digest (str): Empreinte de l'état final, pour vérifier une relecture
+        """
+        return {
+            "version": REPLAY_VERSION,
+            "mode": self.mode,
+            "seed": self.seed,
+            "frames": frames,
+            "digest": digest,
+            "events": self.events
+        }
+
+    def save(self, directory, frames, digest):
+        """Écrire l'enregistrement dans directory et renvoyer le chemin du fichier."""
+        os.makedirs(directory, exist_ok=True)
+        name = f"{self.mode}-{self.seed}-{time.strftime('%Y%m%d-%H%M%S')}.json"
+        path = os.path.join(directory, name)
+        with open(path, "w") as file:
+            # Une ligne par enregistrement : les fichiers restent petits
+            json.dump(self.to_dict(frames, digest), file, separators=(",", ":"))
+        print(f"Log: inputs recorded to {path}")
+        return path
+
+
+class InputReplay:
+    """Source d'entrées (même interface que headless.ScriptedInput) rejouant un enregistrement."""
+
+    def __init__(self, data):
+        if data.get("version") != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version: {data.get('version')}")
+        self.mode = data["mode"]
+        self.seed = data["seed"]
+        self.frames = data["frames"]
+        self.digest = data.get("digest")
+        self.events = {}
+        for frame, action, x in data["events"]:
+            event = mouse_down(x) if action == "d" else mouse_up(x)
+            self.events.setdefault(frame, []).append(event)
+
+    @classmethod
+    def load(cls, path):
+        """Charger un enregistrement depuis un fichier JSON."""
+        with open(path) as file:
+            return cls(json.load(file))
+
+    def get_events(self, game, frame):
+        """Renvoyer les événements enregistrés avant ce pas de simulation."""
+        return self.events.get(frame, ())
+
+
+def main():
+    import argparse
+
+    # Relecture sans fenêtre, sauf demande contraire
+    os.environ.setdefault("CLOUD_JUMP_HEADLESS", "1")
+    from headless import GAME_MODES, DEFAULT_SKIN
+
+    parser = argparse.ArgumentParser(description="Rejouer un enregistrement et vérifier l'état final.")
+    parser.add_argument("recording")
+    parser.add_argument("--skin", default=DEFAULT_SKIN)
+    args = parser.parse_args()
+
+    replay = InputReplay.load(args.recording)
+    game = GAME_MODES[replay.mode](player_skin_path=args.skin, seed=replay.seed)
+    result = game.run_headless(replay.frames, replay)
+    digest = game.state_digest()
+
+    print(f"Replayed {result['frames']} frames of {replay.mode} (seed {replay.seed}): score {result['score']}, "
+          f"game over {result['game_over']}")
+    if replay.digest is None:
+        print(f"Final state digest: {digest}")
+    elif digest == replay.digest:
+        print("Final state matches the recording")
+    else:
+        print(f"Final state differs from the recording: {digest} != {replay.digest}")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,65 @@
+import os
 import pygame
 from PIL import Image
+from pixel_font import pixel_text_renderer
+
+# Couleurs candidates pour la transparence par colorkey (la première absente de l'image est utilisée)
+COLORKEY_CANDIDATES = [(255, 0, 255), (0, 255, 255), (1, 254, 1), (254, 1, 254)]
+
+
+def prepare_surface(surface, name=None):
+    """
+    Convert a surface to the display pixel format, choosing the cheapest blit path for its content.
+
+    - no transparency at all: opaque convert()
+    - only fully transparent or fully opaque pixels: convert() + RLE-accelerated colorkey
+    - partial transparency: convert_alpha()
+
+    Args:
+        surface (pygame.Surface): Surface to convert (requires the display mode to be set)
+        name (str): Asset name; when given, the chosen path is logged
+    """
+    if surface.get_colorkey() is not None:
+        converted = surface.convert()
+        converted.set_colorkey(surface.get_colorkey(), pygame.RLEACCEL)
+        path = "colorkey (RLE)"
+    elif not surface.get_flags() & pygame.SRCALPHA:
+        converted = surface.convert()
+        path = "opaque"
+    else:
+        alpha = pygame.surfarray.array_alpha(surface)
+        transparent = alpha == 0
+        if not transparent.any() and (alpha == 255).all():
+            converted = surface.convert()
+            path = "opaque"
+        elif ((alpha == 255) | transparent).all():
+            converted = None
+            # Choisir une couleur clé qui n'apparaît dans aucun pixel visible
+            rgb = pygame.surfarray.array3d(surface)[~transparent]
+            for key in COLORKEY_CANDIDATES:
+                if not (rgb == key).all(axis=1).any():
+                    converted = pygame.Surface(surface.get_size()).convert()
+                    converted.fill(key)
+                    converted.blit(surface, (0, 0))
+                    converted.set_colorkey(key, pygame.RLEACCEL)
+                    path = "colorkey (RLE)"
+                    break
+            if converted is None:
+                converted = surface.convert_alpha()
+                path = "per-pixel alpha"
+        else:
+            converted = surface.convert_alpha()
+            path = "per-pixel alpha"
+    
+    if name:
+        print(f"Log: {name} -> {path}")
+    return converted
+
+
+def load_image(path):
+    """Load an image file and convert it to the display format through prepare_surface."""
+    return prepare_surface(pygame.image.load(path), os.path.basename(path))
+
 
 def scale_image(image_path, target_size, is_pixel_art=True):
     """Scale the image using appropriate algorithm for pixel art or regular images."""
@@ -12,27 +72,10 @@ def scale_image(image_path, target_size, is_pixel_art=True):
             # Use Lanczos for smooth scaling of non-pixel art
             img = img.resize(target_size, Image.Resampling.LANCZOS)
         img_data = img.tobytes()
-        return pygame.image.fromstring(img_data, img.size, 'RGBA')
+        surface = pygame.image.fromstring(img_data, img.size, 'RGBA')
+        return prepare_surface(surface, os.path.basename(image_path))
 
 
 def create_pixel_text(text, font, color, scale_factor=3):
-    """Create pixelated text by rendering at small size and scaling up with nearest neighbor."""
-    # First render the text at a smaller size
-    base_surface = font.render(text, True, color)
-    
-    # Get the size of the base surface
-    width, height = base_surface.get_size()
-    
-    # Scale it down to create pixelation effect when scaled back up
-    small_size = (width // scale_factor, height // scale_factor)
-    # Convert to PIL Image for better scaling control
-    pil_surface = Image.frombytes('RGBA', (width, height), pygame.image.tostring(base_surface, 'RGBA'))
-    pil_surface = pil_surface.resize(small_size, Image.Resampling.NEAREST)
-    
-    # Scale back up with nearest neighbor sampling for pixelated look
-    final_size = (small_size[0] * scale_factor, small_size[1] * scale_factor)
-    pil_surface = pil_surface.resize(final_size, Image.Resampling.NEAREST)
-    
-    # Convert back to Pygame surface
-    final_surface = pygame.image.fromstring(pil_surface.tobytes(), final_size, 'RGBA')
-    return final_surface 
\ No newline at end of file
+    """Create pixelated text from a pre-baked glyph atlas (memoized, the surface is shared)."""
+    return pixel_text_renderer.render(text, font, color, scale_factor)
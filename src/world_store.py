@@ -0,0 +1,224 @@
+"""Stockage des plateformes et des pièces en tableaux NumPy (structure de tableaux).
+
+Activé par WORLD_STORE dans config.py. Chaque attribut simulé (x, y, largeur,
+type, phase et amplitude des plateformes mobiles, minuteurs de destruction,
+animation des pièces) est une colonne NumPy ; le mouvement sinusoïdal, les
+comptes à rebours, l'animation des pièces et le tri des objets sortis de
+l'écran sont chacun une seule opération sur ces colonnes au lieu d'une boucle
+Python.
+
+Les objets Platform, MovingPlatform, Coin... restent utilisés par le reste du
+jeu, mais sous forme de vues : view_class() dérive de chaque classe une
+sous-classe dont les attributs simulés lisent et écrivent leur case du tableau.
+"""
+import numpy as np
+from game_platform import Platform, MovingPlatform, BreakablePlatform, IcePlatform
+
+# Identifiant de type stocké pour chaque plateforme
+PLATFORM_TYPE_IDS = {Platform: 0, MovingPlatform: 1, BreakablePlatform: 2, IcePlatform: 3}
+MOVING_TYPE_ID = PLATFORM_TYPE_IDS[MovingPlatform]
+
+
+class ArrayTable:
+    """Colonnes NumPy de même longueur, dont chaque case appartient à un objet ou est libre."""
+
+    def __init__(self, columns, capacity=64):
+        """
+        Args:
+            columns (dict): Nom de colonne -> type NumPy
+            capacity (int): Nombre de cases initial (doublé quand elles sont toutes prises)
+        """
+        self.capacity = capacity
+        self.arrays = {}
+        for name, dtype in columns.items():
+            self.set_column(name, np.zeros(capacity, dtype))
+        self.alive = np.zeros(capacity, bool)
+        self.owners = [None] * capacity
+        self.free = list(range(capacity - 1, -1, -1))
+
+    def __len__(self):
+        return self.capacity - len(self.free)
+
+    def set_column(self, name, array):
+        # Chaque colonne est aussi un attribut : table.y, table.phase...
+        self.arrays[name] = array
+        setattr(self, name, array)
+
+    def allocate(self, owner):
+        """Réserver une case pour owner et renvoyer son indice."""
+        if not self.free:
+            self.grow()
+        slot = self.free.pop()
+        self.alive[slot] = True
+        self.owners[slot] = owner
+        for array in self.arrays.values():
+            array[slot] = 0
+        return slot
+
+    def release(self, slot):
+        """Libérer une case."""
+        self.alive[slot] = False
+        self.owners[slot] = None
+        self.free.append(slot)
+
+    def grow(self):
+        """Doubler le nombre de cases."""
+        old = self.capacity
+        self.capacity *= 2
+        for name, array in list(self.arrays.items()):
+            self.set_column(name, np.concatenate((array, np.zeros(old, array.dtype))))
+        self.alive = np.concatenate((self.alive, np.zeros(old, bool)))
+        self.owners.extend([None] * old)
+        self.free.extend(range(self.capacity - 1, old - 1, -1))
+
+    def owners_of(self, mask):
+        """Renvoyer les objets des cases sélectionnées par mask."""
+        return [self.owners[slot] for slot in np.flatnonzero(mask)]
+
+
+def column_property(name, cast=float):
+    """Attribut d'une vue lu et écrit dans la colonne name de sa table."""
+    def get(self):
+        return cast(self.table.arrays[name][self.slot])
+
+    def set(self, value):
+        self.table.arrays[name][self.slot] = value
+
+    return property(get, set)
+
+
+class EntityView:
+    """Base des vues : réserve une case à chaque (ré)initialisation par le pool, la libère avec detach()."""
+
+    table = None  # ArrayTable de la vue, fixée par WorldStore.view_class
+    slot = None
+
+    def reset(self, *args):
+        if self.slot is None:
+            self.slot = self.table.allocate(self)
+        super().reset(*args)
+
+    def detach(self):
+        """Libérer la case de l'objet quand il quitte le jeu (il pourra être recyclé par le pool)."""
+        if self.slot is not None:
+            self.table.release(self.slot)
+            self.slot = None
+
+
+class PlatformView(EntityView):
+    """Attributs simulés d'une plateforme, stockés dans WorldStore.platforms."""
+
+    type_id = 0
+
+    x = column_property("x")
+    y = column_property("y")
+    width = column_property("width", int)
+    original_y = column_property("original_y")
+    amplitude = column_property("amplitude")
+    speed = column_property("speed")
+    time = column_property("phase")
+    prev_y = column_property("prev_y")
+    breaking = column_property("breaking", bool)
+    break_timer = column_property("break_timer")
+
+    def reset(self, *args):
+        super().reset(*args)
+        self.table.type_id[self.slot] = self.type_id
+        self.table.break_time[self.slot] = getattr(self, "break_time", 0.0)
+
+
+class CoinView(EntityView):
+    """Attributs simulés d'une pièce, stockés dans WorldStore.coins."""
+
+    x = column_property("x")
+    y = column_property("y")
+    current_frame = column_property("frame", int)
+    animation_timer = column_property("timer")
+    collected = column_property("collected", bool)
+
+    def reset(self, *args):
+        super().reset(*args)
+        # Taille fixée par Coin.__init__, avant la première réinitialisation
+        self.table.width[self.slot] = self.width
+        self.table.height[self.slot] = self.height
+
+
+class WorldStore:
+    """Tables des plateformes et des pièces d'une partie, et leurs mises à jour vectorisées."""
+
+    def __init__(self):
+        self.platforms = ArrayTable({
+            "x": np.float64, "y": np.float64, "width": np.int32, "type_id": np.int8,
+            "original_y": np.float64, "amplitude": np.float64, "speed": np.float64,
+            "phase": np.float64, "prev_y": np.float64,
+            "breaking": bool, "break_timer": np.float64, "break_time": np.float64
+        })
+        self.coins = ArrayTable({
+            "x": np.float64, "y": np.float64, "width": np.int32, "height": np.int32,
+            "frame": np.int32, "timer": np.float64, "collected": bool
+        })
+        self.views = {}
+
+    def view_class(self, cls):
+        """Renvoyer la sous-classe de cls dont les instances sont des vues sur ce stockage (créée une fois)."""
+        view = self.views.get(cls)
+        if view is None:
+            if cls in PLATFORM_TYPE_IDS:
+                attributes = {"table": self.platforms, "type_id": PLATFORM_TYPE_IDS[cls]}
+                view = type(cls.__name__, (PlatformView, cls), attributes)
+            else:
+                view = type(cls.__name__, (CoinView, cls), {"table": self.coins})
+            self.views[cls] = view
+        return view
+
+    def update_platforms(self, dt):
+        """
+        Avancer toutes les plateformes d'un pas.
+
+        Returns:
+            list: Plateformes en cours de destruction, dont l'apparence doit suivre le minuteur
+        """
+        t = self.platforms
+        moving = t.alive & (t.type_id == MOVING_TYPE_ID)
+
+        # Plateformes mobiles : sinusoïde autour de original_y
+        np.copyto(t.prev_y, t.y, where=moving)
+        t.phase += np.where(moving, t.speed, 0)
+        np.copyto(t.y, t.original_y + np.sin(t.phase) * t.amplitude, where=moving)
+
+        # Comptes à rebours des plateformes cassables touchées
+        breaking = t.alive & t.breaking
+        t.break_timer += np.where(breaking, dt, 0)
+        return t.owners_of(breaking)
+
+    def platforms_to_remove(self, limit):
+        """Masque des plateformes sorties par le bas de l'écran (y >= limit) ou cassées."""
+        t = self.platforms
+        broken = t.breaking & (t.break_timer >= t.break_time)
+        return t.alive & ((t.y >= limit) | broken)
+
+    def update_coins(self, dt, animation_speed, frame_count):
+        """Avancer l'animation des pièces non collectées."""
+        t = self.coins
+        active = t.alive & ~t.collected
+        t.timer += np.where(active, dt, 0)
+        next_frame = active & (t.timer >= animation_speed)
+        t.timer[next_frame] = 0
+        t.frame[next_frame] = (t.frame[next_frame] + 1) % frame_count
+
+    def collect_coins(self, rect):
+        """Marquer comme collectées les pièces qui touchent rect, et renvoyer leur nombre."""
+        t = self.coins
+        # Même test que pygame.Rect.colliderect sur le rectangle entier de chaque pièce
+        x = np.trunc(t.x)
+        y = np.trunc(t.y)
+        hits = (t.alive & ~t.collected
+                & (x < rect.right) & (x + t.width > rect.left)
+                & (y < rect.bottom) & (y + t.height > rect.top))
+        t.collected |= hits
+        return int(np.count_nonzero(hits))
+
+    def coins_to_remove(self, limit):
+        """Masque des pièces collectées ou sorties par le bas de l'écran."""
+        t = self.coins
+        return t.alive & (t.collected | (t.y >= limit))
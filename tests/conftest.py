@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Les tests tournent sans fenêtre ni son, avec les modules de src importables
+os.environ.setdefault("CLOUD_JUMP_HEADLESS", "1")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
@@ -0,0 +1,49 @@
+import pytest
+
+import level_generator
+from config import PLATFORM_HEIGHT, PLAYER_SIZE, PLATFORM_SPACING, PLATFORM_WIDTH
+from game_logic import Game
+from game_platform import Platform, MovingPlatform, BreakablePlatform
+from ice_game import IceGame
+from jump_envelope import can_reach
+from lava_game import LavaGame
+from level_generator import ChunkBuilder
+
+START = (Platform, 200, 650, PLATFORM_WIDTH)
+
+
+def make_builder(mode, seed):
+    return ChunkBuilder(mode.platform_weights, seed, START[2] - 100, coin_chance=mode.coin_chance,
+                        opening_weights=mode.opening_weights, opening_count=12, start=START)
+
+
+@pytest.mark.parametrize("mode", [Game, LavaGame, IceGame])
+@pytest.mark.parametrize("seed", [0, 7, 2024])
+# Avec 220, une bonne partie des positions tirées sont hors de portée et doivent être replacées
+@pytest.mark.parametrize("spacing", [PLATFORM_SPACING, 220])
+def test_every_platform_is_reachable_from_the_previous_one(mode, seed, spacing, monkeypatch):
+    monkeypatch.setattr(level_generator, "PLATFORM_SPACING", spacing)
+    builder = make_builder(mode, seed)
+    previous = START + (0,)
+    for _ in range(1000):
+        platforms, _, _ = builder.build_chunk()
+        for cls, args in platforms:
+            x, y, width = args[:3]
+            amplitude = args[4][0] if len(args) > 3 else 0
+            current = (cls, x, y, width, amplitude)
+            assert can_reach(previous, current)
+            assert y <= previous[2] - PLATFORM_HEIGHT - PLAYER_SIZE
+            previous = current
+
+
+def test_placement_is_bounded_and_falls_back_to_a_reachable_spot(monkeypatch):
+    builder = make_builder(Game, 5)
+    builder.previous = (MovingPlatform, 200, 650, PLATFORM_WIDTH, 60)
+    calls = []
+    monkeypatch.setattr(level_generator, "can_reach", lambda source, target: calls.append(target) and False)
+
+    x, y = builder.place(BreakablePlatform, 10, 450, 0)
+
+    assert len(calls) <= level_generator.PLACEMENT_ATTEMPTS
+    assert x == 200
+    assert can_reach(builder.previous, (BreakablePlatform, x, y, PLATFORM_WIDTH, 0))
@@ -0,0 +1,20 @@
+import pygame
+import pytest
+
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, MIN_PLATFORM_WIDTH, MAX_PLATFORM_WIDTH
+from game_platform import PLATFORM_CLASSES
+
+
+@pytest.fixture(scope="module", autouse=True)
+def display():
+    # Les sprites sont convertis au format de l'écran
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+@pytest.mark.parametrize("platform_class", PLATFORM_CLASSES)
+@pytest.mark.parametrize("width", [MIN_PLATFORM_WIDTH, 87, MAX_PLATFORM_WIDTH])
+def test_any_width_is_built_once_and_shared(platform_class, width):
+    sprite = platform_class.get_scaled_sprite(width)
+    assert sprite.get_width() == width
+    assert platform_class.get_scaled_sprite(width) is sprite
+    assert platform_class(40, 300, width).sprite is sprite
@@ -0,0 +1,88 @@
+import itertools
+import pygame
+import pytest
+
+import game_base
+from game_logic import Game
+from headless import JumpBot
+from replay import InputRecorder, InputReplay, mouse_down, mouse_up
+
+
+def record_game(seed, monkeypatch):
+    """Jouer une partie pilotée par JumpBot avec GameBase.run, trois pas par frame, et renvoyer son enregistrement."""
+    clock = itertools.count()
+    monkeypatch.setattr(game_base.time, "perf_counter", lambda: next(clock) * 0.05)
+
+    game = Game(None, seed=seed)
+    game.recorder = InputRecorder("normal", seed)
+    saved = {}
+    game.recorder.save = lambda directory, frames, digest: saved.update(game.recorder.to_dict(frames, digest))
+
+    bot = JumpBot()
+    handle_events = game.handle_events
+    def scripted_events():
+        if game.sim_frame > 3000:
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+        elif not game.game_over:
+            for event in bot.get_events(game, game.sim_frame):
+                pygame.event.post(event)
+        return handle_events()
+    game.handle_events = scripted_events
+
+    update = game.update
+    def update_then_quit(dt):
+        was_over = game.game_over
+        update(dt)
+        if game.game_over and not was_over:
+            # Clics après la mort puis fermeture : ils ne doivent pas entrer dans l'enregistrement
+            for event in (mouse_down(100), mouse_up(400), pygame.event.Event(pygame.QUIT)):
+                pygame.event.post(event)
+    game.update = update_then_quit
+
+    pygame.event.clear()
+    assert game.run() == "QUIT"
+    assert game.game_over
+    return saved
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3, 4])
+def test_replay_of_a_lost_game_matches_the_recording(seed, monkeypatch):
+    recording = record_game(seed, monkeypatch)
+    assert all(frame < recording["frames"] for frame, _, _ in recording["events"])
+
+    replay = InputReplay(recording)
+    game = Game(None, seed=seed)
+    result = game.run_headless(replay.frames, replay)
+
+    assert result["game_over"]
+    assert result["frames"] == recording["frames"]
+    assert game.state_digest() == recording["digest"]
+
+
+class QuitAt:
+    """Source d'entrées qui demande à quitter avant le pas frame."""
+
+    def __init__(self, frame):
+        self.frame = frame
+
+    def get_events(self, game, frame):
+        return (pygame.event.Event(pygame.QUIT),) if frame == self.frame else ()
+
+
+def test_headless_run_stops_before_simulating_after_quit():
+    game = Game(None, seed=1)
+    result = game.run_headless(100, QuitAt(10))
+    assert result["result"] == "QUIT"
+    assert result["frames"] == game.sim_frame == 10
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_digest_does_not_depend_on_the_world_store(seed, monkeypatch):
+    digests = []
+    for world_store in (False, True):
+        monkeypatch.setattr(game_base, "WORLD_STORE", world_store)
+        game = Game(None, seed=seed)
+        assert (game.world is not None) == world_store
+        game.run_headless(600, JumpBot())
+        digests.append(game.state_digest())
+    assert digests[0] == digests[1]